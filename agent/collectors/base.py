@@ -5,9 +5,141 @@ Ce module définit l'interface commune que tous les collecteurs
 doivent implémenter, ainsi que des utilitaires partagés.
 """
 
+import re
+import json
 import time
+import platform
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Union, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Union, Optional, Iterator
+
+try:
+    import orjson
+except ImportError:
+    # orjson est optionnel: repli sur le module json standard
+    orjson = None
+
+# Motifs précompilés utilisés par les utilitaires de nettoyage
+WHITESPACE_RE = re.compile(r'\s+')
+VERSION_RE = re.compile(r'[\d\.\-\w]+')
+NUMERIC_VERSION_CHARS = frozenset('0123456789.-')
+
+# Identification de la plateforme, lue une fois pour tout le processus
+# (platform.system(), release(), machine()... interrogent uname à chaque
+# appel, processor() lance un sous-processus sous Linux)
+PLATFORM_UNAME = platform.uname()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse un document JSON, avec orjson si disponible
+
+    orjson parse directement les bytes et est nettement plus rapide que
+    le module json standard sur les sorties volumineuses. Les erreurs de
+    parsing héritent de json.JSONDecodeError dans les deux cas.
+
+    Args:
+        data: Document JSON (str ou bytes)
+
+    Returns:
+        Objet Python correspondant
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """
+    Sérialise un objet en document JSON UTF-8, avec orjson si disponible
+
+    orjson produit directement les bytes à transmettre, sans passer par
+    une chaîne intermédiaire.
+
+    Args:
+        data: Objet Python sérialisable
+
+    Returns:
+        bytes: Document JSON encodé en UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+@lru_cache(maxsize=4096, typed=True)
+def clean_string(value: str) -> str:
+    """
+    Nettoie une chaîne de caractères
+
+    Le résultat est mémoïsé: les mêmes chaînes (éditeurs, versions)
+    reviennent des milliers de fois dans les inventaires.
+
+    Args:
+        value: Chaîne à nettoyer
+
+    Returns:
+        str: Chaîne nettoyée
+    """
+    if not value:
+        return ""
+
+    # Convertir en string si nécessaire
+    if type(value) is not str:
+        value = str(value)
+
+    # Supprimer les espaces en début/fin
+    value = value.strip()
+
+    # Cas courant: chaîne déjà propre (aucun caractère de contrôle
+    # ni séparateur autre que l'espace, pas d'espaces multiples)
+    if value.isprintable() and '  ' not in value:
+        return value
+
+    # Supprimer les caractères de contrôle
+    value = ''.join(char for char in value if char.isprintable())
+
+    # Supprimer les espaces multiples
+    value = WHITESPACE_RE.sub(' ', value)
+
+    return value
+
+
+@lru_cache(maxsize=4096, typed=True)
+def parse_version(version_string: str) -> str:
+    """
+    Parse et nettoie une chaîne de version
+
+    Le résultat est mémoïsé (voir clean_string).
+
+    Args:
+        version_string: Chaîne de version brute
+
+    Returns:
+        str: Version nettoyée
+    """
+    if not version_string:
+        return "Unknown"
+
+    version_string = str(version_string).strip()
+
+    # Cas courant: version purement numérique ("1.2.3", "22.04", "2.36-9"),
+    # déjà propre (ni préfixe ni caractère à filtrer)
+    if version_string and NUMERIC_VERSION_CHARS.issuperset(version_string):
+        return version_string
+
+    # Supprimer les préfixes communs
+    prefixes_to_remove = ['version ', 'v', 'Version ', 'V']
+    for prefix in prefixes_to_remove:
+        if version_string.lower().startswith(prefix.lower()):
+            version_string = version_string[len(prefix):].strip()
+
+    # Garder seulement les caractères de version valides
+    version_match = VERSION_RE.search(version_string)
+    if version_match:
+        return version_match.group(0)
+
+    return version_string if version_string else "Unknown"
 
 
 class BaseCollector(ABC):
@@ -44,6 +176,24 @@ class BaseCollector(ABC):
         """
         pass
 
+    def clear_cache(self):
+        """
+        Vide les données mises en cache par le collecteur
+
+        Aucune par défaut; les collecteurs qui en gardent entre deux
+        collectes surchargent cette méthode.
+        """
+        pass
+
+    def close(self):
+        """
+        Libère les ressources du collecteur (processus, threads)
+
+        Aucune par défaut; les collecteurs qui en gardent entre deux
+        collectes surchargent cette méthode.
+        """
+        pass
+
     def _start_collection(self):
         """
         Démarre une session de collecte
@@ -158,23 +308,11 @@ class BaseCollector(ABC):
         Returns:
             str: Chaîne nettoyée
         """
-        if not value:
-            return ""
-
-        # Convertir en string si nécessaire
-        value = str(value)
-
-        # Supprimer les espaces en début/fin
-        value = value.strip()
-
-        # Supprimer les caractères de contrôle
-        value = ''.join(char for char in value if char.isprintable())
-
-        # Supprimer les espaces multiples
-        import re
-        value = re.sub(r'\s+', ' ', value)
-
-        return value
+        try:
+            return clean_string(value)
+        except TypeError:
+            # Valeur non hashable: pas de mémoïsation
+            return clean_string.__wrapped__(value)
 
     def _get_safe_attribute(self, obj, attribute: str, default="N/A"):
         """
@@ -198,39 +336,109 @@ class BaseCollector(ABC):
         except Exception:
             return default
 
-    def _execute_command(self, command: str) -> Optional[str]:
+    def _execute_command(self, command: Union[str, List[str]], binary: bool = False,
+                         timeout: int = 30) -> Optional[Union[str, bytes]]:
         """
         Exécute une commande système et retourne le résultat
 
+        Une commande passée sous forme de liste est exécutée directement,
+        sans shell intermédiaire. Une chaîne passe par le shell (pipes,
+        redirections, variables). Sous Windows, aucune fenêtre console
+        n'est créée pour le processus.
+
         Args:
-            command: Commande à exécuter
+            command: Commande à exécuter (chaîne shell ou liste d'arguments)
+            binary: Retourne la sortie brute en bytes (sans décodage)
+            timeout: Délai maximum d'exécution en secondes
 
         Returns:
-            str: Sortie de la commande ou None en cas d'erreur
+            str ou bytes: Sortie de la commande ou None en cas d'erreur
         """
+        import subprocess
+
+        use_shell = isinstance(command, str)
+        command_str = command if use_shell else ' '.join(command)
+
         try:
-            import subprocess
             result = subprocess.run(
                 command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30  # Timeout de 30 secondes
+                shell=use_shell,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=not binary,
+                timeout=timeout,
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
             )
 
             if result.returncode == 0:
                 return result.stdout.strip()
             else:
-                self.logger.warning(f"Commande échouée: {command} (code: {result.returncode})")
+                self.logger.warning(f"Commande échouée: {command_str} (code: {result.returncode})")
                 return None
 
         except subprocess.TimeoutExpired:
-            self.logger.warning(f"Timeout pour la commande: {command}")
+            self.logger.warning(f"Timeout pour la commande: {command_str}")
             return None
         except Exception as e:
-            self.logger.warning(f"Erreur lors de l'exécution de '{command}': {e}")
+            self.logger.warning(f"Erreur lors de l'exécution de '{command_str}': {e}")
             return None
 
+    def _stream_command(self, command: Union[str, List[str]], timeout: int = 30) -> Iterator[str]:
+        """
+        Exécute une commande système et produit sa sortie ligne par ligne
+
+        Contrairement à _execute_command, la sortie n'est jamais chargée
+        entièrement en mémoire: chaque ligne est traitée dès qu'elle est
+        émise par le processus. Celui-ci est tué s'il dépasse le délai.
+
+        Args:
+            command: Commande à exécuter (chaîne shell ou liste d'arguments)
+            timeout: Délai maximum d'exécution en secondes
+
+        Returns:
+            Iterator[str]: Lignes de la sortie (sans fin de ligne)
+        """
+        import subprocess
+        import threading
+
+        use_shell = isinstance(command, str)
+        command_str = command if use_shell else ' '.join(command)
+
+        try:
+            process = subprocess.Popen(
+                command,
+                shell=use_shell,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+            )
+        except Exception as e:
+            self.logger.warning(f"Erreur lors de l'exécution de '{command_str}': {e}")
+            return
+
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+
+        try:
+            with process.stdout:
+                for line in process.stdout:
+                    yield line.rstrip('\r\n')
+
+            returncode = process.wait()
+            if not timer.is_alive():
+                self.logger.warning(f"Timeout pour la commande: {command_str}")
+            elif returncode != 0:
+                self.logger.warning(f"Commande échouée: {command_str} (code: {returncode})")
+
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                # Lecture interrompue par l'appelant
+                process.kill()
+                process.wait()
+
     def _read_file(self, file_path: str) -> Optional[str]:
         """
         Lit un fichier de manière sécurisée
@@ -261,24 +469,11 @@ class BaseCollector(ABC):
         Returns:
             str: Version nettoyée
         """
-        if not version_string:
-            return "Unknown"
-
-        version_string = str(version_string).strip()
-
-        # Supprimer les préfixes communs
-        prefixes_to_remove = ['version ', 'v', 'Version ', 'V']
-        for prefix in prefixes_to_remove:
-            if version_string.lower().startswith(prefix.lower()):
-                version_string = version_string[len(prefix):].strip()
-
-        # Garder seulement les caractères de version valides
-        import re
-        version_match = re.search(r'[\d\.\-\w]+', version_string)
-        if version_match:
-            return version_match.group(0)
-
-        return version_string if version_string else "Unknown"
+        try:
+            return parse_version(version_string)
+        except TypeError:
+            # Valeur non hashable: pas de mémoïsation
+            return parse_version.__wrapped__(version_string)
 
     def get_collection_stats(self) -> Dict[str, Any]:
         """
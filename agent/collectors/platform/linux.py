@@ -24,10 +24,13 @@ class LinuxCollector(BaseCollector):
     et les commandes Unix pour récupérer des informations détaillées.
     """
 
-    def collect(self) -> Dict[str, Any]:
+    def collect(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Collecte les informations spécifiques Linux
 
+        Args:
+            force_refresh: Sans effet (aucune donnée mise en cache)
+
         Returns:
             dict: Informations Linux détaillées
         """
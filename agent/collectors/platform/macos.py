@@ -8,12 +8,143 @@ Ce module utilise les outils et API spécifiques macOS :
 - Commandes Unix spécifiques macOS
 """
 
+import os
+import re
 import sys
+import copy
+import asyncio
 import json
+import time
+import ctypes
 import plistlib
-from typing import Dict, Any, List
-
-from ..base import BaseCollector
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Union
+
+from ..base import BaseCollector, json_loads
+
+
+# Commandes sysctl importantes pour macOS
+SYSCTL_COMMANDS = {
+    # Kernel et système
+    'kernel_version': 'kern.version',
+    'kernel_boottime': 'kern.boottime',
+    'hostname': 'kern.hostname',
+    'ostype': 'kern.ostype',
+    'osrelease': 'kern.osrelease',
+    'osrevision': 'kern.osrevision',
+
+    # Hardware
+    'hw_model': 'hw.model',
+    'hw_machine': 'hw.machine',
+    'hw_ncpu': 'hw.ncpu',
+    'hw_physicalcpu': 'hw.physicalcpu',
+    'hw_logicalcpu': 'hw.logicalcpu',
+    'hw_memsize': 'hw.memsize',
+    'hw_pagesize': 'hw.pagesize',
+
+    # CPU spécifique
+    'cpu_brand': 'machdep.cpu.brand_string',
+    'cpu_vendor': 'machdep.cpu.vendor',
+    'cpu_family': 'machdep.cpu.family',
+    'cpu_model': 'machdep.cpu.model',
+    'cpu_stepping': 'machdep.cpu.stepping',
+    'cpu_features': 'machdep.cpu.features',
+
+    # VM et mémoire
+    'vm_swapusage': 'vm.swapusage'
+}
+
+# Clés sysctl numériques et type C correspondant pour sysctlbyname
+SYSCTL_NUMERIC_TYPES = {
+    'kern.osrevision': ctypes.c_int,
+    'hw.ncpu': ctypes.c_int,
+    'hw.physicalcpu': ctypes.c_int,
+    'hw.logicalcpu': ctypes.c_int,
+    'hw.memsize': ctypes.c_uint64,
+    'hw.pagesize': ctypes.c_int64,
+    'machdep.cpu.family': ctypes.c_int,
+    'machdep.cpu.model': ctypes.c_int,
+    'machdep.cpu.stepping': ctypes.c_int,
+}
+
+
+class Timeval(ctypes.Structure):
+    """Structure C struct timeval (valeur de kern.boottime)"""
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_usec', ctypes.c_int32)]
+
+
+# Clés sysctl retournant une structure binaire lue directement
+SYSCTL_STRUCT_TYPES = {
+    'kern.boottime': Timeval,
+}
+
+# Clés sysctl structurées sans équivalent ctypes (lues via la commande sysctl)
+SYSCTL_STRUCT_KEYS = {'vm.swapusage'}
+
+# Types de données system_profiler importants
+PROFILER_TYPES = [
+    'SPHardwareDataType',      # Informations matériel général
+    'SPMemoryDataType',        # Mémoire RAM
+    'SPStorageDataType',       # Stockage
+    'SPDisplaysDataType',      # Écrans et graphiques
+    'SPNetworkDataType',       # Interfaces réseau
+    'SPAudioDataType',         # Audio
+    'SPUSBDataType',           # Périphériques USB
+    'SPSerialATADataType',     # SATA
+    'SPThunderboltDataType',   # Thunderbolt
+    'SPBluetoothDataType'      # Bluetooth
+]
+
+# Clé de résultat pour chaque type system_profiler (ex: SPHardwareDataType -> hardware)
+PROFILER_TYPE_KEYS = {
+    profiler_type: profiler_type.lower().replace('sp', '').replace('datatype', '')
+    for profiler_type in PROFILER_TYPES
+}
+
+# Dossiers d'applications parcourus (hors scan approfondi): les bundles
+# .app sont cherchés à la racine et un niveau en dessous (Utilities,
+# dossiers de suites d'éditeurs)
+MACOS_APPLICATION_DIRS = [
+    '/Applications',
+    '/System/Applications',
+    os.path.expanduser('~/Applications')
+]
+
+# Délai (secondes) de system_profiler SPApplicationsDataType, qui prend
+# couramment 15 à 30 secondes
+SYSTEM_PROFILER_APPS_TIMEOUT = 60
+
+# Préférences importantes à collecter
+IMPORTANT_PREFS = [
+    ('com.apple.dock', 'orientation'),
+    ('com.apple.dock', 'autohide'),
+    ('com.apple.dock', 'tilesize'),
+    ('com.apple.screensaver', 'askForPassword'),
+    ('com.apple.screensaver', 'askForPasswordDelay'),
+    ('NSGlobalDomain', 'AppleShowAllExtensions'),
+    ('NSGlobalDomain', 'NSNavPanelExpandedStateForSaveMode'),
+    ('com.apple.finder', 'AppleShowAllFiles'),
+    ('com.apple.TimeMachine', 'AutoBackup')
+]
+
+# Champs dscl utiles (la valeur peut être renvoyée à la ligne, indentée)
+DSCL_FIELD_RE = re.compile(
+    r'^(RealName|NFSHomeDirectory|UserShell|UniqueID):[ \t]*(?:\n[ \t]+)?(.*)$',
+    re.M
+)
+DSCL_FIELD_MAP = {
+    'RealName': 'real_name',
+    'NFSHomeDirectory': 'home_directory',
+    'UserShell': 'shell',
+    'UniqueID': 'uid',
+}
+
+# Durée de validité (secondes) des sections qui évoluent lentement
+SECTION_CACHE_TTLS = {
+    'applications': 300.0,
+    'services': 30.0,
+    'preferences': 60.0,
+}
 
 
 class MacOSCollector(BaseCollector):
@@ -24,16 +155,53 @@ class MacOSCollector(BaseCollector):
     et launchctl pour récupérer des informations détaillées.
     """
 
-    def collect(self) -> Dict[str, Any]:
+    # Bibliothèque libSystem chargée à la demande (False si indisponible)
+    _libsystem = None
+
+    def __init__(self, config, logger):
+        """
+        Initialise le collecteur macOS
+
+        Args:
+            config: Instance de AgentConfig
+            logger: Instance de AgentLogger
+        """
+        super().__init__(config, logger)
+
+        # Cache du dernier résultat complet de collect()
+        self._cache = None
+        self._cache_time = 0.0
+        self._ttl = 5.0
+
+        # Cache par section: nom -> (horodatage, données)
+        self._section_cache = {}
+
+        # Inventaire des applications via system_profiler (lent, exhaustif)
+        # au lieu du parcours des dossiers d'applications
+        self.deep_app_scan = config.get_agent_config().get('macos_deep_app_scan', False)
+
+        # Hors macOS, collect() est remplacé une fois pour toutes par un no-op
+        self._enabled = sys.platform == "darwin"
+        if not self._enabled:
+            self.logger.warning("MacOSCollector instancié sur une plateforme non-macOS")
+            self.collect = self._collect_disabled
+
+    def collect(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Collecte les informations spécifiques macOS
 
+        Un appel répété dans la fenêtre de validité du cache retourne
+        une copie du résultat précédent sans relancer la collecte.
+
+        Args:
+            force_refresh: Ignore les caches (résultat et sections)
+
         Returns:
             dict: Informations macOS détaillées
         """
-        if sys.platform != "darwin":
-            self.logger.warning("MacOSCollector appelé sur une plateforme non-macOS")
-            return {}
+        if (not force_refresh and self._cache is not None
+                and time.monotonic() - self._cache_time < self._ttl):
+            return copy.deepcopy(self._cache)
 
         self._start_collection()
 
@@ -45,13 +213,19 @@ class MacOSCollector(BaseCollector):
             'hardware_profiler': self._collect_system_profiler_info(),
 
             # Services launchd
-            'services': self._collect_launchd_services(),
+            'services': self._get_cached_section('services', self._collect_launchd_services,
+                                                 force_refresh),
 
             # Applications installées
-            'applications': self._collect_macos_applications(),
+            'applications': self._get_cached_section(
+                'applications',
+                lambda: self._collect_macos_applications(self.deep_app_scan),
+                force_refresh
+            ),
 
             # Préférences système
-            'preferences': self._collect_system_preferences(),
+            'preferences': self._get_cached_section('preferences', self._collect_system_preferences,
+                                                    force_refresh),
 
             # Utilisateurs et comptes
             'users': self._collect_macos_users(),
@@ -67,7 +241,56 @@ class MacOSCollector(BaseCollector):
         }
 
         self.last_collection_duration = self._end_collection()
-        return macos_info
+
+        self._cache = macos_info
+        self._cache_time = time.monotonic()
+
+        return copy.deepcopy(macos_info)
+
+    def _collect_disabled(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Collecte vide utilisée sur les plateformes non-macOS
+
+        Args:
+            force_refresh: Sans effet
+
+        Returns:
+            dict: Dictionnaire vide
+        """
+        return {}
+
+    def _get_cached_section(self, section: str, collect_func,
+                            force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Retourne une section depuis le cache si elle est encore valide
+
+        Une section vide (collecte en échec) n'est pas mise en cache. Le
+        cache n'est jamais partagé avec l'appelant (copies).
+
+        Args:
+            section: Nom de la section (clé de SECTION_CACHE_TTLS)
+            collect_func: Méthode de collecte à appeler si le cache a expiré
+            force_refresh: Ignore le cache et recollecte la section
+
+        Returns:
+            dict: Données de la section
+        """
+        now = time.monotonic()
+        cached = None if force_refresh else self._section_cache.get(section)
+        if cached and now - cached[0] < SECTION_CACHE_TTLS[section]:
+            return copy.deepcopy(cached[1])
+
+        data = collect_func()
+        if data:
+            self._section_cache[section] = (now, copy.deepcopy(data))
+        else:
+            self._section_cache.pop(section, None)
+        return data
+
+    def clear_cache(self):
+        """Vide le cache du résultat complet et des sections"""
+        self._cache = None
+        self._section_cache.clear()
 
     def _collect_macos_system_info(self) -> Dict[str, Any]:
         """
@@ -78,42 +301,18 @@ class MacOSCollector(BaseCollector):
         """
         system_info = {}
 
-        # Commandes sysctl importantes pour macOS
-        sysctl_commands = {
-            # Kernel et système
-            'kernel_version': 'kern.version',
-            'kernel_boottime': 'kern.boottime',
-            'hostname': 'kern.hostname',
-            'ostype': 'kern.ostype',
-            'osrelease': 'kern.osrelease',
-            'osrevision': 'kern.osrevision',
-
-            # Hardware
-            'hw_model': 'hw.model',
-            'hw_machine': 'hw.machine',
-            'hw_ncpu': 'hw.ncpu',
-            'hw_physicalcpu': 'hw.physicalcpu',
-            'hw_logicalcpu': 'hw.logicalcpu',
-            'hw_memsize': 'hw.memsize',
-            'hw_pagesize': 'hw.pagesize',
-
-            # CPU spécifique
-            'cpu_brand': 'machdep.cpu.brand_string',
-            'cpu_vendor': 'machdep.cpu.vendor',
-            'cpu_family': 'machdep.cpu.family',
-            'cpu_model': 'machdep.cpu.model',
-            'cpu_stepping': 'machdep.cpu.stepping',
-            'cpu_features': 'machdep.cpu.features',
-
-            # VM et mémoire
-            'vm_swapusage': 'vm.swapusage'
-        }
-
-        for key, sysctl_key in sysctl_commands.items():
-            value = self._execute_command(f"sysctl -n {sysctl_key}")
-            if value:
+        for key, sysctl_key in SYSCTL_COMMANDS.items():
+            value = None
+            if sysctl_key not in SYSCTL_STRUCT_KEYS:
+                value = self._sysctl(sysctl_key)
+            if value is None:
+                value = self._execute_command(['sysctl', '-n', sysctl_key])
+            if value is not None and value != '':
                 # Traitement spécial pour certaines valeurs
-                if key == 'hw_memsize':
+                if key == 'kernel_boottime' and isinstance(value, Timeval):
+                    system_info[key] = value.tv_sec
+                    system_info['uptime_seconds'] = int(time.time() - value.tv_sec)
+                elif key == 'hw_memsize':
                     try:
                         bytes_value = int(value)
                         system_info[key] = self._format_bytes(bytes_value)
@@ -129,9 +328,9 @@ class MacOSCollector(BaseCollector):
                     system_info[key] = self._clean_string(value)
 
         # Version macOS détaillée
-        sw_vers_output = self._execute_command('sw_vers')
+        sw_vers_output = self._execute_command(['sw_vers'])
         if sw_vers_output:
-            for line in sw_vers_output.split('\n'):
+            for line in sw_vers_output.splitlines():
                 if ':' in line:
                     key, value = line.split(':', 1)
                     key = key.strip().lower().replace(' ', '_')
@@ -140,6 +339,73 @@ class MacOSCollector(BaseCollector):
 
         return system_info
 
+    def _get_libsystem(self):
+        """
+        Charge libSystem via ctypes (une seule fois par processus)
+
+        Returns:
+            ctypes.CDLL: Bibliothèque libSystem ou None si indisponible
+        """
+        if MacOSCollector._libsystem is None:
+            try:
+                libsystem = ctypes.CDLL('/usr/lib/libSystem.dylib', use_errno=True)
+                libsystem.sysctlbyname.argtypes = [
+                    ctypes.c_char_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t),
+                    ctypes.c_void_p, ctypes.c_size_t
+                ]
+                libsystem.sysctlbyname.restype = ctypes.c_int
+                MacOSCollector._libsystem = libsystem
+            except (OSError, AttributeError) as e:
+                self.logger.debug(f"libSystem non disponible: {e}")
+                MacOSCollector._libsystem = False
+
+        return MacOSCollector._libsystem or None
+
+    def _sysctl(self, name: str) -> Optional[Union[int, str, ctypes.Structure]]:
+        """
+        Lit une valeur sysctl directement via sysctlbyname, sans sous-processus
+
+        Args:
+            name: Nom de la clé sysctl (ex: "hw.memsize")
+
+        Returns:
+            int, str ou Structure: Valeur native de la clé, None en cas d'erreur
+        """
+        libsystem = self._get_libsystem()
+        if libsystem is None:
+            return None
+
+        encoded_name = name.encode('ascii')
+
+        # Valeurs numériques: tampon du type C attendu
+        ctype = SYSCTL_NUMERIC_TYPES.get(name)
+        if ctype is not None:
+            value = ctype(0)
+            size = ctypes.c_size_t(ctypes.sizeof(value))
+            if libsystem.sysctlbyname(encoded_name, ctypes.byref(value), ctypes.byref(size), None, 0) != 0:
+                return None
+            return value.value
+
+        # Structures binaires (ex: struct timeval)
+        struct_type = SYSCTL_STRUCT_TYPES.get(name)
+        if struct_type is not None:
+            value = struct_type()
+            size = ctypes.c_size_t(ctypes.sizeof(value))
+            if libsystem.sysctlbyname(encoded_name, ctypes.byref(value), ctypes.byref(size), None, 0) != 0:
+                return None
+            return value
+
+        # Chaînes: interroger la taille puis lire dans un tampon dimensionné
+        size = ctypes.c_size_t(0)
+        if libsystem.sysctlbyname(encoded_name, None, ctypes.byref(size), None, 0) != 0 or not size.value:
+            return None
+
+        buffer = ctypes.create_string_buffer(size.value)
+        if libsystem.sysctlbyname(encoded_name, buffer, ctypes.byref(size), None, 0) != 0:
+            return None
+
+        return buffer.value.decode('utf-8', errors='replace')
+
     def _collect_system_profiler_info(self) -> Dict[str, Any]:
         """
         Collecte les informations matériel via system_profiler
@@ -149,37 +415,69 @@ class MacOSCollector(BaseCollector):
         """
         profiler_info = {}
 
-        # Types de données system_profiler importants
-        profiler_types = [
-            'SPHardwareDataType',      # Informations matériel général
-            'SPMemoryDataType',        # Mémoire RAM
-            'SPStorageDataType',       # Stockage
-            'SPDisplaysDataType',      # Écrans et graphiques
-            'SPNetworkDataType',       # Interfaces réseau
-            'SPAudioDataType',         # Audio
-            'SPUSBDataType',           # Périphériques USB
-            'SPSerialATADataType',     # SATA
-            'SPThunderboltDataType',   # Thunderbolt
-            'SPBluetoothDataType'      # Bluetooth
-        ]
+        # Lancer tous les system_profiler en parallèle
+        try:
+            outputs = asyncio.run(self._gather_system_profiler(PROFILER_TYPES))
+        except Exception as e:
+            self.logger.debug(f"Erreur lancement system_profiler: {e}")
+            return profiler_info
 
-        for profiler_type in profiler_types:
-            try:
-                output = self._execute_command(f'system_profiler {profiler_type} -json')
-                if output:
-                    try:
-                        data = json.loads(output)
-                        type_key = profiler_type.lower().replace('sp', '').replace('datatype', '')
-                        profiler_info[type_key] = data.get(profiler_type, [])
+        for profiler_type, output in zip(PROFILER_TYPES, outputs):
+            if isinstance(output, Exception):
+                self.logger.debug(f"Erreur system_profiler {profiler_type}: {output}")
+                continue
 
-                    except json.JSONDecodeError as e:
-                        self.logger.debug(f"Erreur parsing JSON {profiler_type}: {e}")
+            if output:
+                try:
+                    data = json_loads(output)
+                    profiler_info[PROFILER_TYPE_KEYS[profiler_type]] = data.get(profiler_type, [])
 
-            except Exception as e:
-                self.logger.debug(f"Erreur system_profiler {profiler_type}: {e}")
+                except json.JSONDecodeError as e:
+                    self.logger.debug(f"Erreur parsing JSON {profiler_type}: {e}")
 
         return profiler_info
 
+    async def _run_system_profiler(self, profiler_type: str) -> Optional[bytes]:
+        """
+        Exécute system_profiler pour un type de données de façon asynchrone
+
+        Args:
+            profiler_type: Type de données system_profiler (ex: SPHardwareDataType)
+
+        Returns:
+            bytes: Sortie JSON brute ou None en cas d'erreur
+        """
+        process = await asyncio.create_subprocess_exec(
+            'system_profiler', profiler_type, '-json',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            self.logger.warning(f"Timeout pour system_profiler {profiler_type}")
+            return None
+
+        return stdout if process.returncode == 0 else None
+
+    async def _gather_system_profiler(self, profiler_types: List[str]) -> List[Any]:
+        """
+        Lance tous les system_profiler simultanément
+
+        Args:
+            profiler_types: Types de données à récupérer
+
+        Returns:
+            list: Sorties (ou exceptions) dans l'ordre des types demandés
+        """
+        return await asyncio.gather(
+            *[self._run_system_profiler(profiler_type) for profiler_type in profiler_types],
+            return_exceptions=True
+        )
+
     def _collect_launchd_services(self) -> Dict[str, Any]:
         """
         Collecte les services launchd
@@ -195,13 +493,13 @@ class MacOSCollector(BaseCollector):
 
         try:
             # Services utilisateur
-            user_output = self._execute_command('launchctl list')
+            user_output = self._execute_command(['launchctl', 'list'], binary=True)
             if user_output:
                 services_info['user_services'] = self._parse_launchctl_output(user_output)
 
             # Services système (nécessite sudo, peut ne pas fonctionner)
             try:
-                system_output = self._execute_command('sudo launchctl list')
+                system_output = self._execute_command(['sudo', 'launchctl', 'list'], binary=True)
                 if system_output:
                     services_info['system_services'] = self._parse_launchctl_output(system_output)
             except Exception:
@@ -219,34 +517,48 @@ class MacOSCollector(BaseCollector):
 
         return services_info
 
-    def _parse_launchctl_output(self, output: str) -> List[Dict[str, Any]]:
+    def _parse_launchctl_output(self, output: bytes) -> List[Dict[str, Any]]:
         """
         Parse la sortie de launchctl list
 
+        Seules les 100 premières lignes après l'en-tête sont découpées,
+        le reste de la sortie n'est ni décodé ni parsé.
+
         Args:
-            output: Sortie de launchctl
+            output: Sortie brute de launchctl (bytes)
 
         Returns:
             list: Services parsés
         """
         services = []
 
-        for line in output.split('\n')[1:]:  # Ignorer l'en-tête
-            parts = line.split('\t')
+        # Ignorer l'en-tête et limiter pour éviter trop de données
+        lines = output.split(b'\n', 101)[1:101]
+
+        for parts in [line.split(b'\t', 3) for line in lines]:
             if len(parts) >= 3:
+                pid = parts[0].decode('utf-8', errors='replace')
                 service_info = {
-                    'pid': parts[0] if parts[0] != '-' else None,
-                    'status': parts[1],
-                    'label': parts[2]
+                    'pid': pid if pid != '-' else None,
+                    'status': parts[1].decode('utf-8', errors='replace'),
+                    'label': parts[2].decode('utf-8', errors='replace')
                 }
                 services.append(service_info)
 
-        return services[:100]  # Limiter pour éviter trop de données
+        return services
 
-    def _collect_macos_applications(self) -> Dict[str, Any]:
+    def _collect_macos_applications(self, deep_scan: bool = False) -> Dict[str, Any]:
         """
         Collecte les applications macOS installées
 
+        Par défaut, parcourt MACOS_APPLICATION_DIRS en lisant directement
+        les Info.plist. L'appel à system_profiler (lent, jusqu'à plusieurs
+        dizaines de secondes, mais exhaustif) n'est utilisé qu'avec
+        deep_scan=True (option agent.macos_deep_app_scan).
+
+        Args:
+            deep_scan: Utiliser system_profiler SPApplicationsDataType
+
         Returns:
             dict: Applications macOS
         """
@@ -256,35 +568,104 @@ class MacOSCollector(BaseCollector):
         }
 
         try:
-            # Applications via system_profiler
-            output = self._execute_command('system_profiler SPApplicationsDataType -json')
-            if output:
-                try:
-                    data = json.loads(output)
-                    apps_data = data.get('SPApplicationsDataType', [])
-
-                    for app in apps_data:
-                        app_info = {
-                            'name': app.get('_name', ''),
-                            'version': app.get('version', ''),
-                            'obtained_from': app.get('obtained_from', ''),
-                            'last_modified': app.get('lastModified', ''),
-                            'path': app.get('path', ''),
-                            'kind': app.get('kind', ''),
-                            'bundle_id': app.get('info', {}).get('CFBundleIdentifier', '') if isinstance(app.get('info'), dict) else ''
-                        }
-                        apps_info['applications'].append(app_info)
+            if deep_scan:
+                apps_info['applications'] = self._collect_applications_system_profiler()
+            else:
+                for app_dir in MACOS_APPLICATION_DIRS:
+                    apps_info['applications'].extend(self._scan_applications_dir(app_dir))
 
-                    apps_info['application_count'] = len(apps_info['applications'])
-
-                except json.JSONDecodeError as e:
-                    self.logger.debug(f"Erreur parsing JSON applications: {e}")
+            apps_info['application_count'] = len(apps_info['applications'])
 
         except Exception as e:
             self.logger.debug(f"Erreur collecte applications macOS: {e}")
 
         return apps_info
 
+    def _scan_applications_dir(self, app_dir: str, depth: int = 1) -> List[Dict[str, Any]]:
+        """
+        Parcourt un dossier d'applications et lit chaque Info.plist
+
+        Args:
+            app_dir: Dossier contenant des bundles .app
+            depth: Nombre de niveaux de sous-dossiers (non .app) à parcourir
+
+        Returns:
+            list: Applications trouvées
+        """
+        applications = []
+
+        try:
+            with os.scandir(app_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    if not entry.name.endswith('.app'):
+                        # Sous-dossier (Utilities, suite d'un éditeur)
+                        if depth > 0:
+                            applications.extend(self._scan_applications_dir(entry.path, depth - 1))
+                        continue
+
+                    plist_path = os.path.join(entry.path, 'Contents', 'Info.plist')
+                    try:
+                        with open(plist_path, 'rb') as f:
+                            plist_data = plistlib.load(f)
+                    except FileNotFoundError:
+                        continue
+                    except Exception as e:
+                        self.logger.debug(f"Erreur lecture plist {plist_path}: {e}")
+                        continue
+
+                    applications.append({
+                        'name': plist_data.get('CFBundleName') or entry.name[:-4],
+                        'version': plist_data.get('CFBundleShortVersionString', ''),
+                        'obtained_from': '',
+                        'last_modified': datetime.fromtimestamp(entry.stat().st_mtime).isoformat(),
+                        'path': entry.path,
+                        'kind': '',
+                        'bundle_id': plist_data.get('CFBundleIdentifier', '')
+                    })
+
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug(f"Erreur parcours {app_dir}: {e}")
+
+        return applications
+
+    def _collect_applications_system_profiler(self) -> List[Dict[str, Any]]:
+        """
+        Collecte les applications via system_profiler (scan approfondi)
+
+        Returns:
+            list: Applications trouvées
+        """
+        applications = []
+
+        output = self._execute_command(['system_profiler', 'SPApplicationsDataType', '-json'],
+                                       binary=True, timeout=SYSTEM_PROFILER_APPS_TIMEOUT)
+        if output:
+            try:
+                data = json_loads(output)
+                apps_data = data.get('SPApplicationsDataType', [])
+
+                for app in apps_data:
+                    app_info = {
+                        'name': app.get('_name', ''),
+                        'version': app.get('version', ''),
+                        'obtained_from': app.get('obtained_from', ''),
+                        'last_modified': app.get('lastModified', ''),
+                        'path': app.get('path', ''),
+                        'kind': app.get('kind', ''),
+                        'bundle_id': app.get('info', {}).get('CFBundleIdentifier', '') if isinstance(app.get('info'), dict) else ''
+                    }
+                    applications.append(app_info)
+
+            except json.JSONDecodeError as e:
+                self.logger.debug(f"Erreur parsing JSON applications: {e}")
+
+        return applications
+
     def _collect_system_preferences(self) -> Dict[str, Any]:
         """
         Collecte les préférences système importantes
@@ -294,22 +675,32 @@ class MacOSCollector(BaseCollector):
         """
         preferences_info = {}
 
-        # Préférences importantes à collecter
-        important_prefs = [
-            ('com.apple.dock', 'orientation'),
-            ('com.apple.dock', 'autohide'),
-            ('com.apple.dock', 'tilesize'),
-            ('com.apple.screensaver', 'askForPassword'),
-            ('com.apple.screensaver', 'askForPasswordDelay'),
-            ('NSGlobalDomain', 'AppleShowAllExtensions'),
-            ('NSGlobalDomain', 'NSNavPanelExpandedStateForSaveMode'),
-            ('com.apple.finder', 'AppleShowAllFiles'),
-            ('com.apple.TimeMachine', 'AutoBackup')
-        ]
+        # API CoreFoundation via PyObjC (optionnel): évite un sous-processus par clé
+        try:
+            from Foundation import CFPreferencesCopyAppValue
+        except ImportError:
+            CFPreferencesCopyAppValue = None
 
-        for domain, key in important_prefs:
+        # Plists déjà lus, partagés entre les clés d'un même domaine
+        domain_plists = {}
+
+        for domain, key in IMPORTANT_PREFS:
             try:
-                value = self._execute_command(f'defaults read {domain} {key} 2>/dev/null')
+                if domain not in domain_plists:
+                    domain_plists[domain] = self._load_preference_plists(domain)
+                plists = domain_plists[domain]
+
+                if plists:
+                    # Lecture directe du fichier: ni sous-processus ni appel à cfprefsd
+                    value = self._format_preference_value(
+                        next((plist[key] for plist in plists if key in plist), None)
+                    )
+                elif CFPreferencesCopyAppValue is not None:
+                    app_id = '.GlobalPreferences' if domain == 'NSGlobalDomain' else domain
+                    value = self._format_preference_value(CFPreferencesCopyAppValue(key, app_id))
+                else:
+                    value = self._execute_command(['defaults', 'read', domain, key])
+
                 if value:
                     pref_key = f"{domain}_{key}".replace('com.apple.', '').replace('NSGlobalDomain_', 'global_')
                     preferences_info[pref_key] = value.strip()
@@ -319,6 +710,55 @@ class MacOSCollector(BaseCollector):
 
         return preferences_info
 
+    def _load_preference_plists(self, domain: str) -> List[Dict[str, Any]]:
+        """
+        Lit les fichiers plist d'un domaine de préférences
+
+        Le plist utilisateur (~/Library/Preferences) est prioritaire sur
+        le plist système (/Library/Preferences).
+
+        Args:
+            domain: Domaine de préférences (ex: com.apple.dock, NSGlobalDomain)
+
+        Returns:
+            list: Contenus des plists trouvés, par ordre de priorité
+        """
+        file_name = '.GlobalPreferences' if domain == 'NSGlobalDomain' else domain
+        plist_paths = [
+            os.path.expanduser(f'~/Library/Preferences/{file_name}.plist'),
+            f'/Library/Preferences/{file_name}.plist'
+        ]
+
+        plists = []
+        for plist_path in plist_paths:
+            try:
+                with open(plist_path, 'rb') as f:
+                    plist_data = plistlib.load(f)
+                if isinstance(plist_data, dict):
+                    plists.append(plist_data)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self.logger.debug(f"Erreur lecture plist {plist_path}: {e}")
+
+        return plists
+
+    def _format_preference_value(self, value: Any) -> str:
+        """
+        Formate une valeur de préférence comme le ferait 'defaults read'
+
+        Args:
+            value: Valeur lue dans un plist ou via CFPreferencesCopyAppValue
+
+        Returns:
+            str: Valeur formatée ("" si la clé n'existe pas)
+        """
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return '1' if value else '0'
+        return str(value)
+
     def _collect_macos_users(self) -> Dict[str, Any]:
         """
         Collecte les informations utilisateurs macOS
@@ -334,9 +774,9 @@ class MacOSCollector(BaseCollector):
 
         try:
             # Utilisateurs locaux via dscl
-            users_output = self._execute_command('dscl . list /Users')
+            users_output = self._execute_command(['dscl', '.', 'list', '/Users'])
             if users_output:
-                user_names = users_output.split('\n')
+                user_names = users_output.splitlines()
 
                 for user_name in user_names:
                     if user_name and not user_name.startswith('_'):  # Ignorer les utilisateurs système
@@ -349,27 +789,20 @@ class MacOSCollector(BaseCollector):
                         }
 
                         # Informations détaillées pour chaque utilisateur
-                        user_details = self._execute_command(f'dscl . read /Users/{user_name}')
+                        user_details = self._execute_command(['dscl', '.', 'read', f'/Users/{user_name}'])
                         if user_details:
-                            for line in user_details.split('\n'):
-                                if line.startswith('RealName:'):
-                                    user_info['real_name'] = line.split(':', 1)[1].strip()
-                                elif line.startswith('NFSHomeDirectory:'):
-                                    user_info['home_directory'] = line.split(':', 1)[1].strip()
-                                elif line.startswith('UserShell:'):
-                                    user_info['shell'] = line.split(':', 1)[1].strip()
-                                elif line.startswith('UniqueID:'):
-                                    user_info['uid'] = line.split(':', 1)[1].strip()
+                            for match in DSCL_FIELD_RE.finditer(user_details):
+                                user_info[DSCL_FIELD_MAP[match.group(1)]] = match.group(2).strip()
 
                         users_info['local_users'].append(user_info)
 
             # Utilisateur courant
-            current_user = self._execute_command('whoami')
+            current_user = self._execute_command(['whoami'])
             if current_user:
                 users_info['current_user']['username'] = current_user.strip()
 
                 # Répertoire home de l'utilisateur courant
-                home_dir = self._execute_command('echo $HOME')
+                home_dir = os.environ.get('HOME')
                 if home_dir:
                     users_info['current_user']['home_directory'] = home_dir.strip()
 
@@ -393,9 +826,10 @@ class MacOSCollector(BaseCollector):
 
         try:
             # Services réseau via networksetup
-            services_output = self._execute_command('networksetup -listallnetworkservices')
+            services_output = self._execute_command(['networksetup', '-listallnetworkservices'])
             if services_output:
-                services = services_output.split('\n')[1:]  # Ignorer la première ligne
+                services = iter(services_output.splitlines())
+                next(services, None)  # Ignorer la première ligne
                 for service in services:
                     if service and not service.startswith('*'):
                         service_info = {
@@ -407,16 +841,17 @@ class MacOSCollector(BaseCollector):
                         # Hardware pour ce service
                         hardware_output = self._execute_command(f'networksetup -listallhardwareports | grep -A1 "{service}"')
                         if hardware_output:
-                            for line in hardware_output.split('\n'):
+                            for line in hardware_output.splitlines():
                                 if line.startswith('Hardware Port:'):
                                     service_info['hardware'] = line.split(':', 1)[1].strip()
 
                         network_info['network_services'].append(service_info)
 
             # Réseaux WiFi connus
-            wifi_output = self._execute_command('networksetup -listpreferredwirelessnetworks en0 2>/dev/null')
+            wifi_output = self._execute_command(['networksetup', '-listpreferredwirelessnetworks', 'en0'])
             if wifi_output:
-                networks = wifi_output.split('\n')[1:]  # Ignorer l'en-tête
+                networks = iter(wifi_output.splitlines())
+                next(networks, None)  # Ignorer l'en-tête
                 network_info['wifi_networks'] = [net.strip() for net in networks if net.strip()]
 
         except Exception as e:
@@ -440,22 +875,22 @@ class MacOSCollector(BaseCollector):
 
         try:
             # Gatekeeper
-            gatekeeper_output = self._execute_command('spctl --status')
+            gatekeeper_output = self._execute_command(['spctl', '--status'])
             if gatekeeper_output:
                 security_info['gatekeeper']['status'] = gatekeeper_output.strip()
 
             # System Integrity Protection (SIP)
-            sip_output = self._execute_command('csrutil status')
+            sip_output = self._execute_command(['csrutil', 'status'])
             if sip_output:
                 security_info['system_integrity']['sip_status'] = sip_output.strip()
 
             # Pare-feu
-            firewall_output = self._execute_command('sudo /usr/libexec/ApplicationFirewall/socketfilterfw --getglobalstate 2>/dev/null')
+            firewall_output = self._execute_command(['sudo', '/usr/libexec/ApplicationFirewall/socketfilterfw', '--getglobalstate'])
             if firewall_output:
                 security_info['firewall']['global_state'] = firewall_output.strip()
 
             # Trousseau par défaut
-            keychain_output = self._execute_command('security default-keychain')
+            keychain_output = self._execute_command(['security', 'default-keychain'])
             if keychain_output:
                 security_info['keychain_info']['default_keychain'] = keychain_output.strip().strip('"')
 
@@ -479,7 +914,7 @@ class MacOSCollector(BaseCollector):
 
         try:
             # Informations shell
-            shell_output = self._execute_command('echo $SHELL')
+            shell_output = os.environ.get('SHELL')
             if shell_output:
                 env_info['shell_info']['current_shell'] = shell_output.strip()
 
@@ -488,26 +923,26 @@ class MacOSCollector(BaseCollector):
                 env_info['shell_info']['shell_version'] = shell_version.strip()
 
             # Outils de développement
-            xcode_output = self._execute_command('xcodebuild -version 2>/dev/null')
+            xcode_output = self._execute_command(['xcodebuild', '-version'])
             if xcode_output:
-                env_info['development_tools']['xcode'] = xcode_output.split('\n')[0] if xcode_output else ''
+                env_info['development_tools']['xcode'] = xcode_output.partition('\n')[0]
 
             # Command Line Tools
-            clt_output = self._execute_command('pkgutil --pkg-info=com.apple.pkg.CLTools_Executables 2>/dev/null')
+            clt_output = self._execute_command(['pkgutil', '--pkg-info=com.apple.pkg.CLTools_Executables'])
             if clt_output:
-                for line in clt_output.split('\n'):
+                for line in clt_output.splitlines():
                     if line.startswith('version:'):
                         env_info['development_tools']['command_line_tools'] = line.split(':', 1)[1].strip()
 
             # Homebrew
-            brew_output = self._execute_command('brew --version 2>/dev/null')
+            brew_output = self._execute_command(['brew', '--version'])
             if brew_output:
-                env_info['development_tools']['homebrew'] = brew_output.split('\n')[0] if brew_output else ''
+                env_info['development_tools']['homebrew'] = brew_output.partition('\n')[0]
 
             # Chemins système importants
             path_vars = ['PATH', 'MANPATH', 'INFOPATH']
             for var in path_vars:
-                value = self._execute_command(f'echo ${var}')
+                value = os.environ.get(var)
                 if value:
                     # Tronquer si trop long
                     if len(value) > 300:
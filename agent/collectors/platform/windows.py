@@ -8,11 +8,265 @@ Ce module utilise les API Windows spécifiques :
 - API Win32
 """
 
+import os
 import sys
+import copy
 import json
-from typing import Dict, Any
+import time
+import uuid
+import shutil
+import ctypes
+import threading
+import subprocess
+from datetime import datetime
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..base import BaseCollector, json_loads
+
+# Modules propres à Windows, importés une seule fois au chargement
+# (pywin32 et wmi sont optionnels: repli sur les autres sources)
+if sys.platform == "win32":
+    import winreg
+
+    try:
+        import pythoncom
+    except ImportError:
+        pythoncom = None
+
+    try:
+        import wmi
+    except ImportError:
+        wmi = None
+
+    try:
+        import win32net
+        import win32netcon
+        import win32security
+    except ImportError:
+        win32net = win32netcon = win32security = None
+else:
+    winreg = None
+    pythoncom = None
+    wmi = None
+    win32net = win32netcon = win32security = None
+
+
+# Droits et options du gestionnaire de services (winsvc.h)
+SC_MANAGER_CONNECT = 0x0001
+SC_MANAGER_ENUMERATE_SERVICE = 0x0004
+SC_ENUM_PROCESS_INFO = 0
+SERVICE_WIN32 = 0x00000030
+SERVICE_STATE_ALL = 0x00000003
+SERVICE_QUERY_CONFIG = 0x0001
+SERVICE_CONFIG_DESCRIPTION = 1
+ERROR_INSUFFICIENT_BUFFER = 122
+ERROR_MORE_DATA = 234
+
+# Nombre maximum de services détaillés par collecte
+SERVICES_LIMIT = 100
+
+# États de service comptés dans le résumé
+SERVICE_STOPPED = 1
+SERVICE_RUNNING = 4
+
+# Libellés identiques à ceux renvoyés par Win32_Service
+SERVICE_STATES = {
+    1: 'Stopped',
+    2: 'Start Pending',
+    3: 'Stop Pending',
+    4: 'Running',
+    5: 'Continue Pending',
+    6: 'Pause Pending',
+    7: 'Paused'
+}
+
+SERVICE_START_MODES = {
+    0: 'Boot',
+    1: 'System',
+    2: 'Auto',
+    3: 'Manual',
+    4: 'Disabled'
+}
+
+SERVICE_TYPES = {
+    0x10: 'Own Process',
+    0x20: 'Share Process'
+}
+
+
+# Requêtes WQL limitées aux colonnes lues (évite le SELECT * implicite)
+WQL_QUERIES = {
+    'computer_system': (
+        "SELECT Domain, Workgroup, PartOfDomain, Roles, SystemType, Manufacturer, "
+        "Model, TotalPhysicalMemory FROM Win32_ComputerSystem"
+    ),
+    'operating_system': (
+        "SELECT Version, BuildNumber, Caption, OSArchitecture, InstallDate, LastBootUpTime, "
+        "SystemDirectory, WindowsDirectory, RegisteredUser, Organization, SerialNumber "
+        "FROM Win32_OperatingSystem"
+    ),
+    'processor': "SELECT ProcessorId, Revision FROM Win32_Processor",
+    'services': (
+        "SELECT Name, DisplayName, State, StartMode, ServiceType, Description "
+        "FROM Win32_Service"
+    ),
+    'service_states': "SELECT Name, State FROM Win32_Service",
+    'nt_domain': "SELECT DomainControllerName, DomainControllerAddress FROM Win32_NTDomain",
+    'antivirus': (
+        "SELECT DisplayName, InstanceGuid, PathToSignedProductExe "
+        "FROM Win32_VirusCheckResult"
+    ),
+    'local_users': (
+        "SELECT Name, FullName, Description, Disabled, Lockout, PasswordRequired, "
+        "PasswordChangeable, PasswordExpires, AccountType, SID "
+        "FROM Win32_UserAccount WHERE LocalAccount=TRUE"
+    ),
+    'boot_configuration': (
+        "SELECT BootDirectory, ConfigurationPath, TempDirectory FROM Win32_BootConfiguration"
+    ),
+    'optional_features': (
+        "SELECT Name, Caption FROM Win32_OptionalFeature WHERE InstallState=1"
+    )
+}
+
+
+# Durée de validité (secondes) de chaque section selon sa volatilité
+# (le temps de fonctionnement de boot_info n'est jamais mis en cache)
+SECTION_CACHE_TTLS = {
+    'system': 3600.0,
+    'services': 30.0,
+    'domain_info': 300.0,
+    'features': 300.0,
+    'security': 30.0,
+    'users': 300.0,
+    'environment': 300.0,
+    'boot_info': 3600.0,
+}
+
+# Longueur maximale conservée pour une variable d'environnement
+ENV_VALUE_MAX_LENGTH = 200
+
+# Emplacement standard de Windows PowerShell si absent du PATH
+POWERSHELL_DEFAULT_PATH = os.path.join(
+    os.environ.get('SystemRoot', r'C:\Windows'),
+    r'System32\WindowsPowerShell\v1.0\powershell.exe'
+)
+
+# Délai maximum (secondes) accordé au script PowerShell
+POWERSHELL_TIMEOUT = 15
+
+# Script PowerShell groupé: toutes les données PowerShell en un seul lancement
+PS_BUNDLE_SCRIPT = (
+    "$fw = Get-NetFirewallProfile | Select-Object Name, Enabled; "
+    "@{firewall = @($fw)} | ConvertTo-Json -Depth 4"
+)
+
+# API DISM (dismapi.h) pour les fonctionnalités optionnelles
+DISM_ONLINE_IMAGE = 'DISM_{53BFAE52-B167-4E2F-A258-0A37B57FF845}'
+DISM_LOG_ERRORS = 0
+DISM_PACKAGE_NONE = 0
+DISM_STATE_INSTALLED = 4
+
+
+# Options SWbemServices.ExecQuery: énumérateur semi-synchrone, en avant seulement
+WBEM_FLAG_RETURN_IMMEDIATELY = 0x10
+WBEM_FLAG_FORWARD_ONLY = 0x20
+WBEM_QUERY_FLAGS = WBEM_FLAG_RETURN_IMMEDIATELY | WBEM_FLAG_FORWARD_ONLY
+
+
+# Colonnes parallèles (structure de tableaux) des listes volumineuses
+SERVICE_COLUMNS = ('names', 'display_names', 'states', 'start_modes', 'service_types', 'descriptions')
+USER_COLUMNS = (
+    'names', 'full_names', 'descriptions', 'disabled', 'locked_out', 'password_required',
+    'password_changeable', 'password_expires', 'account_types', 'sids'
+)
+FEATURE_COLUMNS = ('names', 'display_names')
+
+
+def to_columns(rows: List[tuple], columns: Tuple[str, ...]) -> Dict[str, list]:
+    """
+    Transpose des lignes en listes parallèles, une par colonne
+
+    Args:
+        rows: Lignes (tuples ordonnés comme columns)
+        columns: Noms des colonnes
+
+    Returns:
+        dict: Nom de colonne -> liste des valeurs
+    """
+    if not rows:
+        return {column: [] for column in columns}
+    return dict(zip(columns, map(list, zip(*rows))))
+
+
+def truncate(value: str, max_length: int = ENV_VALUE_MAX_LENGTH) -> str:
+    """
+    Tronque une chaîne trop longue en ajoutant "..."
 
-from ..base import BaseCollector
+    Args:
+        value: Chaîne à tronquer
+        max_length: Longueur maximale conservée
+
+    Returns:
+        str: Chaîne inchangée ou tronquée
+    """
+    return value if len(value) <= max_length else value[:max_length] + "..."
+
+
+class ServiceStatusProcess(ctypes.Structure):
+    """Structure SERVICE_STATUS_PROCESS"""
+    _fields_ = [
+        ('dwServiceType', ctypes.c_uint32),
+        ('dwCurrentState', ctypes.c_uint32),
+        ('dwControlsAccepted', ctypes.c_uint32),
+        ('dwWin32ExitCode', ctypes.c_uint32),
+        ('dwServiceSpecificExitCode', ctypes.c_uint32),
+        ('dwCheckPoint', ctypes.c_uint32),
+        ('dwWaitHint', ctypes.c_uint32),
+        ('dwProcessId', ctypes.c_uint32),
+        ('dwServiceFlags', ctypes.c_uint32)
+    ]
+
+
+class EnumServiceStatusProcess(ctypes.Structure):
+    """Structure ENUM_SERVICE_STATUS_PROCESSW"""
+    _fields_ = [
+        ('lpServiceName', ctypes.c_wchar_p),
+        ('lpDisplayName', ctypes.c_wchar_p),
+        ('ServiceStatusProcess', ServiceStatusProcess)
+    ]
+
+
+class QueryServiceConfig(ctypes.Structure):
+    """Structure QUERY_SERVICE_CONFIGW"""
+    _fields_ = [
+        ('dwServiceType', ctypes.c_uint32),
+        ('dwStartType', ctypes.c_uint32),
+        ('dwErrorControl', ctypes.c_uint32),
+        ('lpBinaryPathName', ctypes.c_wchar_p),
+        ('lpLoadOrderGroup', ctypes.c_wchar_p),
+        ('dwTagId', ctypes.c_uint32),
+        ('lpDependencies', ctypes.c_wchar_p),
+        ('lpServiceStartName', ctypes.c_wchar_p),
+        ('lpDisplayName', ctypes.c_wchar_p)
+    ]
+
+
+class ServiceDescription(ctypes.Structure):
+    """Structure SERVICE_DESCRIPTIONW"""
+    _fields_ = [('lpDescription', ctypes.c_wchar_p)]
+
+
+class DismFeature(ctypes.Structure):
+    """Structure DismFeature (dismapi.h, alignement sur 1 octet)"""
+    _pack_ = 1
+    _fields_ = [
+        ('FeatureName', ctypes.c_wchar_p),
+        ('State', ctypes.c_int)
+    ]
 
 
 class WindowsCollector(BaseCollector):
@@ -23,10 +277,76 @@ class WindowsCollector(BaseCollector):
     des informations détaillées spécifiques à Windows.
     """
 
-    def collect(self) -> Dict[str, Any]:
+    # advapi32 chargé à la demande, partagé entre les instances
+    _advapi32 = None
+
+    # Chemin complet de powershell.exe, résolu une seule fois
+    _powershell = None
+
+    def __init__(self, config, logger):
+        """
+        Initialise le collecteur Windows
+
+        Args:
+            config: Instance de AgentConfig
+            logger: Instance de AgentLogger
+        """
+        super().__init__(config, logger)
+
+        if WindowsCollector._powershell is None:
+            WindowsCollector._powershell = shutil.which('powershell.exe') or POWERSHELL_DEFAULT_PATH
+
+        # Connexion WMI unique, ouverte dans le thread WMI dédié
+        # (les proxies COM sont liés à l'appartement qui les a créés)
+        self._wmi = None
+        self._wmi_executor = None
+        self._wmi_available = False
+
+        # Première ligne des classes WMI partagées entre sections
+        self._wmi_rows = {}
+
+        # Cache par section: nom -> (horodatage, données)
+        self._section_cache = {}
+
+        # Résultat du script PowerShell groupé (une exécution par collecte)
+        self._ps_bundle = None
+        self._ps_bundle_lock = threading.Lock()
+
+        # Processus PowerShell persistant, démarré au premier script
+        self._ps_process = None
+        self._ps_reader = None
+        self._ps_sentinel = f"EOF{uuid.uuid4().hex}"
+        self._ps_lock = threading.Lock()
+
+    def close(self):
+        """
+        Arrête le processus PowerShell persistant et les threads dédiés
+
+        Ne pas compter sur le ramasse-miettes: les threads des exécuteurs
+        gardent une référence au collecteur. Le collecteur reste
+        utilisable, processus et threads sont recréés à la demande.
+        """
+        with self._ps_lock:
+            self._stop_powershell()
+            reader, self._ps_reader = self._ps_reader, None
+
+        # Le processus tué, la lecture en cours se termine d'elle-même
+        if reader is not None:
+            reader.shutdown(wait=True)
+
+        executor, self._wmi_executor = self._wmi_executor, None
+        if executor is not None:
+            # Libérer la connexion WMI dans le thread qui l'a ouverte
+            executor.submit(self._release_wmi_thread)
+            executor.shutdown(wait=True)
+
+    def collect(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Collecte les informations spécifiques Windows
 
+        Args:
+            force_refresh: Ignore le cache des sections et recollecte tout
+
         Returns:
             dict: Informations Windows détaillées
         """
@@ -36,35 +356,226 @@ class WindowsCollector(BaseCollector):
 
         self._start_collection()
 
-        windows_info = {
+        self._wmi_available = self._wmi_call(lambda: self._wmi is not None)
+        self._wmi_rows = {}
+        self._ps_bundle = None
+
+        tasks = {
             # Informations système Windows
-            'system': self._collect_windows_system_info(),
+            'system': self._collect_windows_system_info,
 
             # Services Windows
-            'services': self._collect_windows_services(),
+            'services': self._collect_windows_services,
 
             # Informations domaine/workgroup
-            'domain_info': self._collect_domain_info(),
+            'domain_info': self._collect_domain_info,
 
             # Fonctionnalités Windows installées
-            'features': self._collect_windows_features(),
+            'features': self._collect_windows_features,
 
             # Informations de sécurité
-            'security': self._collect_security_info(),
+            'security': self._collect_security_info,
 
             # Informations utilisateurs locaux
-            'users': self._collect_local_users(),
+            'users': self._collect_local_users,
 
             # Variables d'environnement spécifiques
-            'environment': self._collect_windows_environment(),
+            'environment': self._collect_windows_environment,
 
             # Informations de démarrage
-            'boot_info': self._collect_boot_info()
+            'boot_info': self._collect_boot_info
         }
 
+        # Les sections sont indépendantes: les lancements PowerShell et
+        # l'API native se chevauchent avec les requêtes WMI
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {
+                key: executor.submit(self._get_cached_section, key, func, force_refresh)
+                for key, func in tasks.items()
+            }
+            windows_info = {key: future.result() for key, future in futures.items()}
+
+        # Temps de fonctionnement: toujours mesuré, jamais mis en cache
+        windows_info['boot_info'].update(self._get_uptime_info())
+
         self.last_collection_duration = self._end_collection()
         return windows_info
 
+    def _get_cached_section(self, section: str, collect_func,
+                            force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Retourne une section depuis le cache si elle est encore valide
+
+        Une section vide, ou collectée sans WMI, n'est pas mise en cache:
+        une panne passagère n'est pas reportée jusqu'à expiration. Le
+        cache n'est jamais partagé avec l'appelant (copies).
+
+        Args:
+            section: Nom de la section (clé de SECTION_CACHE_TTLS)
+            collect_func: Méthode de collecte à appeler si le cache a expiré
+            force_refresh: Ignore le cache et recollecte la section
+
+        Returns:
+            dict: Données de la section
+        """
+        now = time.monotonic()
+        cached = None if force_refresh else self._section_cache.get(section)
+        if cached and now - cached[0] < SECTION_CACHE_TTLS[section]:
+            return copy.deepcopy(cached[1])
+
+        data = collect_func()
+        if data and self._wmi_available:
+            self._section_cache[section] = (now, copy.deepcopy(data))
+        else:
+            self._section_cache.pop(section, None)
+        return data
+
+    def clear_cache(self):
+        """Vide le cache des sections"""
+        self._section_cache.clear()
+
+    def _init_wmi_thread(self):
+        """
+        Initialise COM et la connexion WMI dans le thread WMI dédié
+        """
+        if pythoncom is not None:
+            pythoncom.CoInitialize()
+
+        if wmi is None:
+            self.logger.warning("Module WMI non disponible")
+            return
+
+        try:
+            self._wmi = wmi.WMI()
+        except Exception as e:
+            self.logger.error(f"Erreur connexion WMI: {e}")
+
+    def _release_wmi_thread(self):
+        """
+        Ferme la connexion WMI et COM dans le thread WMI dédié
+        """
+        self._wmi = None
+
+        if pythoncom is not None:
+            pythoncom.CoUninitialize()
+
+    def _wmi_call(self, func):
+        """
+        Exécute une fonction dans le thread WMI dédié
+
+        Toutes les requêtes WMI passent par ce thread unique, propriétaire
+        de la connexion: les sections peuvent tourner en parallèle sans
+        partager de proxy COM entre appartements.
+
+        Args:
+            func: Fonction à exécuter
+
+        Returns:
+            Résultat de la fonction
+        """
+        if self._wmi_executor is None:
+            self._wmi_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix='wmi',
+                initializer=self._init_wmi_thread
+            )
+        return self._wmi_executor.submit(func).result()
+
+    def _wmi_query(self, query_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Exécute une requête WQL_QUERIES et retourne les lignes
+
+        Les lignes sont converties en dictionnaires dans le thread WMI pour
+        pouvoir être lues depuis n'importe quel thread. Les propriétés sont
+        lues en une seule énumération de SWbemObject.Properties_ plutôt
+        qu'un appel IDispatch par attribut.
+
+        L'énumération SWbemServices.ExecQuery est parcourue au fil de l'eau:
+        avec une limite, les lignes suivantes ne sont jamais récupérées.
+        L'énumérateur en avant seulement libère chaque ligne une fois lue,
+        et la requête rend la main avant la fin du traitement côté serveur.
+
+        Args:
+            query_name: Clé de la requête dans WQL_QUERIES
+            limit: Nombre maximum de lignes (None pour toutes)
+
+        Returns:
+            list: Lignes du résultat (propriété -> valeur)
+        """
+        return self._wmi_call(lambda: self._run_wmi_query(query_name, limit))
+
+    def _run_wmi_query(self, query_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Exécute une requête WQL_QUERIES (à appeler depuis le thread WMI)
+
+        Args:
+            query_name: Clé de la requête dans WQL_QUERIES
+            limit: Nombre maximum de lignes (None pour toutes)
+
+        Returns:
+            list: Lignes du résultat (propriété -> valeur)
+        """
+        if self._wmi is None:
+            return []
+
+        rows = self._wmi._namespace.ExecQuery(WQL_QUERIES[query_name], 'WQL', WBEM_QUERY_FLAGS)
+        return [
+            {prop.Name: prop.Value for prop in row.Properties_}
+            for row in islice(rows, limit)
+        ]
+
+    def _get_wmi_row(self, query_name: str):
+        """
+        Récupère la première ligne d'une requête WMI (une fois par collecte)
+
+        Args:
+            query_name: Clé de la requête dans WQL_QUERIES
+
+        Returns:
+            Première ligne du résultat ou None
+        """
+        return self._get_wmi_rows([query_name])[query_name]
+
+    def _get_wmi_rows(self, query_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Récupère la première ligne de plusieurs requêtes WMI (une fois par collecte)
+
+        Toutes les requêtes manquantes sont émises avant de lire la moindre
+        ligne: en mode semi-synchrone, ExecQuery rend la main aussitôt et
+        les fournisseurs travaillent en parallèle, la durée totale est celle
+        de la requête la plus lente.
+
+        Win32_ComputerSystem est lue par les sections système et domaine,
+        qui tournent en parallèle. La vérification du cache s'exécute dans
+        le thread WMI unique: la seconde section attend la première et
+        réutilise sa ligne au lieu de relancer la requête.
+
+        Args:
+            query_names: Clés des requêtes dans WQL_QUERIES
+
+        Returns:
+            dict: Clé de requête -> première ligne (ou None)
+        """
+        def fetch_rows():
+            if self._wmi is None:
+                return dict.fromkeys(query_names)
+
+            pending = {
+                name: self._wmi._namespace.ExecQuery(WQL_QUERIES[name], 'WQL', WBEM_QUERY_FLAGS)
+                for name in query_names
+                if name not in self._wmi_rows
+            }
+
+            for name, rows in pending.items():
+                row = next(iter(rows), None)
+                self._wmi_rows[name] = (
+                    {prop.Name: prop.Value for prop in row.Properties_} if row is not None else None
+                )
+
+            return {name: self._wmi_rows[name] for name in query_names}
+
+        return self._wmi_call(fetch_rows)
+
     def _collect_windows_system_info(self) -> Dict[str, Any]:
         """
         Collecte les informations système Windows via WMI
@@ -74,99 +585,281 @@ class WindowsCollector(BaseCollector):
         """
         system_info = {}
 
+        if not self._wmi_available:
+            return system_info
+
         try:
-            import wmi
-            c = wmi.WMI()
+            # Les trois requêtes sont émises ensemble
+            rows = self._get_wmi_rows(['computer_system', 'operating_system', 'processor'])
 
             # Informations système général
-            for system in c.Win32_ComputerSystem():
-                system_info['domain'] = self._clean_string(system.Domain)
-                system_info['workgroup'] = self._clean_string(system.Workgroup)
-                system_info['part_of_domain'] = system.PartOfDomain
-                system_info['roles'] = list(system.Roles) if system.Roles else []
-                system_info['system_type'] = self._clean_string(system.SystemType)
-                system_info['manufacturer'] = self._clean_string(system.Manufacturer)
-                system_info['model'] = self._clean_string(system.Model)
-                system_info['total_physical_memory'] = system.TotalPhysicalMemory
-                break
+            system = rows['computer_system']
+            if system is not None:
+                system_info['domain'] = self._clean_string(system['Domain'])
+                system_info['workgroup'] = self._clean_string(system['Workgroup'])
+                system_info['part_of_domain'] = system['PartOfDomain']
+                system_info['roles'] = list(system['Roles']) if system['Roles'] else []
+                system_info['system_type'] = self._clean_string(system['SystemType'])
+                system_info['manufacturer'] = self._clean_string(system['Manufacturer'])
+                system_info['model'] = self._clean_string(system['Model'])
+                system_info['total_physical_memory'] = system['TotalPhysicalMemory']
 
             # Informations version Windows
-            for os_info in c.Win32_OperatingSystem():
-                system_info['windows_version'] = self._clean_string(os_info.Version)
-                system_info['windows_build'] = self._clean_string(os_info.BuildNumber)
-                system_info['windows_caption'] = self._clean_string(os_info.Caption)
-                system_info['windows_architecture'] = self._clean_string(os_info.OSArchitecture)
-                system_info['install_date'] = os_info.InstallDate
-                system_info['last_boot_time'] = os_info.LastBootUpTime
-                system_info['system_directory'] = self._clean_string(os_info.SystemDirectory)
-                system_info['windows_directory'] = self._clean_string(os_info.WindowsDirectory)
-                system_info['registered_user'] = self._clean_string(os_info.RegisteredUser)
-                system_info['organization'] = self._clean_string(os_info.Organization)
-                system_info['serial_number'] = self._clean_string(os_info.SerialNumber)
-                break
+            os_info = rows['operating_system']
+            if os_info is not None:
+                system_info['windows_version'] = self._clean_string(os_info['Version'])
+                system_info['windows_build'] = self._clean_string(os_info['BuildNumber'])
+                system_info['windows_caption'] = self._clean_string(os_info['Caption'])
+                system_info['windows_architecture'] = self._clean_string(os_info['OSArchitecture'])
+                system_info['install_date'] = os_info['InstallDate']
+                system_info['last_boot_time'] = os_info['LastBootUpTime']
+                system_info['system_directory'] = self._clean_string(os_info['SystemDirectory'])
+                system_info['windows_directory'] = self._clean_string(os_info['WindowsDirectory'])
+                system_info['registered_user'] = self._clean_string(os_info['RegisteredUser'])
+                system_info['organization'] = self._clean_string(os_info['Organization'])
+                system_info['serial_number'] = self._clean_string(os_info['SerialNumber'])
 
             # Informations processeur spécifiques Windows
-            for processor in c.Win32_Processor():
-                system_info['processor_id'] = self._clean_string(processor.ProcessorId)
-                system_info['processor_revision'] = processor.Revision
-                break
+            processor = rows['processor']
+            if processor is not None:
+                system_info['processor_id'] = self._clean_string(processor['ProcessorId'])
+                system_info['processor_revision'] = processor['Revision']
 
-        except ImportError:
-            self.logger.warning("Module WMI non disponible")
         except Exception as e:
             self.logger.error(f"Erreur collecte système Windows: {e}")
 
         return system_info
 
-    def _collect_windows_services(self) -> Dict[str, Any]:
+    def _collect_windows_services(self, limit: Optional[int] = SERVICES_LIMIT) -> Dict[str, Any]:
         """
         Collecte les services Windows
 
+        Args:
+            limit: Nombre maximum de services détaillés (None pour tous)
+
         Returns:
-            dict: Informations sur les services Windows
+            dict: Informations sur les services Windows (une liste par colonne)
         """
         services_info = {
             'total_services': 0,
             'running_services': 0,
             'stopped_services': 0,
-            'services': []
+            **to_columns([], SERVICE_COLUMNS)
         }
 
+        # API native du gestionnaire de services, bien plus rapide que WMI
+        native_info = self._enum_services_native(limit)
+        if native_info is not None:
+            return native_info
+
+        if not self._wmi_available:
+            return services_info
+
         try:
-            import wmi
-            c = wmi.WMI()
-
-            all_services = list(c.Win32_Service())
-            services_info['total_services'] = len(all_services)
-
-            for service in all_services:
-                service_info = {
-                    'name': self._clean_string(service.Name),
-                    'display_name': self._clean_string(service.DisplayName),
-                    'state': self._clean_string(service.State),
-                    'start_mode': self._clean_string(service.StartMode),
-                    'service_type': self._clean_string(service.ServiceType),
-                    'description': self._clean_string(service.Description)
-                }
-
-                # Compter les services par état
-                if service.State == 'Running':
-                    services_info['running_services'] += 1
-                elif service.State == 'Stopped':
-                    services_info['stopped_services'] += 1
-
-                services_info['services'].append(service_info)
-
-            # Limiter la liste pour éviter trop de données
-            services_info['services'] = services_info['services'][:100]
-
-        except ImportError:
-            self.logger.warning("Module WMI non disponible pour services")
+            # Totaux sur tous les services via une requête légère
+            # (WQL ne supporte pas COUNT(*))
+            all_states = self._wmi_query('service_states')
+            services_info['total_services'] = len(all_states)
+
+            # Compter les services par état
+            states = Counter(service['State'] for service in all_states)
+            services_info['running_services'] = states.get('Running', 0)
+            services_info['stopped_services'] = states.get('Stopped', 0)
+
+            _clean = self._clean_string
+
+            # Détails limités: l'énumération s'arrête à la limite
+            rows = [
+                (
+                    _clean(service['Name']),
+                    _clean(service['DisplayName']),
+                    _clean(service['State']),
+                    _clean(service['StartMode']),
+                    _clean(service['ServiceType']),
+                    _clean(service['Description'])
+                )
+                for service in self._wmi_query('services', limit=limit)
+            ]
+            services_info.update(to_columns(rows, SERVICE_COLUMNS))
+
         except Exception as e:
             self.logger.error(f"Erreur collecte services Windows: {e}")
 
         return services_info
 
+    def _get_advapi32(self):
+        """
+        Charge advapi32 via ctypes (une seule fois par processus)
+
+        Returns:
+            ctypes.WinDLL: Bibliothèque advapi32 ou None si indisponible
+        """
+        if WindowsCollector._advapi32 is None:
+            try:
+                advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+
+                # Les handles SC_HANDLE sont des pointeurs (64 bits sur x64)
+                advapi32.OpenSCManagerW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_uint32]
+                advapi32.OpenSCManagerW.restype = ctypes.c_void_p
+                advapi32.OpenServiceW.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_uint32]
+                advapi32.OpenServiceW.restype = ctypes.c_void_p
+                advapi32.CloseServiceHandle.argtypes = [ctypes.c_void_p]
+                advapi32.EnumServicesStatusExW.argtypes = [
+                    ctypes.c_void_p, ctypes.c_int, ctypes.c_uint32, ctypes.c_uint32,
+                    ctypes.c_void_p, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32),
+                    ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32),
+                    ctypes.c_wchar_p
+                ]
+                advapi32.QueryServiceConfigW.argtypes = [
+                    ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32,
+                    ctypes.POINTER(ctypes.c_uint32)
+                ]
+                advapi32.QueryServiceConfig2W.argtypes = [
+                    ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32,
+                    ctypes.POINTER(ctypes.c_uint32)
+                ]
+                WindowsCollector._advapi32 = advapi32
+            except (AttributeError, OSError) as e:
+                self.logger.debug(f"advapi32 indisponible: {e}")
+                WindowsCollector._advapi32 = False
+
+        return WindowsCollector._advapi32 or None
+
+    def _enum_services_native(self, limit: Optional[int] = SERVICES_LIMIT) -> Optional[Dict[str, Any]]:
+        """
+        Énumère les services via EnumServicesStatusExW
+
+        Un seul appel remplit un tableau contigu ENUM_SERVICE_STATUS_PROCESSW
+        pour tous les services, sans passer par DCOM. Le mode de démarrage et
+        la description ne sont interrogés que pour les services conservés.
+
+        Args:
+            limit: Nombre maximum de services détaillés (None pour tous)
+
+        Returns:
+            dict: Informations services (même format que la collecte WMI)
+                  ou None si l'API native est indisponible
+        """
+        advapi32 = self._get_advapi32()
+        if advapi32 is None:
+            return None
+
+        scm = advapi32.OpenSCManagerW(None, None, SC_MANAGER_CONNECT | SC_MANAGER_ENUMERATE_SERVICE)
+        if not scm:
+            self.logger.debug(f"OpenSCManagerW échoué (erreur {ctypes.get_last_error()})")
+            return None
+
+        try:
+            needed = ctypes.c_uint32(0)
+            returned = ctypes.c_uint32(0)
+            buffer = None
+            buffer_size = 0
+
+            # Premier appel pour la taille, second pour le remplissage
+            # (un service créé entre les deux peut nécessiter un nouvel essai)
+            for _ in range(3):
+                resume = ctypes.c_uint32(0)
+                ok = advapi32.EnumServicesStatusExW(
+                    scm, SC_ENUM_PROCESS_INFO, SERVICE_WIN32, SERVICE_STATE_ALL,
+                    buffer, buffer_size, ctypes.byref(needed), ctypes.byref(returned),
+                    ctypes.byref(resume), None
+                )
+                if ok:
+                    break
+
+                error = ctypes.get_last_error()
+                if error != ERROR_MORE_DATA:
+                    self.logger.debug(f"EnumServicesStatusExW échoué (erreur {error})")
+                    return None
+
+                buffer_size = needed.value
+                buffer = (ctypes.c_byte * buffer_size)()
+            else:
+                return None
+
+            total = returned.value
+            detailed = total if limit is None else min(limit, total)
+            entries = ctypes.cast(buffer, ctypes.POINTER(EnumServiceStatusProcess)) if total else []
+
+            rows = []
+            running = 0
+            stopped = 0
+
+            _clean = self._clean_string
+            append = rows.append
+
+            for index in range(total):
+                entry = entries[index]
+                status = entry.ServiceStatusProcess
+                state = status.dwCurrentState
+
+                if state == SERVICE_RUNNING:
+                    running += 1
+                elif state == SERVICE_STOPPED:
+                    stopped += 1
+
+                if index < detailed:
+                    start_mode, description = self._query_service_config(advapi32, scm, entry.lpServiceName)
+                    append((
+                        entry.lpServiceName or '',
+                        _clean(entry.lpDisplayName),
+                        SERVICE_STATES.get(state, 'Unknown'),
+                        start_mode,
+                        SERVICE_TYPES.get(status.dwServiceType & SERVICE_WIN32, 'Unknown'),
+                        _clean(description)
+                    ))
+
+            return {
+                'total_services': total,
+                'running_services': running,
+                'stopped_services': stopped,
+                **to_columns(rows, SERVICE_COLUMNS)
+            }
+
+        finally:
+            advapi32.CloseServiceHandle(scm)
+
+    def _query_service_config(self, advapi32, scm, service_name: str) -> Tuple[str, str]:
+        """
+        Récupère le mode de démarrage et la description d'un service
+
+        Args:
+            advapi32: Bibliothèque advapi32 chargée
+            scm: Handle du gestionnaire de services
+            service_name: Nom du service
+
+        Returns:
+            tuple: (mode de démarrage, description)
+        """
+        start_mode = ''
+        description = ''
+
+        service = advapi32.OpenServiceW(scm, service_name, SERVICE_QUERY_CONFIG)
+        if not service:
+            return start_mode, description
+
+        try:
+            needed = ctypes.c_uint32(0)
+
+            advapi32.QueryServiceConfigW(service, None, 0, ctypes.byref(needed))
+            if ctypes.get_last_error() == ERROR_INSUFFICIENT_BUFFER:
+                buffer = (ctypes.c_byte * needed.value)()
+                if advapi32.QueryServiceConfigW(service, buffer, needed.value, ctypes.byref(needed)):
+                    config = ctypes.cast(buffer, ctypes.POINTER(QueryServiceConfig)).contents
+                    start_mode = SERVICE_START_MODES.get(config.dwStartType, '')
+
+            advapi32.QueryServiceConfig2W(service, SERVICE_CONFIG_DESCRIPTION, None, 0, ctypes.byref(needed))
+            if ctypes.get_last_error() == ERROR_INSUFFICIENT_BUFFER:
+                buffer = (ctypes.c_byte * needed.value)()
+                if advapi32.QueryServiceConfig2W(service, SERVICE_CONFIG_DESCRIPTION, buffer,
+                                                 needed.value, ctypes.byref(needed)):
+                    description = ctypes.cast(buffer, ctypes.POINTER(ServiceDescription)).contents.lpDescription or ''
+
+        finally:
+            advapi32.CloseServiceHandle(service)
+
+        return start_mode, description
+
     def _collect_domain_info(self) -> Dict[str, Any]:
         """
         Collecte les informations domaine/workgroup
@@ -176,29 +869,27 @@ class WindowsCollector(BaseCollector):
         """
         domain_info = {}
 
-        try:
-            import wmi
-            c = wmi.WMI()
+        if not self._wmi_available:
+            return domain_info
 
+        try:
             # Informations domaine depuis ComputerSystem
-            for system in c.Win32_ComputerSystem():
-                domain_info['current_domain'] = self._clean_string(system.Domain)
-                domain_info['part_of_domain'] = system.PartOfDomain
-                domain_info['workgroup'] = self._clean_string(system.Workgroup)
-                break
+            system = self._get_wmi_row('computer_system')
+            if system is not None:
+                domain_info['current_domain'] = self._clean_string(system['Domain'])
+                domain_info['part_of_domain'] = system['PartOfDomain']
+                domain_info['workgroup'] = self._clean_string(system['Workgroup'])
 
             # Informations contrôleur de domaine
             try:
-                for dc in c.Win32_NTDomain():
-                    domain_info['domain_controller_name'] = self._clean_string(dc.DomainControllerName)
-                    domain_info['domain_controller_address'] = self._clean_string(dc.DomainControllerAddress)
+                for dc in self._wmi_query('nt_domain'):
+                    domain_info['domain_controller_name'] = self._clean_string(dc['DomainControllerName'])
+                    domain_info['domain_controller_address'] = self._clean_string(dc['DomainControllerAddress'])
                     break
             except Exception:
                 # Pas de contrôleur de domaine (machine workgroup)
                 pass
 
-        except ImportError:
-            self.logger.warning("Module WMI non disponible pour domaine")
         except Exception as e:
             self.logger.error(f"Erreur collecte domaine: {e}")
 
@@ -209,42 +900,214 @@ class WindowsCollector(BaseCollector):
         Collecte les fonctionnalités Windows installées
 
         Returns:
-            dict: Fonctionnalités Windows
+            dict: Fonctionnalités Windows (une liste par colonne)
         """
         features_info = {
-            'installed_features': [],
+            **to_columns([], FEATURE_COLUMNS),
             'total_features': 0
         }
 
         try:
-            # Utiliser PowerShell pour récupérer les fonctionnalités
-            ps_command = "Get-WindowsFeature | Where-Object {$_.InstallState -eq 'Installed'} | Select-Object Name, DisplayName | ConvertTo-Json"
+            # API DISM native, sinon Win32_OptionalFeature
+            features = self._enum_features_native()
+
+            if features is None and self._wmi_available:
+                features = [
+                    (self._clean_string(feature['Name']), self._clean_string(feature['Caption']))
+                    for feature in self._wmi_query('optional_features')
+                ]
+
+            features = features or []
+            features_info.update(to_columns(features, FEATURE_COLUMNS))
+            features_info['total_features'] = len(features)
+
+        except Exception as e:
+            self.logger.debug(f"Erreur collecte fonctionnalités Windows: {e}")
+
+        return features_info
+
+    def _enum_features_native(self) -> Optional[List[tuple]]:
+        """
+        Énumère les fonctionnalités optionnelles installées via l'API DISM
 
-            output = self._execute_command(f'powershell -Command "{ps_command}"')
-            if output:
+        Une session DISM sur l'image en ligne remplace le lancement de
+        PowerShell et fonctionne aussi sur les éditions client. L'API ne
+        fournit pas de nom d'affichage sans un appel par fonctionnalité:
+        le nom technique est repris.
+
+        Returns:
+            list: Fonctionnalités installées (nom, nom affiché)
+                  ou None si l'API est indisponible
+                  (DLL absente ou droits administrateur manquants)
+        """
+        try:
+            dismapi = ctypes.WinDLL('dismapi')
+        except (AttributeError, OSError) as e:
+            self.logger.debug(f"dismapi indisponible: {e}")
+            return None
+
+        dismapi.DismInitialize.argtypes = [ctypes.c_int, ctypes.c_wchar_p, ctypes.c_wchar_p]
+        dismapi.DismOpenSession.argtypes = [
+            ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_wchar_p,
+            ctypes.POINTER(ctypes.c_uint)
+        ]
+        dismapi.DismGetFeatures.argtypes = [
+            ctypes.c_uint, ctypes.c_wchar_p, ctypes.c_int,
+            ctypes.POINTER(ctypes.POINTER(DismFeature)), ctypes.POINTER(ctypes.c_uint)
+        ]
+        dismapi.DismDelete.argtypes = [ctypes.c_void_p]
+        dismapi.DismCloseSession.argtypes = [ctypes.c_uint]
+
+        result = dismapi.DismInitialize(DISM_LOG_ERRORS, None, None)
+        if result < 0:
+            self.logger.debug(f"DismInitialize échoué (0x{result & 0xFFFFFFFF:08X})")
+            return None
+
+        try:
+            session = ctypes.c_uint(0)
+            result = dismapi.DismOpenSession(DISM_ONLINE_IMAGE, None, None, ctypes.byref(session))
+            if result < 0:
+                self.logger.debug(f"DismOpenSession échoué (0x{result & 0xFFFFFFFF:08X})")
+                return None
+
+            try:
+                features_ptr = ctypes.POINTER(DismFeature)()
+                count = ctypes.c_uint(0)
+                result = dismapi.DismGetFeatures(
+                    session, None, DISM_PACKAGE_NONE,
+                    ctypes.byref(features_ptr), ctypes.byref(count)
+                )
+                if result < 0:
+                    self.logger.debug(f"DismGetFeatures échoué (0x{result & 0xFFFFFFFF:08X})")
+                    return None
+
+                try:
+                    features = []
+                    for index in range(count.value):
+                        feature = features_ptr[index]
+                        if feature.State == DISM_STATE_INSTALLED:
+                            name = feature.FeatureName or ''
+                            features.append((name, name))
+                    return features
+                finally:
+                    dismapi.DismDelete(features_ptr)
+
+            finally:
+                dismapi.DismCloseSession(session)
+
+        finally:
+            dismapi.DismShutdown()
+
+    def _get_ps_bundle(self) -> Dict[str, Any]:
+        """
+        Exécute le script PowerShell groupé (une seule fois par collecte)
+
+        Le démarrage du moteur PowerShell domine le coût de chaque appel:
+        toutes les données PowerShell sont récupérées en un seul script,
+        partagé par les sections qui en ont besoin, et exécuté dans le
+        processus PowerShell persistant.
+
+        Returns:
+            dict: Document JSON du script ('firewall') ou {}
+        """
+        with self._ps_bundle_lock:
+            if self._ps_bundle is None:
+                bundle = {}
+                output = self._ps_eval(PS_BUNDLE_SCRIPT)
+                if output is None:
+                    # Repli: lancement ponctuel de PowerShell
+                    output = self._execute_command(
+                        [self._powershell, '-NoProfile', '-NonInteractive', '-Command', PS_BUNDLE_SCRIPT],
+                        timeout=POWERSHELL_TIMEOUT
+                    )
+                if output:
+                    try:
+                        bundle = json_loads(output)
+                    except json.JSONDecodeError:
+                        self.logger.debug("Erreur parsing JSON PowerShell")
+                self._ps_bundle = bundle if isinstance(bundle, dict) else {}
+            return self._ps_bundle
+
+    def _ps_eval(self, script: str) -> Optional[str]:
+        """
+        Exécute un script dans le processus PowerShell persistant
+
+        Le processus lit ses commandes sur l'entrée standard (-Command -):
+        le coût de démarrage du moteur n'est payé qu'une fois pour toute
+        la durée de vie de l'agent. Chaque script est suivi de l'écriture
+        d'une sentinelle qui délimite sa sortie.
+
+        Args:
+            script: Script PowerShell (une seule ligne)
+
+        Returns:
+            str: Sortie du script ou None en cas d'échec
+        """
+        with self._ps_lock:
+            if self._ps_process is None or self._ps_process.poll() is not None:
                 try:
-                    features_data = json.loads(output)
+                    self._ps_process = subprocess.Popen(
+                        [self._powershell, '-NoProfile', '-NoLogo', '-NonInteractive', '-Command', '-'],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        errors='replace',
+                        bufsize=1,
+                        creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+                    )
+                except OSError as e:
+                    self.logger.debug(f"Démarrage PowerShell persistant impossible: {e}")
+                    self._ps_process = None
+                    return None
+
+            process = self._ps_process
+            sentinel = self._ps_sentinel
+
+            def read_output():
+                lines = []
+                for line in process.stdout:
+                    line = line.rstrip('\r\n')
+                    if line == sentinel:
+                        return '\n'.join(lines).strip()
+                    lines.append(line)
+                return None
 
-                    # Gérer le cas d'un seul élément
-                    if isinstance(features_data, dict):
-                        features_data = [features_data]
+            try:
+                process.stdin.write(f"{script}\nWrite-Output '{sentinel}'\n")
+                process.stdin.flush()
 
-                    for feature in features_data:
-                        feature_info = {
-                            'name': feature.get('Name', ''),
-                            'display_name': feature.get('DisplayName', '')
-                        }
-                        features_info['installed_features'].append(feature_info)
+                if self._ps_reader is None:
+                    self._ps_reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix='powershell')
+                output = self._ps_reader.submit(read_output).result(timeout=POWERSHELL_TIMEOUT)
 
-                    features_info['total_features'] = len(features_info['installed_features'])
+            except FutureTimeoutError:
+                self.logger.warning("Timeout du processus PowerShell persistant")
+                output = None
+            except OSError as e:
+                self.logger.debug(f"Erreur processus PowerShell persistant: {e}")
+                output = None
 
-                except json.JSONDecodeError:
-                    self.logger.debug("Erreur parsing JSON fonctionnalités Windows")
+            # Processus bloqué ou terminé: il sera relancé au prochain script
+            if output is None:
+                self._stop_powershell()
 
-        except Exception as e:
-            self.logger.debug(f"Erreur collecte fonctionnalités Windows: {e}")
+            return output
 
-        return features_info
+    def _stop_powershell(self):
+        """
+        Termine le processus PowerShell persistant s'il est actif
+        """
+        process = getattr(self, '_ps_process', None)
+        if process is None:
+            return
+
+        self._ps_process = None
+        try:
+            process.kill()
+            process.wait(timeout=5)
+        except Exception:
+            pass
 
     def _collect_security_info(self) -> Dict[str, Any]:
         """
@@ -255,38 +1118,34 @@ class WindowsCollector(BaseCollector):
         """
         security_info = {}
 
-        try:
-            import wmi
-            c = wmi.WMI()
+        if not self._wmi_available:
+            return security_info
 
+        try:
             # Antivirus installés
             security_info['antivirus'] = []
             try:
-                for av in c.Win32_VirusCheckResult():
+                for av in self._wmi_query('antivirus'):
                     av_info = {
-                        'name': self._clean_string(av.DisplayName),
-                        'instance_guid': self._clean_string(av.InstanceGuid),
-                        'path_to_signature_file': self._clean_string(av.PathToSignedProductExe)
+                        'name': self._clean_string(av['DisplayName']),
+                        'instance_guid': self._clean_string(av['InstanceGuid']),
+                        'path_to_signature_file': self._clean_string(av['PathToSignedProductExe'])
                     }
                     security_info['antivirus'].append(av_info)
             except Exception:
                 # Win32_VirusCheckResult peut ne pas être disponible
                 pass
 
-            # Pare-feu Windows
+            # Pare-feu Windows (script PowerShell groupé)
             try:
-                ps_command = "Get-NetFirewallProfile | Select-Object Name, Enabled | ConvertTo-Json"
-                output = self._execute_command(f'powershell -Command "{ps_command}"')
-                if output:
-                    firewall_data = json.loads(output)
+                firewall_data = self._get_ps_bundle().get('firewall')
+                if firewall_data:
                     if isinstance(firewall_data, dict):
                         firewall_data = [firewall_data]
                     security_info['firewall_profiles'] = firewall_data
             except Exception:
                 pass
 
-        except ImportError:
-            self.logger.warning("Module WMI non disponible pour sécurité")
         except Exception as e:
             self.logger.error(f"Erreur collecte sécurité Windows: {e}")
 
@@ -297,89 +1156,168 @@ class WindowsCollector(BaseCollector):
         Collecte les utilisateurs locaux Windows
 
         Returns:
-            dict: Informations utilisateurs locaux
+            dict: Informations utilisateurs locaux (une liste par colonne)
         """
         users_info = {
-            'local_users': [],
+            **to_columns([], USER_COLUMNS),
             'total_users': 0
         }
 
         try:
-            import wmi
-            c = wmi.WMI()
-
-            for user in c.Win32_UserAccount(LocalAccount=True):
-                user_info = {
-                    'name': self._clean_string(user.Name),
-                    'full_name': self._clean_string(user.FullName),
-                    'description': self._clean_string(user.Description),
-                    'disabled': user.Disabled,
-                    'locked_out': user.Lockout,
-                    'password_required': user.PasswordRequired,
-                    'password_changeable': user.PasswordChangeable,
-                    'password_expires': user.PasswordExpires,
-                    'account_type': user.AccountType,
-                    'sid': self._clean_string(user.SID)
-                }
-                users_info['local_users'].append(user_info)
-
-            users_info['total_users'] = len(users_info['local_users'])
-
-        except ImportError:
-            self.logger.warning("Module WMI non disponible pour utilisateurs")
+            # API NetUser native, sinon Win32_UserAccount
+            users = self._enum_local_users_native()
+
+            if users is None and self._wmi_available:
+                _clean = self._clean_string
+
+                users = [
+                    (
+                        _clean(user['Name']),
+                        _clean(user['FullName']),
+                        _clean(user['Description']),
+                        user['Disabled'],
+                        user['Lockout'],
+                        user['PasswordRequired'],
+                        user['PasswordChangeable'],
+                        user['PasswordExpires'],
+                        user['AccountType'],
+                        _clean(user['SID'])
+                    )
+                    for user in self._wmi_query('local_users')
+                ]
+
+            users = users or []
+            users_info.update(to_columns(users, USER_COLUMNS))
+            users_info['total_users'] = len(users)
+
         except Exception as e:
             self.logger.error(f"Erreur collecte utilisateurs Windows: {e}")
 
         return users_info
 
+    def _enum_local_users_native(self) -> Optional[List[tuple]]:
+        """
+        Énumère les comptes locaux via NetUserEnum (niveau 2)
+
+        L'API NetUser interroge directement la base SAM, sans le fournisseur
+        Win32_UserAccount qui parcourt aussi les domaines approuvés.
+
+        Returns:
+            list: Utilisateurs locaux (lignes ordonnées comme USER_COLUMNS)
+                  ou None si pywin32 est indisponible
+        """
+        if win32net is None:
+            return None
+
+        _clean = self._clean_string
+        users = []
+        resume = 0
+
+        try:
+            while True:
+                data, _, resume = win32net.NetUserEnum(
+                    None, 2, win32netcon.FILTER_NORMAL_ACCOUNT,
+                    resume, win32netcon.MAX_PREFERRED_LENGTH
+                )
+
+                for user in data:
+                    flags = user['flags']
+
+                    try:
+                        sid = win32security.ConvertSidToStringSid(
+                            win32security.LookupAccountName(None, user['name'])[0]
+                        )
+                    except Exception:
+                        sid = ''
+
+                    users.append((
+                        _clean(user['name']),
+                        _clean(user['full_name']),
+                        _clean(user['comment']),
+                        bool(flags & win32netcon.UF_ACCOUNTDISABLE),
+                        bool(flags & win32netcon.UF_LOCKOUT),
+                        not flags & win32netcon.UF_PASSWD_NOTREQD,
+                        not flags & win32netcon.UF_PASSWD_CANT_CHANGE,
+                        not flags & win32netcon.UF_DONT_EXPIRE_PASSWD,
+                        flags & win32netcon.UF_ACCOUNT_TYPE_MASK,
+                        sid
+                    ))
+
+                if not resume:
+                    break
+
+        except Exception as e:
+            self.logger.debug(f"NetUserEnum échoué: {e}")
+            return None
+
+        return users
+
     def _collect_windows_environment(self) -> Dict[str, Any]:
         """
         Collecte les variables d'environnement spécifiques Windows
 
+        Les variables sont lues directement dans le registre, là où Windows
+        les stocke, au lieu de deux énumérations Win32_Environment.
+
         Returns:
             dict: Variables d'environnement Windows
         """
         env_info = {}
 
-        try:
-            import wmi
-            c = wmi.WMI()
+        if winreg is None:
+            self.logger.warning("Module winreg non disponible pour environnement")
+            return env_info
 
+        try:
             # Variables d'environnement système
-            system_env = {}
-            for env_var in c.Win32_Environment(SystemVariable=True):
-                var_name = env_var.Name
-                var_value = env_var.VariableValue
-                if var_name and var_value:
-                    # Tronquer les valeurs très longues
-                    if len(var_value) > 200:
-                        var_value = var_value[:200] + "..."
-                    system_env[var_name] = var_value
-
-            env_info['system_variables'] = system_env
+            env_info['system_variables'] = self._read_registry_environment(
+                winreg.HKEY_LOCAL_MACHINE,
+                r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"
+            )
 
             # Variables d'environnement utilisateur courrant
-            user_env = {}
-            for env_var in c.Win32_Environment(SystemVariable=False):
-                var_name = env_var.Name
-                var_value = env_var.VariableValue
-                if var_name and var_value:
-                    if len(var_value) > 200:
-                        var_value = var_value[:200] + "..."
-                    user_env[var_name] = var_value
-
-            env_info['user_variables'] = user_env
+            env_info['user_variables'] = self._read_registry_environment(
+                winreg.HKEY_CURRENT_USER,
+                r"Environment"
+            )
 
-        except ImportError:
-            self.logger.warning("Module WMI non disponible pour environnement")
         except Exception as e:
             self.logger.error(f"Erreur collecte environnement Windows: {e}")
 
         return env_info
 
+    def _read_registry_environment(self, hive, subkey: str) -> Dict[str, str]:
+        """
+        Lit les variables d'environnement d'une clé de registre
+
+        Args:
+            hive: Ruche de registre (winreg.HKEY_*)
+            subkey: Chemin de la clé
+
+        Returns:
+            dict: Variables (nom -> valeur brute, non développée)
+        """
+        env_vars = {}
+
+        # Noms internés: PATH, TEMP, TMP... reviennent dans les deux portées
+        trunc = truncate
+        intern = sys.intern
+        enum_value = winreg.EnumValue
+
+        with winreg.OpenKey(hive, subkey) as key:
+            values_count = winreg.QueryInfoKey(key)[1]
+
+            for index in range(values_count):
+                var_name, var_value, _ = enum_value(key, index)
+                if var_name and var_value:
+                    # Tronquer les valeurs très longues
+                    env_vars[intern(var_name)] = trunc(str(var_value))
+
+        return env_vars
+
     def _collect_boot_info(self) -> Dict[str, Any]:
         """
-        Collecte les informations de démarrage Windows
+        Collecte la configuration de démarrage Windows (mise en cache)
 
         Returns:
             dict: Informations de démarrage
@@ -387,25 +1325,36 @@ class WindowsCollector(BaseCollector):
         boot_info = {}
 
         try:
-            import wmi
-            c = wmi.WMI()
-
             # Configuration de démarrage
-            for boot_config in c.Win32_BootConfiguration():
-                boot_info['boot_directory'] = self._clean_string(boot_config.BootDirectory)
-                boot_info['config_path'] = self._clean_string(boot_config.ConfigurationPath)
-                boot_info['temp_directory'] = self._clean_string(boot_config.TempDirectory)
-                break
-
-            # Informations démarrage depuis le système
-            for os_info in c.Win32_OperatingSystem():
-                boot_info['last_boot_time'] = os_info.LastBootUpTime
-                boot_info['system_up_time'] = os_info.SystemUpTime
-                break
-
-        except ImportError:
-            self.logger.warning("Module WMI non disponible pour démarrage")
+            if self._wmi_available:
+                for boot_config in self._wmi_query('boot_configuration', limit=1):
+                    boot_info['boot_directory'] = self._clean_string(boot_config['BootDirectory'])
+                    boot_info['config_path'] = self._clean_string(boot_config['ConfigurationPath'])
+                    boot_info['temp_directory'] = self._clean_string(boot_config['TempDirectory'])
+
         except Exception as e:
             self.logger.error(f"Erreur collecte démarrage Windows: {e}")
 
-        return boot_info
\ No newline at end of file
+        return boot_info
+
+    def _get_uptime_info(self) -> Dict[str, Any]:
+        """
+        Mesure le temps de fonctionnement depuis le noyau
+
+        Returns:
+            dict: system_up_time (secondes) et last_boot_time
+        """
+        try:
+            # Millisecondes depuis le démarrage
+            kernel32 = ctypes.WinDLL('kernel32')
+            kernel32.GetTickCount64.restype = ctypes.c_uint64
+            uptime_ms = kernel32.GetTickCount64()
+
+            return {
+                'system_up_time': uptime_ms // 1000,
+                'last_boot_time': datetime.fromtimestamp(time.time() - uptime_ms / 1000).isoformat()
+            }
+
+        except Exception as e:
+            self.logger.error(f"Erreur collecte démarrage Windows: {e}")
+            return {}
\ No newline at end of file
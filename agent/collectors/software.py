@@ -8,12 +8,142 @@ Ce module collecte la liste des applications et logiciels installés :
 - Support multi-plateforme (Windows, Linux, macOS)
 """
 
+import os
 import sys
 import re
+import glob
 import json
-from typing import List, Dict, Any, Optional
+import time
+import shutil
+import heapq
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Any, Optional, Tuple, Callable
+
+from .base import BaseCollector, json_loads, PLATFORM_UNAME
+
+# Nombre d'applications à partir duquel le registre est jugé suffisant
+# (les sources Windows suivantes ne sont alors pas interrogées)
+REGISTRY_MIN_RESULTS = 10
+
+# Requête WMI de repli (projection limitée aux champs utilisés)
+WQL_INSTALLED_PROGRAMS = "SELECT Name, Version, Vendor FROM Win32_InstalledWin32Program"
+
+# Options SWbemServices.ExecQuery: énumérateur semi-synchrone, en avant seulement
+WBEM_FLAG_RETURN_IMMEDIATELY = 0x10
+WBEM_FLAG_FORWARD_ONLY = 0x20
+WBEM_QUERY_FLAGS = WBEM_FLAG_RETURN_IMMEDIATELY | WBEM_FLAG_FORWARD_ONLY
+
+# Délai maximum accordé à chaque source de paquets collectée en parallèle,
+# et à chaque commande de gestionnaire de paquets
+SOURCE_TIMEOUT = 15
+COMMAND_TIMEOUT = 15
+
+# system_profiler SPApplicationsDataType prend couramment 15 à 30 s:
+# délai propre, pour la commande comme pour la source
+SYSTEM_PROFILER_TIMEOUT = 60
+SOURCE_TIMEOUTS = {'system_profiler': SYSTEM_PROFILER_TIMEOUT}
+
+# Commande rpm de repli (exécutée sans shell: rpm interprète lui-même \n)
+RPM_QUERY_COMMAND = ['rpm', '-qa', '--queryformat', '%{NAME} %{VERSION}-%{RELEASE}\\n']
+
+# Dossier des applications macOS et nombre de lectures de plist simultanées
+MACOS_APPLICATIONS_PATH = "/Applications"
+PLIST_WORKERS = 8
+
+# Cache disque des listes de paquets, invalidé par la date de modification
+# des bases de paquets correspondantes
+SOFTWARE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'agent_client', 'software.json')
+
+# Âge maximal (secondes) d'une liste en cache, même si l'empreinte de sa
+# source n'a pas changé
+SOFTWARE_CACHE_MAX_AGE = 24 * 3600
+
+# Fichiers/dossiers dont les dates de modification identifient l'état de
+# chaque source (réécrits à chaque installation, mise à jour ou suppression)
+SOURCE_DB_PATHS = {
+    'dpkg': ['/var/lib/dpkg/status'],
+    'rpm': ['/var/cache/dnf/packages.db', '/var/lib/rpm/rpmdb.sqlite', '/var/lib/rpm/Packages'],
+    'pacman': ['/var/lib/pacman/local'],
+    'snap': ['/var/lib/snapd/state.json'],
+    'flatpak': ['/var/lib/flatpak/app'],
+    'applications': [MACOS_APPLICATIONS_PATH],
+    'homebrew': ['/usr/local/Cellar', '/opt/homebrew/Cellar'],
+}
+
+# Entrées par paquet des sources dont le dossier racine ne change pas lors
+# d'une mise à jour: Cellar/<formule> reçoit le dossier de la nouvelle
+# version, app/<id>/<arch>/<branche> le lien 'active' vers le nouveau
+# commit, et la mise à jour d'une application réécrit son Info.plist
+SOURCE_ENTRY_PATTERNS = {
+    'flatpak': ['/var/lib/flatpak/app/*/*/*'],
+    'applications': [os.path.join(MACOS_APPLICATIONS_PATH, '*.app', 'Contents', 'Info.plist')],
+    'homebrew': ['/usr/local/Cellar/*', '/opt/homebrew/Cellar/*'],
+}
+
+# Clés Uninstall du registre Windows (HKLM)
+REGISTRY_UNINSTALL_PATHS = [
+    r"SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall",
+    r"SOFTWARE\\WOW6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall"
+]
+
+# Constantes de l'API registre (advapi32)
+KEY_READ = 0x20019
+REG_SZ = 1
+REG_EXPAND_SZ = 2
+REG_DWORD = 4
+ERROR_SUCCESS = 0
+ERROR_MORE_DATA = 234
+REGISTRY_VALUE_BUFFER_CHARS = 512
+
+# Commande PowerShell de repli: lecture des mêmes clés Uninstall que le
+# registre (Win32_Product est évité pour les mêmes raisons qu'en WMI)
+PS_UNINSTALL_COMMAND = (
+    "Get-ItemProperty "
+    "'HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*',"
+    "'HKLM:\\SOFTWARE\\Wow6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*' "
+    "-ErrorAction SilentlyContinue | "
+    "Where-Object DisplayName | "
+    "Select-Object DisplayName, DisplayVersion, Publisher | "
+    "ConvertTo-Json -Compress"
+)
+
+# Base SQLite des paquets installés maintenue par DNF
+DNF_PACKAGES_DB = "/var/cache/dnf/packages.db"
+
+# Base locale pacman, points de montage snap et installations Flatpak
+PACMAN_LOCAL_DB = "/var/lib/pacman/local"
+SNAP_MOUNT_DIR = "/snap"
+SNAP_VERSION_RE = re.compile(rb'^version:\s*[\'"]?([^\'"\r\n]+?)[\'"]?\s*$', re.M)
+FLATPAK_SYSTEM_APPS = "/var/lib/flatpak/app"
+FLATPAK_USER_APPS = "~/.local/share/flatpak/app"
+FLATPAK_METAINFO_PATHS = (
+    "files/share/metainfo/{app_id}.metainfo.xml",
+    "files/share/metainfo/{app_id}.appdata.xml",
+    "files/share/appdata/{app_id}.appdata.xml",
+)
+
+# Fichiers os-release (par ordre de priorité) et clés extraites
+OS_RELEASE_PATHS = ("/etc/os-release", "/usr/lib/os-release")
+OS_RELEASE_RE = re.compile(rb'^(NAME|VERSION)=(.*)$', re.M)
+
+# Fichier d'état dpkg et champs extraits de chaque paragraphe
+DPKG_STATUS_FILE = "/var/lib/dpkg/status"
+DPKG_FIELD_RE = re.compile(rb'^(Package|Version|Status): *(.*?)\s*$', re.M)
+
+
+def application_sort_key(app: Dict[str, Any]) -> str:
+    """
+    Clé de tri (et de regroupement) d'une application: son nom normalisé
+
+    Args:
+        app: Application
 
-from .base import BaseCollector
+    Returns:
+        str: Nom sans distinction de casse
+    """
+    return app['name'].casefold()
 
 
 class SoftwareCollector(BaseCollector):
@@ -24,6 +154,17 @@ class SoftwareCollector(BaseCollector):
     pour récupérer la liste complète des logiciels installés.
     """
 
+    # advapi32 chargé via ctypes (partagé par toutes les instances)
+    _advapi32 = None
+
+    # Modules spécifiques à une plateforme, importés à la première
+    # utilisation (False: module indisponible)
+    _lazy_modules: Dict[str, Any] = {}
+
+    # Protège le cache disque contre les sources encore en cours après
+    # leur délai (leur thread n'est pas interrompu)
+    _disk_cache_lock = threading.Lock()
+
     def collect(self) -> List[Dict[str, Any]]:
         """
         Collecte tous les logiciels installés
@@ -33,32 +174,62 @@ class SoftwareCollector(BaseCollector):
         """
         self._start_collection()
 
-        applications = []
+        # Listes par source, chacune triée par nom
+        sources = []
+        self._disk_cache = self._load_disk_cache()
+        self._disk_cache_dirty = False
 
         # Ajouter le système d'exploitation comme première "application"
         os_info = self._get_os_application()
         if os_info:
-            applications.append(os_info)
+            sources.append([os_info])
 
         # Collecte spécifique à la plateforme
         if sys.platform == "win32":
-            applications.extend(self._collect_windows_software())
+            sources.extend(self._collect_windows_software())
         elif sys.platform == "darwin":
-            applications.extend(self._collect_macos_software())
+            sources.extend(self._collect_macos_software())
         else:
-            applications.extend(self._collect_linux_software())
+            sources.extend(self._collect_linux_software())
 
         # Ajouter des logiciels détectés via des méthodes génériques
-        applications.extend(self._collect_generic_software())
+        sources.append(self._cached_source('generic', self._collect_generic_software))
+
+        # Fusionner, nettoyer et déduplicater
+        applications = self._cleanup_applications(sources)
 
-        # Nettoyer et déduplicater
-        applications = self._cleanup_applications(applications)
+        if self._disk_cache_dirty:
+            self._save_disk_cache()
 
         self.logger.info(f"Collecté {len(applications)} applications")
         self.last_collection_duration = self._end_collection()
 
         return applications
 
+    def _lazy_import(self, module_name: str):
+        """
+        Importe un module à la demande et le conserve au niveau de la classe
+
+        Les modules propres à une plateforme (winreg, wmi, plistlib,
+        sqlite3...) ne sont ainsi chargés que si la collecte en a besoin.
+
+        Args:
+            module_name: Nom du module
+
+        Returns:
+            module: Module importé ou None s'il est indisponible
+        """
+        module = SoftwareCollector._lazy_modules.get(module_name)
+        if module is None:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                self.logger.debug(f"Module {module_name} non disponible")
+                module = False
+            SoftwareCollector._lazy_modules[module_name] = module
+
+        return module or None
+
     def _get_os_application(self) -> Optional[Dict[str, Any]]:
         """
         Crée une entrée pour le système d'exploitation
@@ -72,7 +243,7 @@ class SoftwareCollector(BaseCollector):
             if sys.platform == "win32":
                 # Windows
                 os_name = "Microsoft Windows"
-                os_version = platform.release()
+                os_version = PLATFORM_UNAME.release
                 os_vendor = "Microsoft Corporation"
 
                 # Essayer de récupérer la version détaillée
@@ -87,33 +258,22 @@ class SoftwareCollector(BaseCollector):
                 # macOS
                 os_name = "macOS"
                 mac_version = platform.mac_ver()[0]
-                os_version = mac_version if mac_version else platform.release()
+                os_version = mac_version if mac_version else PLATFORM_UNAME.release
                 os_vendor = "Apple Inc."
 
             else:
                 # Linux et autres Unix
-                os_name = platform.system()
-                os_version = platform.release()
+                os_name = PLATFORM_UNAME.system
+                os_version = PLATFORM_UNAME.release
                 os_vendor = "Open Source"
 
-                # Essayer de récupérer des infos plus précises depuis /etc/os-release
-                try:
-                    with open('/etc/os-release', 'r') as f:
-                        lines = f.readlines()
-
-                    os_info = {}
-                    for line in lines:
-                        if '=' in line:
-                            key, value = line.strip().split('=', 1)
-                            os_info[key] = value.strip('"')
+                # Essayer de récupérer des infos plus précises depuis os-release
+                os_info = self._read_os_release()
 
-                    if 'NAME' in os_info:
-                        os_name = os_info['NAME']
-                    if 'VERSION' in os_info:
-                        os_version = os_info['VERSION']
-
-                except FileNotFoundError:
-                    pass
+                if 'NAME' in os_info:
+                    os_name = os_info['NAME']
+                if 'VERSION' in os_info:
+                    os_version = os_info['VERSION']
 
             return {
                 'name': os_name,
@@ -126,56 +286,100 @@ class SoftwareCollector(BaseCollector):
             self.logger.warning(f"Erreur récupération infos OS: {e}")
             return None
 
-    def _collect_windows_software(self) -> List[Dict[str, Any]]:
+    def _read_os_release(self) -> Dict[str, str]:
         """
-        Collecte les logiciels installés sur Windows
+        Lit NAME et VERSION depuis os-release
+
+        /etc/os-release est prioritaire; /usr/lib/os-release est utilisé
+        s'il est absent (spécification freedesktop). Seules les deux clés
+        utiles sont extraites, en une recherche sur le contenu brut.
 
         Returns:
-            list: Applications Windows
+            dict: Clés trouvées (NAME, VERSION), vide si aucun fichier
         """
-        applications = []
+        for path in OS_RELEASE_PATHS:
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+
+            return {
+                key.decode(): value.strip().strip(b'"').decode('utf-8', 'replace')
+                for key, value in OS_RELEASE_RE.findall(data)
+            }
 
-        # Méthode 1: WMI
-        wmi_apps = self._collect_windows_wmi()
-        applications.extend(wmi_apps)
+        return {}
 
-        # Méthode 2: Registre Windows
-        registry_apps = self._collect_windows_registry()
-        applications.extend(registry_apps)
+    def _collect_windows_software(self) -> List[List[Dict[str, Any]]]:
+        """
+        Collecte les logiciels installés sur Windows
+
+        Le registre (clés Uninstall) est la source principale: il est
+        rapide et contient les mêmes informations que WMI. WMI puis
+        PowerShell ne sont interrogés que si le registre n'a rien donné
+        d'exploitable.
+
+        Returns:
+            list: Applications Windows, une liste triée par source
+        """
+        # Méthode 1: Registre Windows
+        sources = [self._cached_source('registry', self._collect_windows_registry)]
+        if sum(map(len, sources)) >= REGISTRY_MIN_RESULTS:
+            return sources
+
+        # Méthode 2: WMI (Win32_InstalledWin32Program)
+        sources.append(self._cached_source('wmi', self._collect_windows_wmi))
+        if sum(map(len, sources)) >= REGISTRY_MIN_RESULTS:
+            return sources
 
         # Méthode 3: PowerShell (si disponible)
-        ps_apps = self._collect_windows_powershell()
-        applications.extend(ps_apps)
+        sources.append(self._cached_source('powershell', self._collect_windows_powershell))
 
-        return applications
+        return sources
 
     def _collect_windows_wmi(self) -> List[Dict[str, Any]]:
         """
         Utilise WMI pour récupérer les logiciels Windows
 
+        Win32_Product n'est volontairement pas utilisé: son énumération
+        déclenche une vérification de cohérence MSI sur chaque produit
+        (lente et susceptible de lancer des réparations). La classe
+        Win32_InstalledWin32Program expose les mêmes informations sans
+        cet effet de bord.
+
         Returns:
             list: Applications via WMI
         """
+        clean = self._clean_string
+        parse = self._parse_version
         applications = []
 
+        wmi = self._lazy_import('wmi')
+        if wmi is None:
+            return applications
+
         try:
-            import wmi
-            c = wmi.WMI()
-
-            # Récupérer via Win32_Product (peut être lent)
-            for product in c.Win32_Product():
-                app = {
-                    'name': self._clean_string(product.Name),
-                    'version': self._parse_version(product.Version),
-                    'vendor': self._clean_string(product.Vendor),
+            c = wmi.WMI(find_classes=False)
+
+            # Énumérateur en avant seulement: les objets ne sont pas
+            # conservés par WMI pour un parcours ultérieur
+            rows = c._namespace.ExecQuery(WQL_INSTALLED_PROGRAMS, 'WQL', WBEM_QUERY_FLAGS)
+
+            for row in rows:
+                program = {prop.Name: prop.Value for prop in row.Properties_}
+                name = clean(program.get('Name'))
+                if not name:
+                    continue
+                applications.append({
+                    'name': name,
+                    'version': parse(program.get('Version')),
+                    'vendor': clean(program.get('Vendor')),
                     'type': 'application'
-                }
-                applications.append(app)
+                })
 
             self.logger.debug(f"WMI: {len(applications)} applications trouvées")
 
-        except ImportError:
-            self.logger.debug("Module WMI non disponible")
         except Exception as e:
             self.logger.warning(f"Erreur WMI: {e}")
 
@@ -190,16 +394,12 @@ class SoftwareCollector(BaseCollector):
         """
         applications = []
 
-        try:
-            import winreg
-
-            # Clés de registre à vérifier
-            registry_paths = [
-                r"SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall",
-                r"SOFTWARE\\WOW6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall"
-            ]
+        winreg = self._lazy_import('winreg')
+        if winreg is None:
+            return applications
 
-            for path in registry_paths:
+        try:
+            for path in REGISTRY_UNINSTALL_PATHS:
                 try:
                     key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path)
                     applications.extend(self._read_registry_software(key))
@@ -209,8 +409,6 @@ class SoftwareCollector(BaseCollector):
 
             self.logger.debug(f"Registre: {len(applications)} applications trouvées")
 
-        except ImportError:
-            self.logger.debug("Module winreg non disponible")
         except Exception as e:
             self.logger.warning(f"Erreur registre: {e}")
 
@@ -226,7 +424,20 @@ class SoftwareCollector(BaseCollector):
         Returns:
             list: Applications trouvées
         """
-        import winreg
+        applications = self._read_registry_software_native(key)
+        if applications is not None:
+            return applications
+
+        winreg = self._lazy_import('winreg')
+
+        # Références locales: évite les résolutions d'attributs par sous-clé
+        clean = self._clean_string
+        parse = self._parse_version
+        EnumKey = winreg.EnumKey
+        OpenKey = winreg.OpenKey
+        CloseKey = winreg.CloseKey
+        QueryValueEx = winreg.QueryValueEx
+
         applications = []
 
         try:
@@ -234,40 +445,40 @@ class SoftwareCollector(BaseCollector):
             i = 0
             while True:
                 try:
-                    subkey_name = winreg.EnumKey(key, i)
-                    subkey = winreg.OpenKey(key, subkey_name)
+                    subkey_name = EnumKey(key, i)
+                    subkey = OpenKey(key, subkey_name)
 
                     # Lire les informations de l'application
                     app_info = {}
 
                     try:
-                        app_info['name'] = winreg.QueryValueEx(subkey, "DisplayName")[0]
+                        app_info['name'] = QueryValueEx(subkey, "DisplayName")[0]
                     except FileNotFoundError:
                         # Pas de nom d'affichage, ignorer
-                        winreg.CloseKey(subkey)
+                        CloseKey(subkey)
                         i += 1
                         continue
 
                     try:
-                        app_info['version'] = winreg.QueryValueEx(subkey, "DisplayVersion")[0]
+                        app_info['version'] = QueryValueEx(subkey, "DisplayVersion")[0]
                     except FileNotFoundError:
                         app_info['version'] = "Unknown"
 
                     try:
-                        app_info['vendor'] = winreg.QueryValueEx(subkey, "Publisher")[0]
+                        app_info['vendor'] = QueryValueEx(subkey, "Publisher")[0]
                     except FileNotFoundError:
                         app_info['vendor'] = "Unknown"
 
                     # Nettoyer et ajouter
                     if app_info['name'] and app_info['name'].strip():
                         applications.append({
-                            'name': self._clean_string(app_info['name']),
-                            'version': self._parse_version(app_info['version']),
-                            'vendor': self._clean_string(app_info['vendor']),
+                            'name': clean(app_info['name']),
+                            'version': parse(app_info['version']),
+                            'vendor': clean(app_info['vendor']),
                             'type': 'application'
                         })
 
-                    winreg.CloseKey(subkey)
+                    CloseKey(subkey)
                     i += 1
 
                 except OSError:
@@ -279,6 +490,161 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
+    def _get_advapi32(self):
+        """
+        Charge advapi32 via ctypes (une seule fois par processus)
+
+        Returns:
+            ctypes.WinDLL: Bibliothèque advapi32 ou None si indisponible
+        """
+        if SoftwareCollector._advapi32 is None:
+            import ctypes
+
+            try:
+                advapi32 = ctypes.WinDLL('advapi32')
+                uint32_p = ctypes.POINTER(ctypes.c_uint32)
+
+                # Les HKEY sont des pointeurs (64 bits sur x64)
+                advapi32.RegQueryInfoKeyW.argtypes = [
+                    ctypes.c_void_p, ctypes.c_wchar_p, uint32_p, uint32_p,
+                    uint32_p, uint32_p, uint32_p, uint32_p, uint32_p, uint32_p,
+                    uint32_p, ctypes.c_void_p
+                ]
+                advapi32.RegEnumKeyExW.argtypes = [
+                    ctypes.c_void_p, ctypes.c_uint32, ctypes.c_wchar_p, uint32_p,
+                    uint32_p, ctypes.c_wchar_p, uint32_p, ctypes.c_void_p
+                ]
+                advapi32.RegOpenKeyExW.argtypes = [
+                    ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_uint32,
+                    ctypes.POINTER(ctypes.c_void_p)
+                ]
+                advapi32.RegQueryValueExW.argtypes = [
+                    ctypes.c_void_p, ctypes.c_wchar_p, uint32_p, uint32_p,
+                    ctypes.c_void_p, uint32_p
+                ]
+                advapi32.RegCloseKey.argtypes = [ctypes.c_void_p]
+                SoftwareCollector._advapi32 = advapi32
+            except (AttributeError, OSError) as e:
+                self.logger.debug(f"advapi32 indisponible: {e}")
+                SoftwareCollector._advapi32 = False
+
+        return SoftwareCollector._advapi32 or None
+
+    def _read_registry_software_native(self, key) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lit les applications d'une clé de registre via advapi32
+
+        RegQueryInfoKeyW donne en un appel le nombre de sous-clés et la
+        longueur maximale de leur nom: un seul tampon est alloué pour
+        toute l'énumération, et un seul pour la lecture des valeurs. Les
+        sous-clés sans DisplayName sont ignorées dès la première lecture.
+
+        Args:
+            key: Clé de registre ouverte (winreg)
+
+        Returns:
+            list: Applications trouvées ou None si advapi32 est indisponible
+        """
+        advapi32 = self._get_advapi32()
+        if advapi32 is None:
+            return None
+
+        import ctypes
+
+        clean = self._clean_string
+        parse = self._parse_version
+        RegEnumKeyExW = advapi32.RegEnumKeyExW
+        RegOpenKeyExW = advapi32.RegOpenKeyExW
+        RegCloseKey = advapi32.RegCloseKey
+        query_value = self._query_registry_value
+
+        hkey = ctypes.c_void_p(int(key))
+        subkey_count = ctypes.c_uint32()
+        max_name_length = ctypes.c_uint32()
+
+        status = advapi32.RegQueryInfoKeyW(
+            hkey, None, None, None, ctypes.byref(subkey_count), ctypes.byref(max_name_length),
+            None, None, None, None, None, None
+        )
+        if status != ERROR_SUCCESS:
+            self.logger.debug(f"RegQueryInfoKeyW a échoué (code: {status})")
+            return None
+
+        name_buffer = ctypes.create_unicode_buffer(max_name_length.value + 1)
+        value_buffer = ctypes.create_unicode_buffer(REGISTRY_VALUE_BUFFER_CHARS)
+        name_length = ctypes.c_uint32()
+        subkey = ctypes.c_void_p()
+        applications = []
+
+        for index in range(subkey_count.value):
+            name_length.value = len(name_buffer)
+            if RegEnumKeyExW(hkey, index, name_buffer, ctypes.byref(name_length),
+                             None, None, None, None) != ERROR_SUCCESS:
+                continue
+
+            if RegOpenKeyExW(hkey, name_buffer.value, 0, KEY_READ, ctypes.byref(subkey)) != ERROR_SUCCESS:
+                continue
+
+            try:
+                name = query_value(advapi32, subkey, "DisplayName", value_buffer)
+                if not name or not name.strip():
+                    # Pas de nom d'affichage, ignorer
+                    continue
+
+                version = query_value(advapi32, subkey, "DisplayVersion", value_buffer) or "Unknown"
+                vendor = query_value(advapi32, subkey, "Publisher", value_buffer) or "Unknown"
+            finally:
+                RegCloseKey(subkey)
+
+            applications.append({
+                'name': clean(name),
+                'version': parse(version),
+                'vendor': clean(vendor),
+                'type': 'application'
+            })
+
+        return applications
+
+    @staticmethod
+    def _query_registry_value(advapi32, hkey, value_name: str, buffer) -> Optional[str]:
+        """
+        Lit une valeur chaîne (ou DWORD) d'une clé via RegQueryValueExW
+
+        Args:
+            advapi32: Bibliothèque advapi32 chargée
+            hkey: Handle de la clé ouverte
+            value_name: Nom de la valeur
+            buffer: Tampon unicode réutilisé entre les appels
+
+        Returns:
+            str: Valeur lue ou None si absente ou d'un autre type
+        """
+        import ctypes
+
+        value_type = ctypes.c_uint32()
+        size = ctypes.c_uint32(ctypes.sizeof(buffer))
+
+        status = advapi32.RegQueryValueExW(
+            hkey, value_name, None, ctypes.byref(value_type), buffer, ctypes.byref(size)
+        )
+        if status == ERROR_MORE_DATA:
+            # Valeur exceptionnellement longue: tampon dédié
+            buffer = ctypes.create_unicode_buffer(size.value // ctypes.sizeof(ctypes.c_wchar) + 1)
+            status = advapi32.RegQueryValueExW(
+                hkey, value_name, None, ctypes.byref(value_type), buffer, ctypes.byref(size)
+            )
+
+        if status != ERROR_SUCCESS:
+            return None
+
+        if value_type.value in (REG_SZ, REG_EXPAND_SZ):
+            # La chaîne n'est pas forcément terminée par un caractère nul
+            return buffer[:size.value // ctypes.sizeof(ctypes.c_wchar)].rstrip('\0')
+        if value_type.value == REG_DWORD and size.value >= 4:
+            return str(ctypes.c_uint32.from_buffer(buffer).value)
+
+        return None
+
     def _collect_windows_powershell(self) -> List[Dict[str, Any]]:
         """
         Utilise PowerShell pour récupérer les applications
@@ -286,30 +652,31 @@ class SoftwareCollector(BaseCollector):
         Returns:
             list: Applications via PowerShell
         """
+        clean = self._clean_string
+        parse = self._parse_version
         applications = []
 
-        # Commande PowerShell pour récupérer les applications
-        ps_command = (
-            "Get-WmiObject -Class Win32_Product | "
-            "Select-Object Name, Version, Vendor | "
-            "ConvertTo-Json"
-        )
+        # pwsh (PowerShell 7) démarre plus vite que Windows PowerShell
+        powershell = shutil.which('pwsh') or shutil.which('powershell') or 'powershell'
 
         try:
-            output = self._execute_command(f'powershell -Command "{ps_command}"')
+            output = self._execute_command([
+                powershell, '-NoProfile', '-NonInteractive', '-InputFormat', 'None',
+                '-Command', PS_UNINSTALL_COMMAND
+            ], timeout=COMMAND_TIMEOUT)
             if output:
-                apps_data = json.loads(output)
+                apps_data = json_loads(output)
 
                 # Gérer le cas d'un seul élément (pas de liste)
                 if isinstance(apps_data, dict):
                     apps_data = [apps_data]
 
                 for app_data in apps_data:
-                    if app_data.get('Name'):
+                    if app_data.get('DisplayName'):
                         applications.append({
-                            'name': self._clean_string(app_data['Name']),
-                            'version': self._parse_version(app_data.get('Version', 'Unknown')),
-                            'vendor': self._clean_string(app_data.get('Vendor', 'Unknown')),
+                            'name': clean(app_data['DisplayName']),
+                            'version': parse(app_data.get('DisplayVersion') or 'Unknown'),
+                            'vendor': clean(app_data.get('Publisher') or 'Unknown'),
                             'type': 'application'
                         })
 
@@ -320,81 +687,108 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
-    def _collect_macos_software(self) -> List[Dict[str, Any]]:
+    def _collect_macos_software(self) -> List[List[Dict[str, Any]]]:
         """
         Collecte les logiciels installés sur macOS
 
         Returns:
-            list: Applications macOS
+            list: Applications macOS, une liste triée par source
         """
-        applications = []
-
-        # Méthode 1: Applications dans /Applications
-        apps_folder = self._collect_macos_applications_folder()
-        applications.extend(apps_folder)
-
-        # Méthode 2: Homebrew
-        homebrew_apps = self._collect_macos_homebrew()
-        applications.extend(homebrew_apps)
-
-        # Méthode 3: system_profiler
-        profiler_apps = self._collect_macos_system_profiler()
-        applications.extend(profiler_apps)
-
-        return applications
+        return self._collect_sources({
+            # Méthode 1: Applications dans /Applications
+            'applications': self._collect_macos_applications_folder,
+            # Méthode 2: Homebrew
+            'homebrew': self._collect_macos_homebrew,
+            # Méthode 3: system_profiler
+            'system_profiler': self._collect_macos_system_profiler
+        })
 
     def _collect_macos_applications_folder(self) -> List[Dict[str, Any]]:
         """
         Scan du dossier /Applications sur macOS
 
+        Les Info.plist sont lus en parallèle: sur un cache disque froid,
+        la lecture domine et les accès se recouvrent.
+
         Returns:
             list: Applications du dossier Applications
         """
         applications = []
 
         try:
-            import os
-            import plistlib
-
-            apps_path = "/Applications"
-            if os.path.exists(apps_path):
-                for item in os.listdir(apps_path):
-                    if item.endswith('.app'):
-                        app_path = os.path.join(apps_path, item)
-                        plist_path = os.path.join(app_path, 'Contents', 'Info.plist')
-
-                        if os.path.exists(plist_path):
-                            try:
-                                with open(plist_path, 'rb') as f:
-                                    plist_data = plistlib.load(f)
-
-                                app_name = plist_data.get('CFBundleDisplayName') or plist_data.get('CFBundleName', item[:-4])
-                                app_version = plist_data.get('CFBundleShortVersionString', 'Unknown')
-                                app_vendor = plist_data.get('CFBundleIdentifier', 'Unknown')
-
-                                # Extraire le vendor du bundle identifier
-                                if '.' in app_vendor:
-                                    vendor_parts = app_vendor.split('.')
-                                    if len(vendor_parts) >= 2:
-                                        app_vendor = vendor_parts[1].title()
-
-                                applications.append({
-                                    'name': self._clean_string(app_name),
-                                    'version': self._parse_version(app_version),
-                                    'vendor': self._clean_string(app_vendor),
-                                    'type': 'application'
-                                })
-
-                            except Exception as e:
-                                self.logger.debug(f"Erreur lecture plist {plist_path}: {e}")
+            with os.scandir(MACOS_APPLICATIONS_PATH) as entries:
+                app_entries = [
+                    (entry.path, entry.name) for entry in entries
+                    if entry.name.endswith('.app') and entry.is_dir()
+                ]
+
+            if app_entries:
+                with ThreadPoolExecutor(max_workers=PLIST_WORKERS, thread_name_prefix='plist') as executor:
+                    for app in executor.map(lambda args: self._read_app_plist(*args), app_entries):
+                        if app:
+                            applications.append(app)
 
             self.logger.debug(f"Dossier Applications: {len(applications)} applications trouvées")
 
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.warning(f"Erreur scan dossier Applications: {e}")
 
         return applications
 
+    def _read_app_plist(self, app_path: str, item: str) -> Optional[Dict[str, Any]]:
+        """
+        Lit le Info.plist d'un bundle .app
+
+        Le format (binaire ou XML) est déterminé par l'en-tête du fichier,
+        ce qui évite la détection automatique de plistlib.
+
+        Args:
+            app_path: Chemin du bundle
+            item: Nom du bundle (ex: "Safari.app")
+
+        Returns:
+            dict: Application ou None si le plist est absent/illisible
+        """
+        plistlib = self._lazy_import('plistlib')
+
+        plist_path = os.path.join(app_path, 'Contents', 'Info.plist')
+
+        try:
+            with open(plist_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.debug(f"Erreur lecture plist {plist_path}: {e}")
+            return None
+
+        try:
+            plist_format = plistlib.FMT_BINARY if data[:6] == b'bplist' else plistlib.FMT_XML
+            plist_data = plistlib.loads(data, fmt=plist_format)
+
+            app_name = plist_data.get('CFBundleDisplayName') or plist_data.get('CFBundleName', item[:-4])
+            app_version = plist_data.get('CFBundleShortVersionString', 'Unknown')
+            app_vendor = plist_data.get('CFBundleIdentifier', 'Unknown')
+
+            # Extraire le vendor du bundle identifier
+            if '.' in app_vendor:
+                vendor_parts = app_vendor.split('.')
+                if len(vendor_parts) >= 2:
+                    app_vendor = vendor_parts[1].title()
+
+            return {
+                'name': self._clean_string(app_name),
+                'version': self._parse_version(app_version),
+                'vendor': self._clean_string(app_vendor),
+                'type': 'application'
+            }
+
+        except Exception as e:
+            self.logger.debug(f"Erreur lecture plist {plist_path}: {e}")
+            return None
+
     def _collect_macos_homebrew(self) -> List[Dict[str, Any]]:
         """
         Collecte les packages Homebrew sur macOS
@@ -402,25 +796,28 @@ class SoftwareCollector(BaseCollector):
         Returns:
             list: Packages Homebrew
         """
+        clean = self._clean_string
+        parse = self._parse_version
         applications = []
 
         try:
             # Liste des packages Homebrew
-            output = self._execute_command("brew list --versions")
-            if output:
-                for line in output.split('\n'):
-                    if line.strip():
-                        parts = line.strip().split(' ', 1)
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            version = parts[1]
-
-                            applications.append({
-                                'name': self._clean_string(name),
-                                'version': self._parse_version(version),
-                                'vendor': 'Homebrew',
-                                'type': 'package'
-                            })
+            for line in self._stream_command(['brew', 'list', '--versions'], timeout=COMMAND_TIMEOUT):
+                line = line.strip()
+                if not line:
+                    continue
+
+                parts = line.split(' ', 1)
+                if len(parts) >= 2:
+                    name = parts[0]
+                    version = parts[1]
+
+                    applications.append({
+                        'name': clean(name),
+                        'version': parse(version),
+                        'vendor': 'Homebrew',
+                        'type': 'package'
+                    })
 
             self.logger.debug(f"Homebrew: {len(applications)} packages trouvés")
 
@@ -436,12 +833,18 @@ class SoftwareCollector(BaseCollector):
         Returns:
             list: Applications via system_profiler
         """
+        clean = self._clean_string
+        parse = self._parse_version
         applications = []
 
         try:
-            output = self._execute_command("system_profiler SPApplicationsDataType -json")
+            output = self._execute_command(
+                ['system_profiler', 'SPApplicationsDataType', '-json'],
+                binary=True, timeout=SYSTEM_PROFILER_TIMEOUT
+            )
             if output:
-                data = json.loads(output)
+                # Sortie UTF-8 de plusieurs Mo: parsée directement en bytes
+                data = json_loads(output)
                 apps_data = data.get('SPApplicationsDataType', [])
 
                 for app_data in apps_data:
@@ -451,9 +854,9 @@ class SoftwareCollector(BaseCollector):
 
                     if name:
                         applications.append({
-                            'name': self._clean_string(name),
-                            'version': self._parse_version(version),
-                            'vendor': self._clean_string(vendor),
+                            'name': clean(name),
+                            'version': parse(version),
+                            'vendor': clean(vendor),
                             'type': 'application'
                         })
 
@@ -464,62 +867,294 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
-    def _collect_linux_software(self) -> List[Dict[str, Any]]:
+    def _collect_linux_software(self) -> List[List[Dict[str, Any]]]:
         """
         Collecte les logiciels installés sur Linux
 
         Returns:
-            list: Applications Linux
+            list: Applications Linux, une liste triée par source
+        """
+        return self._collect_sources({
+            # Méthode 1: dpkg (Debian/Ubuntu)
+            'dpkg': self._collect_linux_dpkg,
+            # Méthode 2: rpm (RedHat/CentOS/Fedora)
+            'rpm': self._collect_linux_rpm,
+            # Méthode 3: pacman (Arch Linux)
+            'pacman': self._collect_linux_pacman,
+            # Méthode 4: Snap packages
+            'snap': self._collect_linux_snap,
+            # Méthode 5: Flatpak
+            'flatpak': self._collect_linux_flatpak
+        })
+
+    def _collect_sources(self, sources: Dict[str, Callable[[], List[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Interroge plusieurs sources de paquets en parallèle
+
+        Les sources indépendantes (gestionnaires de paquets, dossiers) sont
+        lancées simultanément: la durée totale est celle de la plus lente
+        et non leur somme. Une source qui dépasse son délai (SOURCE_TIMEOUTS,
+        SOURCE_TIMEOUT par défaut) est ignorée sans bloquer les autres.
+
+        Args:
+            sources: Fonctions de collecte indexées par nom de source
+
+        Returns:
+            list: Applications triées de chaque source, dans l'ordre donné
         """
         applications = []
 
-        # Méthode 1: dpkg (Debian/Ubuntu)
-        dpkg_apps = self._collect_linux_dpkg()
-        applications.extend(dpkg_apps)
+        executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='software')
+        started_at = time.monotonic()
+        try:
+            futures = {
+                name: executor.submit(self._cached_source, name, func)
+                for name, func in sources.items()
+            }
 
-        # Méthode 2: rpm (RedHat/CentOS/Fedora)
-        rpm_apps = self._collect_linux_rpm()
-        applications.extend(rpm_apps)
+            for name, future in futures.items():
+                # Délais comptés depuis le lancement commun des sources
+                deadline = started_at + SOURCE_TIMEOUTS.get(name, SOURCE_TIMEOUT)
+                try:
+                    applications.append(future.result(timeout=max(0, deadline - time.monotonic())))
+                except FutureTimeoutError:
+                    self.logger.warning(f"Timeout de la source de logiciels: {name}")
+                except Exception as e:
+                    self.logger.warning(f"Erreur source de logiciels {name}: {e}")
+        finally:
+            # Ne pas attendre une source bloquée au-delà du délai
+            executor.shutdown(wait=False)
 
-        # Méthode 3: pacman (Arch Linux)
-        pacman_apps = self._collect_linux_pacman()
-        applications.extend(pacman_apps)
+        return applications
 
-        # Méthode 4: Snap packages
-        snap_apps = self._collect_linux_snap()
-        applications.extend(snap_apps)
+    def _cached_source(self, name: str, func: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Retourne la liste d'une source depuis le cache disque si sa base
+        de paquets n'a pas changé, sinon la collecte et la met en cache
+
+        La liste retournée est triée par nom, pour la fusion finale des
+        sources.
 
-        # Méthode 5: Flatpak
-        flatpak_apps = self._collect_linux_flatpak()
-        applications.extend(flatpak_apps)
+        Args:
+            name: Nom de la source
+            func: Fonction de collecte de la source
+
+        Returns:
+            list: Applications de la source, triées par nom
+        """
+        # Cache du cycle en cours: une source terminée après son délai
+        # n'écrit que dans ce cache, déjà abandonné par le cycle suivant
+        disk_cache = self._disk_cache
+        signature = self._source_signature(name)
+        with self._disk_cache_lock:
+            cached = disk_cache.get(name) if signature is not None else None
+
+        if cached and cached.get('signature') == signature and self._is_fresh(cached):
+            self.logger.debug(f"{name}: liste de paquets inchangée (cache)")
+            applications = cached['applications']
+        else:
+            # Triée avant sa mise en cache: la liste partagée avec le cache
+            # n'est plus modifiée ensuite (cache disque enregistré trié)
+            applications = func()
+            applications.sort(key=application_sort_key)
+            if signature is not None and applications:
+                with self._disk_cache_lock:
+                    disk_cache[name] = {
+                        'signature': signature,
+                        'collected_at': time.time(),
+                        'applications': applications
+                    }
+                    if disk_cache is self._disk_cache:
+                        self._disk_cache_dirty = True
 
         return applications
 
+    @staticmethod
+    def _is_fresh(cached: Dict[str, Any]) -> bool:
+        """
+        Indique si une entrée du cache disque n'a pas dépassé son âge maximal
+
+        Args:
+            cached: Entrée du cache (avec son horodatage 'collected_at')
+
+        Returns:
+            bool: True si l'entrée a moins de SOFTWARE_CACHE_MAX_AGE secondes
+        """
+        age = time.time() - cached.get('collected_at', 0)
+        return 0 <= age < SOFTWARE_CACHE_MAX_AGE
+
+    def _source_signature(self, name: str) -> Optional[List[int]]:
+        """
+        Calcule l'empreinte (dates de modification) de la base d'une source
+
+        Args:
+            name: Nom de la source
+
+        Returns:
+            list: Dates de modification en ns, ou None si indisponibles
+        """
+        if name == 'registry':
+            return self._registry_signature()
+
+        signature = []
+        for path in SOURCE_DB_PATHS.get(name, ()):
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                continue
+
+        if not signature:
+            return None
+
+        # Dates des entrées par paquet (mises à jour sur place)
+        for pattern in SOURCE_ENTRY_PATTERNS.get(name, ()):
+            for path in sorted(glob.glob(pattern)):
+                try:
+                    signature.append(os.stat(path).st_mtime_ns)
+                except OSError:
+                    continue
+
+        return signature
+
+    def _registry_signature(self) -> Optional[List[int]]:
+        """
+        Calcule l'empreinte des clés Uninstall
+
+        L'empreinte contient la date de dernière écriture de chaque
+        sous-clé (une application qui se met à jour réécrit DisplayVersion
+        dans sa propre sous-clé, sans toucher la clé Uninstall).
+        RegEnumKeyExW la retourne sans ouvrir les sous-clés.
+
+        Returns:
+            list: Dates de dernière écriture, ou None si indisponibles
+        """
+        winreg = self._lazy_import('winreg')
+        advapi32 = self._get_advapi32()
+        if winreg is None or advapi32 is None:
+            return None
+
+        signature = []
+        for path in REGISTRY_UNINSTALL_PATHS:
+            try:
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path) as key:
+                    subkeys = self._registry_subkey_write_times(advapi32, key)
+            except OSError:
+                continue
+
+            if subkeys is None:
+                return None
+            signature.append(len(subkeys))
+            signature.extend(subkeys)
+
+        return signature or None
+
+    def _registry_subkey_write_times(self, advapi32, key) -> Optional[List[int]]:
+        """
+        Lit la date de dernière écriture de chaque sous-clé via advapi32
+
+        Args:
+            advapi32: Bibliothèque advapi32 chargée
+            key: Clé de registre ouverte (winreg)
+
+        Returns:
+            list: Dates FILETIME (dans l'ordre d'énumération), ou None en cas d'échec
+        """
+        import ctypes
+
+        hkey = ctypes.c_void_p(int(key))
+        subkey_count = ctypes.c_uint32()
+        max_name_length = ctypes.c_uint32()
+
+        status = advapi32.RegQueryInfoKeyW(
+            hkey, None, None, None, ctypes.byref(subkey_count), ctypes.byref(max_name_length),
+            None, None, None, None, None, None
+        )
+        if status != ERROR_SUCCESS:
+            self.logger.debug(f"RegQueryInfoKeyW a échoué (code: {status})")
+            return None
+
+        name_buffer = ctypes.create_unicode_buffer(max_name_length.value + 1)
+        name_length = ctypes.c_uint32()
+        last_write = ctypes.c_uint64()  # FILETIME
+        write_times = []
+
+        for index in range(subkey_count.value):
+            name_length.value = len(name_buffer)
+            if advapi32.RegEnumKeyExW(hkey, index, name_buffer, ctypes.byref(name_length),
+                                      None, None, None, ctypes.byref(last_write)) != ERROR_SUCCESS:
+                return None
+            write_times.append(last_write.value)
+
+        return write_times
+
+    def _load_disk_cache(self) -> Dict[str, Any]:
+        """
+        Charge le cache disque des listes de paquets
+
+        Returns:
+            dict: Cache par source (vide si absent ou invalide)
+        """
+        try:
+            with open(SOFTWARE_CACHE_FILE, 'rb') as f:
+                cache = json_loads(f.read())
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Cache logiciels ignoré: {e}")
+            return {}
+
+    def _save_disk_cache(self):
+        """
+        Enregistre le cache disque des listes de paquets
+
+        L'écriture passe par un fichier temporaire renommé pour ne jamais
+        laisser un cache tronqué.
+        """
+        try:
+            os.makedirs(os.path.dirname(SOFTWARE_CACHE_FILE), exist_ok=True)
+            temp_file = f"{SOFTWARE_CACHE_FILE}.tmp"
+            with self._disk_cache_lock, open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._disk_cache, f, ensure_ascii=False)
+            os.replace(temp_file, SOFTWARE_CACHE_FILE)
+        except OSError as e:
+            self.logger.debug(f"Erreur écriture cache logiciels: {e}")
+
     def _collect_linux_dpkg(self) -> List[Dict[str, Any]]:
         """
         Collecte via dpkg (Debian/Ubuntu)
 
+        Le fichier d'état de dpkg est lu directement lorsqu'il existe;
+        la commande dpkg -l n'est utilisée qu'en repli.
+
         Returns:
             list: Packages dpkg
         """
+        clean = self._clean_string
+        parse = self._parse_version
+        applications = self._read_dpkg_status()
+        if applications is not None:
+            self.logger.debug(f"dpkg (status): {len(applications)} packages trouvés")
+            return applications
+
         applications = []
 
         try:
-            output = self._execute_command("dpkg -l")
-            if output:
-                for line in output.split('\n'):
-                    if line.startswith('ii '):  # Installé
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            name = parts[1]
-                            version = parts[2]
-
-                            applications.append({
-                                'name': self._clean_string(name),
-                                'version': self._parse_version(version),
-                                'vendor': 'Debian Package',
-                                'type': 'package'
-                            })
+            for line in self._stream_command(['dpkg', '-l'], timeout=COMMAND_TIMEOUT):
+                if line[:3] != 'ii ':  # Non installé
+                    continue
+
+                parts = line.split()
+                if len(parts) >= 3:
+                    name = parts[1]
+                    version = parts[2]
+
+                    applications.append({
+                        'name': clean(name),
+                        'version': parse(version),
+                        'vendor': 'Debian Package',
+                        'type': 'package'
+                    })
 
             self.logger.debug(f"dpkg: {len(applications)} packages trouvés")
 
@@ -528,31 +1163,84 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
+    def _read_dpkg_status(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lit les paquets installés depuis /var/lib/dpkg/status
+
+        Le fichier est composé de paragraphes (style RFC 822) séparés par
+        une ligne vide. Seuls les champs utiles sont extraits, sur les
+        bytes bruts, et seuls les paquets "install ok installed" sont
+        retenus (équivalent de l'état "ii" de dpkg -l).
+
+        Returns:
+            list: Packages dpkg ou None si le fichier est absent/illisible
+        """
+        clean = self._clean_string
+        parse = self._parse_version
+        try:
+            with open(DPKG_STATUS_FILE, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            self.logger.debug(f"Fichier d'état dpkg non lisible: {e}")
+            return None
+
+        applications = []
+
+        for stanza in data.split(b'\n\n'):
+            fields = dict(DPKG_FIELD_RE.findall(stanza))
+            if not fields.get(b'Status', b'').startswith(b'install ok installed'):
+                continue
+
+            name = fields.get(b'Package')
+            version = fields.get(b'Version')
+            if not name or not version:
+                continue
+
+            applications.append({
+                'name': clean(name.decode('utf-8', 'replace')),
+                'version': parse(version.decode('utf-8', 'replace')),
+                'vendor': 'Debian Package',
+                'type': 'package'
+            })
+
+        return applications
+
     def _collect_linux_rpm(self) -> List[Dict[str, Any]]:
         """
         Collecte via rpm (RedHat/CentOS/Fedora)
 
+        La base SQLite tenue par DNF est lue directement lorsqu'elle
+        existe; la commande rpm -qa n'est utilisée qu'en dernier recours.
+
         Returns:
             list: Packages RPM
         """
+        clean = self._clean_string
+        parse = self._parse_version
+        applications = self._read_dnf_packages_db()
+        if applications is not None:
+            self.logger.debug(f"rpm (base DNF): {len(applications)} packages trouvés")
+            return applications
+
         applications = []
 
         try:
-            output = self._execute_command("rpm -qa --queryformat '%{NAME} %{VERSION}-%{RELEASE}\\n'")
-            if output:
-                for line in output.split('\n'):
-                    if line.strip():
-                        parts = line.strip().split(' ', 1)
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            version = parts[1]
-
-                            applications.append({
-                                'name': self._clean_string(name),
-                                'version': self._parse_version(version),
-                                'vendor': 'RPM Package',
-                                'type': 'package'
-                            })
+            for line in self._stream_command(RPM_QUERY_COMMAND, timeout=COMMAND_TIMEOUT):
+                line = line.strip()
+                if not line:
+                    continue
+
+                parts = line.split(' ', 1)
+                if len(parts) >= 2:
+                    name = parts[0]
+                    version = parts[1]
+
+                    applications.append({
+                        'name': clean(name),
+                        'version': parse(version),
+                        'vendor': 'RPM Package',
+                        'type': 'package'
+                    })
 
             self.logger.debug(f"rpm: {len(applications)} packages trouvés")
 
@@ -561,31 +1249,98 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
+    def _read_dnf_packages_db(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lit la liste des paquets installés depuis la base SQLite de DNF
+
+        La table installed contient un NEVRA par paquet
+        (nom-version-release.arch), découpé ici sans appel à rpm.
+
+        Returns:
+            list: Packages RPM ou None si la base est absente/illisible
+        """
+        clean = self._clean_string
+        parse = self._parse_version
+        if not os.path.exists(DNF_PACKAGES_DB):
+            return None
+
+        sqlite3 = self._lazy_import('sqlite3')
+        if sqlite3 is None:
+            return None
+
+        try:
+            connection = sqlite3.connect(f"file:{DNF_PACKAGES_DB}?mode=ro", uri=True)
+            try:
+                rows = connection.execute("SELECT pkg FROM installed").fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            self.logger.debug(f"Erreur lecture base DNF {DNF_PACKAGES_DB}: {e}")
+            return None
+
+        return [
+            {
+                'name': clean(name),
+                'version': parse(version),
+                'vendor': 'RPM Package',
+                'type': 'package'
+            }
+            for name, version in map(self._split_nevra, (row[0] for row in rows))
+            if name
+        ]
+
+    @staticmethod
+    def _split_nevra(nevra: str) -> Tuple[str, str]:
+        """
+        Découpe un NEVRA RPM en nom et version-release
+
+        Args:
+            nevra: Chaîne nom-version-release.arch
+
+        Returns:
+            tuple: (nom, version-release), nom vide si le format est invalide
+        """
+        parts = nevra.rsplit('.', 1)[0].rsplit('-', 2)
+        if len(parts) != 3:
+            return "", ""
+        return parts[0], f"{parts[1]}-{parts[2]}"
+
     def _collect_linux_pacman(self) -> List[Dict[str, Any]]:
         """
         Collecte via pacman (Arch Linux)
 
+        La base locale de pacman est lue directement lorsqu'elle existe;
+        la commande pacman -Q n'est utilisée qu'en repli.
+
         Returns:
             list: Packages pacman
         """
+        applications = self._read_pacman_local()
+        if applications is not None:
+            self.logger.debug(f"pacman (base locale): {len(applications)} packages trouvés")
+            return applications
+
+        clean = self._clean_string
+        parse = self._parse_version
         applications = []
 
         try:
-            output = self._execute_command("pacman -Q")
-            if output:
-                for line in output.split('\n'):
-                    if line.strip():
-                        parts = line.strip().split(' ')
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            version = parts[1]
-
-                            applications.append({
-                                'name': self._clean_string(name),
-                                'version': self._parse_version(version),
-                                'vendor': 'Arch Package',
-                                'type': 'package'
-                            })
+            for line in self._stream_command(['pacman', '-Q'], timeout=COMMAND_TIMEOUT):
+                line = line.strip()
+                if not line:
+                    continue
+
+                parts = line.split(' ')
+                if len(parts) >= 2:
+                    name = parts[0]
+                    version = parts[1]
+
+                    applications.append({
+                        'name': clean(name),
+                        'version': parse(version),
+                        'vendor': 'Arch Package',
+                        'type': 'package'
+                    })
 
             self.logger.debug(f"pacman: {len(applications)} packages trouvés")
 
@@ -594,32 +1349,82 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
+    def _read_pacman_local(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lit les paquets installés depuis la base locale de pacman
+
+        Chaque paquet y est un dossier nom-version-release: le nom et la
+        version se déduisent du nom du dossier, sans lecture de fichier.
+
+        Returns:
+            list: Packages pacman ou None si la base est absente
+        """
+        clean = self._clean_string
+        parse = self._parse_version
+        applications = []
+
+        try:
+            with os.scandir(PACMAN_LOCAL_DB) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+
+                    parts = entry.name.rsplit('-', 2)
+                    if len(parts) != 3:
+                        continue
+
+                    applications.append({
+                        'name': clean(parts[0]),
+                        'version': parse(f"{parts[1]}-{parts[2]}"),
+                        'vendor': 'Arch Package',
+                        'type': 'package'
+                    })
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.debug(f"Erreur lecture base pacman: {e}")
+            return None
+
+        return applications
+
     def _collect_linux_snap(self) -> List[Dict[str, Any]]:
         """
         Collecte les packages Snap
 
+        Les snaps installés sont lus depuis /snap lorsqu'il existe; la
+        commande snap list n'est utilisée qu'en repli.
+
         Returns:
             list: Packages Snap
         """
+        applications = self._read_snap_directory()
+        if applications is not None:
+            self.logger.debug(f"snap (/snap): {len(applications)} packages trouvés")
+            return applications
+
+        clean = self._clean_string
+        parse = self._parse_version
         applications = []
 
         try:
-            output = self._execute_command("snap list")
-            if output:
-                lines = output.split('\n')[1:]  # Ignorer l'en-tête
-                for line in lines:
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            version = parts[1]
-
-                            applications.append({
-                                'name': self._clean_string(name),
-                                'version': self._parse_version(version),
-                                'vendor': 'Snap Package',
-                                'type': 'snap'
-                            })
+            lines = self._stream_command(['snap', 'list'], timeout=COMMAND_TIMEOUT)
+            next(lines, None)  # Ignorer l'en-tête
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+
+                parts = line.split()
+                if len(parts) >= 2:
+                    name = parts[0]
+                    version = parts[1]
+
+                    applications.append({
+                        'name': clean(name),
+                        'version': parse(version),
+                        'vendor': 'Snap Package',
+                        'type': 'snap'
+                    })
 
             self.logger.debug(f"snap: {len(applications)} packages trouvés")
 
@@ -628,31 +1433,88 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
+    def _read_snap_directory(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lit les snaps installés depuis /snap
+
+        Le lien current pointe vers une révision et non une version: la
+        version est lue dans meta/snap.yaml de la révision active.
+
+        Returns:
+            list: Packages Snap ou None si /snap est absent
+        """
+        clean = self._clean_string
+        parse = self._parse_version
+        applications = []
+
+        try:
+            with os.scandir(SNAP_MOUNT_DIR) as entries:
+                for entry in entries:
+                    if entry.name == 'bin' or not entry.is_dir():
+                        continue
+
+                    try:
+                        with open(os.path.join(entry.path, 'current', 'meta', 'snap.yaml'), 'rb') as f:
+                            match = SNAP_VERSION_RE.search(f.read())
+                    except OSError:
+                        # Snap sans révision active
+                        continue
+
+                    version = match.group(1).decode('utf-8', 'replace') if match else 'Unknown'
+
+                    applications.append({
+                        'name': clean(entry.name),
+                        'version': parse(version),
+                        'vendor': 'Snap Package',
+                        'type': 'snap'
+                    })
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.debug(f"Erreur lecture {SNAP_MOUNT_DIR}: {e}")
+            return None
+
+        return applications
+
     def _collect_linux_flatpak(self) -> List[Dict[str, Any]]:
         """
         Collecte les packages Flatpak
 
+        Les installations Flatpak (système et utilisateur) sont lues
+        directement lorsqu'elles existent; la commande flatpak list n'est
+        utilisée qu'en repli.
+
         Returns:
             list: Packages Flatpak
         """
+        applications = self._read_flatpak_installations()
+        if applications is not None:
+            self.logger.debug(f"flatpak (installations): {len(applications)} packages trouvés")
+            return applications
+
+        clean = self._clean_string
+        parse = self._parse_version
         applications = []
 
         try:
-            output = self._execute_command("flatpak list --app --columns=name,version")
-            if output:
-                for line in output.split('\n'):
-                    if line.strip() and '\t' in line:
-                        parts = line.split('\t')
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            version = parts[1] if parts[1] else 'Unknown'
-
-                            applications.append({
-                                'name': self._clean_string(name),
-                                'version': self._parse_version(version),
-                                'vendor': 'Flatpak',
-                                'type': 'flatpak'
-                            })
+            for line in self._stream_command(
+                ['flatpak', 'list', '--app', '--columns=name,version'], timeout=COMMAND_TIMEOUT
+            ):
+                # Pas de strip: une version vide laisse une tabulation finale
+                if '\t' not in line:
+                    continue
+
+                parts = line.split('\t')
+                if len(parts) >= 2:
+                    name = parts[0]
+                    version = parts[1] if parts[1] else 'Unknown'
+
+                    applications.append({
+                        'name': clean(name),
+                        'version': parse(version),
+                        'vendor': 'Flatpak',
+                        'type': 'flatpak'
+                    })
 
             self.logger.debug(f"flatpak: {len(applications)} packages trouvés")
 
@@ -661,6 +1523,83 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
+    def _read_flatpak_installations(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lit les applications Flatpak depuis les installations système et
+        utilisateur
+
+        Le nom affiché et la version proviennent des métadonnées AppStream
+        (metainfo) du déploiement actif; l'identifiant de l'application
+        sert de nom à défaut.
+
+        Returns:
+            list: Packages Flatpak ou None si aucune installation n'existe
+        """
+        clean = self._clean_string
+        parse = self._parse_version
+        applications = []
+        found = False
+
+        for apps_dir in (FLATPAK_SYSTEM_APPS, os.path.expanduser(FLATPAK_USER_APPS)):
+            try:
+                with os.scandir(apps_dir) as entries:
+                    app_ids = [entry.name for entry in entries if entry.is_dir()]
+            except OSError:
+                continue
+
+            found = True
+            for app_id in app_ids:
+                active = os.path.join(apps_dir, app_id, 'current', 'active')
+                if not os.path.isdir(active):
+                    continue
+
+                name, version = self._read_flatpak_metainfo(active, app_id)
+                applications.append({
+                    'name': clean(name),
+                    'version': parse(version),
+                    'vendor': 'Flatpak',
+                    'type': 'flatpak'
+                })
+
+        return applications if found else None
+
+    def _read_flatpak_metainfo(self, active_path: str, app_id: str) -> Tuple[str, str]:
+        """
+        Extrait le nom et la dernière version du fichier metainfo d'une
+        application Flatpak
+
+        Args:
+            active_path: Chemin du déploiement actif
+            app_id: Identifiant de l'application
+
+        Returns:
+            tuple: (nom, version), avec l'identifiant et "Unknown" par défaut
+        """
+        import xml.etree.ElementTree as ET
+
+        name, version = app_id, 'Unknown'
+
+        for relative_path in FLATPAK_METAINFO_PATHS:
+            path = os.path.join(active_path, relative_path.format(app_id=app_id))
+            try:
+                root = ET.parse(path).getroot()
+            except (OSError, ET.ParseError):
+                continue
+
+            for element in root.iter('name'):
+                # Le nom non localisé n'a pas d'attribut xml:lang
+                if not element.attrib and element.text:
+                    name = element.text
+                    break
+
+            # Les releases sont listées de la plus récente à la plus ancienne
+            release = root.find('releases/release')
+            if release is not None and release.get('version'):
+                version = release.get('version')
+            break
+
+        return name, version
+
     def _collect_generic_software(self) -> List[Dict[str, Any]]:
         """
         Collecte via des méthodes génériques multi-plateforme
@@ -680,23 +1619,42 @@ class SoftwareCollector(BaseCollector):
         """
         Collecte les packages Python installés
 
+        Les packages sont ceux de l'interpréteur Python du PATH (celui
+        qu'utilise pip), et non ceux de l'agent (exécutable PyInstaller
+        ou environnement virtuel).
+
         Returns:
             list: Packages Python
         """
+        parse = self._parse_version
         applications = []
 
         try:
-            # Utiliser pip list
-            output = self._execute_command("pip list --format=json")
-            if output:
-                packages = json.loads(output)
-                for package in packages:
-                    applications.append({
-                        'name': f"Python: {package['name']}",
-                        'version': self._parse_version(package['version']),
-                        'vendor': 'Python Package',
-                        'type': 'python_package'
-                    })
+            paths = self._get_python_search_paths()
+            if paths is None:
+                return applications
+
+            # Lecture des métadonnées dist-info/egg-info sans lancer de
+            # sous-processus pip
+            from importlib.metadata import distributions
+
+            for distribution in distributions(path=paths):
+                try:
+                    name = distribution.metadata['Name']
+                    version = distribution.version
+                except Exception:
+                    # Répertoire dist-info incomplet ou corrompu
+                    continue
+
+                if not name:
+                    continue
+
+                applications.append({
+                    'name': f"Python: {name}",
+                    'version': parse(version),
+                    'vendor': 'Python Package',
+                    'type': 'python_package'
+                })
 
             self.logger.debug(f"Python packages: {len(applications)} packages trouvés")
 
@@ -705,29 +1663,63 @@ class SoftwareCollector(BaseCollector):
 
         return applications
 
-    def _cleanup_applications(self, applications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _get_python_search_paths(self) -> Optional[List[str]]:
         """
-        Nettoie et déduplique la liste des applications
+        Récupère le sys.path de l'interpréteur Python trouvé dans le PATH
+
+        Returns:
+            list: Dossiers de recherche des packages, ou None si aucun
+            interpréteur n'est installé
+        """
+        executable = shutil.which('python3') or shutil.which('python')
+        if not executable:
+            return None
+
+        # L'agent lui-même est cet interpréteur: inutile de le relancer
+        if not getattr(sys, 'frozen', False) and \
+                os.path.realpath(executable) == os.path.realpath(sys.executable):
+            paths = sys.path
+        else:
+            output = self._execute_command(
+                [executable, '-c', 'import json, sys; print(json.dumps(sys.path))'],
+                timeout=COMMAND_TIMEOUT
+            )
+            if not output:
+                return None
+            paths = json_loads(output)
+
+        return [path for path in paths if path and os.path.isdir(path)]
+
+    def _cleanup_applications(self, sources: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Fusionne, nettoie et déduplique les listes d'applications
 
         Args:
-            applications: Liste brute des applications
+            sources: Listes d'applications par source, chacune triée par nom
 
         Returns:
-            list: Liste nettoyée et dédupliquée
+            list: Liste nettoyée, dédupliquée et triée par nom
         """
-        # Déduplication basée sur nom + version
-        seen = set()
+        # Fusion des listes triées (stable: à nom égal, l'ordre des
+        # sources est conservé) puis déduplication nom + version en un
+        # passage: les doublons d'un même nom sont consécutifs
         cleaned_apps = []
-
-        for app in applications:
-            # Créer une clé unique
-            key = f"{app['name'].lower()}_{app['version']}"
-
-            if key not in seen and app['name'].strip():
-                seen.add(key)
+        current_name = None
+        seen_versions = set()
+
+        for app in heapq.merge(*sources, key=application_sort_key):
+            name = app['name']
+            if not name.strip():
+                continue
+
+            name_key = name.casefold()
+            if name_key != current_name:
+                current_name = name_key
+                seen_versions = set()
+
+            version = app['version']
+            if version not in seen_versions:
+                seen_versions.add(version)
                 cleaned_apps.append(app)
 
-        # Trier par nom
-        cleaned_apps.sort(key=lambda x: x['name'].lower())
-
-        return cleaned_apps
\ No newline at end of file
+        return cleaned_apps
@@ -10,13 +10,52 @@ Ce module collecte les informations système générales :
 """
 
 import os
+import re
 import sys
-import platform
+import time
 import psutil
-from datetime import datetime, timedelta
-from typing import Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Tuple, Optional
 
-from .base import BaseCollector
+from .base import BaseCollector, PLATFORM_UNAME
+
+# Intervalle minimal (secondes) d'une mesure d'utilisation CPU: une mesure
+# demandée plus tôt après l'amorçage attend la fin de l'intervalle
+CPU_SAMPLE_MIN_INTERVAL = 0.2
+
+# Ancienneté maximale (secondes) d'une mesure CPU réutilisée: la mesure
+# prise par InventoryCollector juste avant de lancer les collecteurs sert
+# à la collecte système, qui ne mesure donc pas la charge de la collecte
+CPU_SAMPLE_REUSE = 5.0
+
+# Nombre maximal de partitions interrogées simultanément
+STORAGE_WORKERS = 8
+
+# Systèmes de fichiers sans intérêt pour l'inventaire (images snap,
+# montages en mémoire)
+SKIPPED_FSTYPES = frozenset({'squashfs', 'tmpfs'})
+
+# Horloge mesurant directement le temps écoulé depuis le démarrage
+# (CLOCK_BOOTTIME sous Linux, veille incluse); None sous Windows
+UPTIME_CLOCK = getattr(time, 'CLOCK_BOOTTIME', getattr(time, 'CLOCK_MONOTONIC', None))
+
+# Unités de l'uptime lisible (singulier, pluriel), indexées par v > 1
+UPTIME_UNITS = (('jour', 'jours'), ('heure', 'heures'), ('minute', 'minutes'))
+
+# Champs de /proc/meminfo utilisés (valeurs en kB)
+MEMINFO_FILE = '/proc/meminfo'
+MEMINFO_RE = re.compile(
+    rb'^(MemTotal|MemFree|MemAvailable|Buffers|Cached|SReclaimable|SwapTotal|SwapFree):\s+(\d+)',
+    re.M
+)
+
+# Variables d'environnement importantes à collecter
+IMPORTANT_ENV_VARS = frozenset((
+    'PATH', 'HOME', 'USER', 'USERNAME', 'USERPROFILE',
+    'COMPUTERNAME', 'HOSTNAME', 'LANG', 'TZ'
+))
 
 
 class SystemCollector(BaseCollector):
@@ -27,6 +66,51 @@ class SystemCollector(BaseCollector):
     les informations système multi-plateforme.
     """
 
+    # kernel32 chargé via ctypes (partagé par toutes les instances)
+    _kernel32 = None
+
+    # Mesure CPU partagée par toutes les instances: les compteurs de
+    # psutil.cpu_percent sont globaux au processus. Dernière mesure
+    # (global, par core) et horodatage monotone de l'amorçage ou de la
+    # dernière mesure
+    _cpu_lock = threading.Lock()
+    _cpu_usage = None
+    _cpu_sampled_at = None
+
+    def __init__(self, config, logger):
+        """
+        Initialise le collecteur système
+
+        Args:
+            config: Instance de AgentConfig
+            logger: Instance de AgentLogger
+        """
+        super().__init__(config, logger)
+
+        # Tailles formatées ("1.5 GB") ajoutées aux valeurs brutes en octets
+        agent_config = config.get_agent_config()
+        self.human_readable_bytes = agent_config.get('human_readable_bytes', False)
+
+        # Uptime lisible ("5 jours, 3 heures") en plus de uptime_seconds
+        self.human_readable_uptime = agent_config.get('human_readable_uptime', True)
+
+        # Caractéristiques invariantes pendant la vie du processus
+        # (calculées à la première collecte)
+        self._cpu_static_info = None
+
+        # Temps de démarrage du système (timestamp et forme ISO)
+        self._boot_time = self._safe_execute(
+            lambda: psutil.boot_time(),
+            "Erreur récupération temps de démarrage"
+        )
+        self._boot_time_iso = (
+            datetime.fromtimestamp(self._boot_time).isoformat() if self._boot_time else None
+        )
+
+        # Amorçage de la mesure CPU, sauf si InventoryCollector l'a déjà
+        # fait à sa création
+        self._safe_execute(self.prime_cpu_usage, "Erreur amorçage mesure CPU")
+
     def collect(self) -> Dict[str, Any]:
         """
         Collecte toutes les informations système
@@ -69,19 +153,11 @@ class SystemCollector(BaseCollector):
             dict: Informations détaillées du processeur
         """
         cpu_info = {}
+        static_info = self._get_cpu_static_info()
 
         # Informations de base
-        cpu_info['physical_cores'] = self._safe_execute(
-            lambda: psutil.cpu_count(logical=False),
-            "Erreur récupération cores physiques",
-            0
-        )
-
-        cpu_info['logical_cores'] = self._safe_execute(
-            lambda: psutil.cpu_count(logical=True),
-            "Erreur récupération cores logiques",
-            0
-        )
+        cpu_info['physical_cores'] = static_info['physical_cores']
+        cpu_info['logical_cores'] = static_info['logical_cores']
 
         # Fréquences CPU
         cpu_freq = self._safe_execute(
@@ -98,28 +174,105 @@ class SystemCollector(BaseCollector):
             cpu_info['frequency_min'] = "N/A"
             cpu_info['frequency_max'] = "N/A"
 
-        # Utilisation CPU (moyenne sur 1 seconde)
-        cpu_info['usage_percent'] = self._safe_execute(
-            lambda: round(psutil.cpu_percent(interval=1), 1),
+        # Utilisation CPU (globale et par core) depuis la mesure précédente
+        cpu_info['usage_percent'], cpu_info['usage_per_core'] = self._safe_execute(
+            self._get_cpu_usage,
             "Erreur récupération utilisation CPU",
-            0.0
-        )
-
-        # Utilisation CPU par core
-        cpu_info['usage_per_core'] = self._safe_execute(
-            lambda: [round(x, 1) for x in psutil.cpu_percent(interval=1, percpu=True)],
-            "Erreur récupération utilisation par core",
-            []
+            (0.0, [])
         )
 
         # Nom du processeur (spécifique à la plateforme)
-        cpu_info['model'] = self._get_cpu_model()
+        cpu_info['model'] = static_info['model']
 
         # Architecture
-        cpu_info['architecture'] = platform.machine()
+        cpu_info['architecture'] = static_info['architecture']
 
         return cpu_info
 
+    def _get_cpu_static_info(self) -> Dict[str, Any]:
+        """
+        Retourne les caractéristiques CPU invariantes (mises en cache)
+
+        Le nombre de cores, le modèle (WMI/registre, sysctl ou
+        /proc/cpuinfo) et l'architecture ne changent pas pendant la vie
+        du processus: ils ne sont lus qu'à la première collecte.
+
+        Returns:
+            dict: physical_cores, logical_cores, model, architecture
+        """
+        if self._cpu_static_info is None:
+            self._cpu_static_info = {
+                'physical_cores': self._safe_execute(
+                    lambda: psutil.cpu_count(logical=False),
+                    "Erreur récupération cores physiques",
+                    0
+                ),
+                'logical_cores': self._safe_execute(
+                    lambda: psutil.cpu_count(logical=True),
+                    "Erreur récupération cores logiques",
+                    0
+                ),
+                'model': self._get_cpu_model(),
+                'architecture': PLATFORM_UNAME.machine
+            }
+
+        return self._cpu_static_info
+
+    @classmethod
+    def prime_cpu_usage(cls):
+        """
+        Amorce la mesure d'utilisation CPU (une seule fois par processus)
+
+        psutil mesure l'utilisation entre deux appels non bloquants: la
+        première mesure portera sur l'intervalle écoulé depuis l'amorçage.
+        """
+        with cls._cpu_lock:
+            if cls._cpu_sampled_at is None:
+                psutil.cpu_percent(interval=None, percpu=True)
+                cls._cpu_sampled_at = time.monotonic()
+
+    @classmethod
+    def sample_cpu_usage(cls) -> Tuple[float, List[float]]:
+        """
+        Mesure l'utilisation CPU sans bloquer
+
+        Un seul appel non bloquant (par core) donne l'utilisation depuis la
+        mesure précédente (ou l'amorçage); l'utilisation globale en est la
+        moyenne. Une mesure de moins de CPU_SAMPLE_REUSE secondes est
+        réutilisée; une première mesure moins de CPU_SAMPLE_MIN_INTERVAL
+        après l'amorçage attend la fin de cet intervalle.
+
+        Returns:
+            tuple: (utilisation globale, utilisation par core) en pourcentage
+        """
+        cls.prime_cpu_usage()
+
+        with cls._cpu_lock:
+            elapsed = time.monotonic() - cls._cpu_sampled_at
+            if cls._cpu_usage is not None and elapsed < CPU_SAMPLE_REUSE:
+                return cls._cpu_usage[0], list(cls._cpu_usage[1])
+
+            if elapsed < CPU_SAMPLE_MIN_INTERVAL:
+                # Intervalle trop court pour être significatif
+                time.sleep(CPU_SAMPLE_MIN_INTERVAL - elapsed)
+
+            per_core = psutil.cpu_percent(interval=None, percpu=True)
+            cls._cpu_sampled_at = time.monotonic()
+
+            usage = round(sum(per_core) / len(per_core), 1) if per_core else 0.0
+            cls._cpu_usage = (usage, [round(x, 1) for x in per_core])
+
+            return cls._cpu_usage[0], list(cls._cpu_usage[1])
+
+    def _get_cpu_usage(self) -> Tuple[float, List[float]]:
+        """
+        Retourne l'utilisation CPU (voir sample_cpu_usage)
+
+        Returns:
+            tuple: (utilisation globale, utilisation par core) en pourcentage
+        """
+        return self.sample_cpu_usage()
+
     def _get_cpu_model(self) -> str:
         """
         Récupère le nom/modèle du processeur selon la plateforme
@@ -128,16 +281,8 @@ class SystemCollector(BaseCollector):
             str: Nom du processeur
         """
         if sys.platform == "win32":
-            # Windows - utiliser wmi ou registre
-            try:
-                import wmi
-                c = wmi.WMI()
-                for processor in c.Win32_Processor():
-                    return self._clean_string(processor.Name)
-            except ImportError:
-                pass
-
-            # Fallback: essayer le registre Windows
+            # Windows - lire le registre (une lecture de valeur), même
+            # chaîne que Win32_Processor.Name sans connexion WMI
             try:
                 import winreg
                 key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
@@ -148,6 +293,15 @@ class SystemCollector(BaseCollector):
             except Exception:
                 pass
 
+            # Fallback: interroger WMI
+            try:
+                import wmi
+                c = wmi.WMI()
+                for processor in c.Win32_Processor():
+                    return self._clean_string(processor.Name)
+            except Exception:
+                pass
+
         elif sys.platform == "darwin":
             # macOS - utiliser sysctl
             cpu_name = self._execute_command("sysctl -n machdep.cpu.brand_string")
@@ -155,18 +309,23 @@ class SystemCollector(BaseCollector):
                 return self._clean_string(cpu_name)
 
         else:
-            # Linux - lire /proc/cpuinfo
+            # Linux - lire /proc/cpuinfo (le modèle figure dans le bloc
+            # du premier processeur, en tête de fichier)
             try:
-                with open('/proc/cpuinfo', 'r') as f:
-                    for line in f:
-                        if line.startswith('model name'):
-                            cpu_name = line.split(':', 1)[1].strip()
-                            return self._clean_string(cpu_name)
+                with open('/proc/cpuinfo', 'rb') as f:
+                    data = f.read(4096)
+
+                start = data.find(b'model name')
+                if start != -1:
+                    colon = data.find(b':', start)
+                    end = data.find(b'\n', colon)
+                    cpu_name = data[colon + 1:end if end != -1 else None].strip()
+                    return self._clean_string(cpu_name.decode('utf-8', 'replace'))
             except Exception:
                 pass
 
         # Fallback
-        return platform.processor() or "Unknown"
+        return PLATFORM_UNAME.processor or "Unknown"
 
     def _collect_memory_info(self) -> Dict[str, Any]:
         """
@@ -175,6 +334,12 @@ class SystemCollector(BaseCollector):
         Returns:
             dict: Informations mémoire système
         """
+        # Linux: une seule lecture de /proc/meminfo pour la RAM et le swap
+        if sys.platform.startswith('linux'):
+            meminfo = self._read_meminfo()
+            if meminfo:
+                return self._memory_info_from_meminfo(meminfo)
+
         memory_info = {}
 
         # Mémoire virtuelle (RAM)
@@ -204,18 +369,79 @@ class SystemCollector(BaseCollector):
 
         return memory_info
 
+    def _read_meminfo(self) -> Optional[Dict[bytes, int]]:
+        """
+        Lit les compteurs mémoire de /proc/meminfo (Linux)
+
+        Returns:
+            dict: Champ -> valeur en octets, ou None si illisible
+        """
+        try:
+            with open(MEMINFO_FILE, 'rb') as f:
+                data = f.read(4096)
+        except OSError as e:
+            self.logger.debug(f"Lecture {MEMINFO_FILE} impossible: {e}")
+            return None
+
+        meminfo = {key: int(value) * 1024 for key, value in MEMINFO_RE.findall(data)}
+        return meminfo if b'MemTotal' in meminfo else None
+
+    def _memory_info_from_meminfo(self, meminfo: Dict[bytes, int]) -> Dict[str, Any]:
+        """
+        Construit les informations mémoire depuis /proc/meminfo
+
+        Les valeurs sont calculées comme psutil.virtual_memory() et
+        psutil.swap_memory() (utilisé = total - disponible).
+
+        Args:
+            meminfo: Compteurs retournés par _read_meminfo
+
+        Returns:
+            dict: Informations mémoire système
+        """
+        total = meminfo[b'MemTotal']
+        free = meminfo.get(b'MemFree', 0)
+        available = meminfo.get(b'MemAvailable')
+        if available is None:
+            # Noyaux antérieurs à 3.14: estimation classique
+            available = (free + meminfo.get(b'Buffers', 0) + meminfo.get(b'Cached', 0)
+                         + meminfo.get(b'SReclaimable', 0))
+        used = total - available
+
+        memory_info = {
+            'total': self._format_bytes(total),
+            'available': self._format_bytes(available),
+            'used': self._format_bytes(used),
+            'usage_percent': round(used * 100 / total, 1) if total else 0.0,
+            'free': self._format_bytes(free)
+        }
+
+        swap_total = meminfo.get(b'SwapTotal', 0)
+        swap_free = meminfo.get(b'SwapFree', 0)
+        swap_used = swap_total - swap_free
+
+        memory_info['swap_total'] = self._format_bytes(swap_total)
+        memory_info['swap_used'] = self._format_bytes(swap_used)
+        memory_info['swap_free'] = self._format_bytes(swap_free)
+        memory_info['swap_usage_percent'] = round(swap_used * 100 / swap_total, 1) if swap_total else 0.0
+
+        return memory_info
+
     def _collect_storage_info(self) -> Dict[str, Any]:
         """
         Collecte les informations de stockage
 
+        Les tailles sont des entiers en octets; leur forme lisible n'est
+        ajoutée que si l'option human_readable_bytes est activée.
+
         Returns:
             dict: Informations des disques et partitions
         """
         storage_info = {
             'partitions': [],
-            'total_storage': 0,
-            'used_storage': 0,
-            'free_storage': 0
+            'total_storage_bytes': 0,
+            'used_storage_bytes': 0,
+            'free_storage_bytes': 0
         }
 
         # Récupérer toutes les partitions
@@ -224,12 +450,23 @@ class SystemCollector(BaseCollector):
             "Erreur récupération partitions",
             []
         )
+        partitions = [p for p in partitions if not self._is_skipped_partition(p)]
 
         total_size = 0
         total_used = 0
         total_free = 0
 
-        for partition in partitions:
+        # Interroger les partitions en parallèle: un disque lent, en veille
+        # ou un montage réseau ne retarde plus les suivants
+        usage_futures = []
+        if partitions:
+            with ThreadPoolExecutor(max_workers=min(STORAGE_WORKERS, len(partitions))) as executor:
+                usage_futures = [
+                    executor.submit(self._disk_usage, partition.mountpoint)
+                    for partition in partitions
+                ]
+
+        for partition, usage_future in zip(partitions, usage_futures):
             try:
                 # Informations de la partition
                 partition_info = {
@@ -240,25 +477,25 @@ class SystemCollector(BaseCollector):
 
                 # Utilisation de la partition
                 try:
-                    disk_usage = psutil.disk_usage(partition.mountpoint)
-                    partition_info['total'] = self._format_bytes(disk_usage.total)
-                    partition_info['used'] = self._format_bytes(disk_usage.used)
-                    partition_info['free'] = self._format_bytes(disk_usage.free)
+                    total, used, free = usage_future.result()
+                    partition_info['total_bytes'] = total
+                    partition_info['used_bytes'] = used
+                    partition_info['free_bytes'] = free
                     partition_info['usage_percent'] = round(
-                        (disk_usage.used / disk_usage.total) * 100, 1
-                    ) if disk_usage.total > 0 else 0
+                        (used / total) * 100, 1
+                    ) if total > 0 else 0
 
                     # Additionner pour le total
-                    total_size += disk_usage.total
-                    total_used += disk_usage.used
-                    total_free += disk_usage.free
+                    total_size += total
+                    total_used += used
+                    total_free += free
 
                 except PermissionError:
                     # Partition non accessible
-                    partition_info['total'] = "N/A"
-                    partition_info['used'] = "N/A"
-                    partition_info['free'] = "N/A"
-                    partition_info['usage_percent'] = "N/A"
+                    partition_info['total_bytes'] = None
+                    partition_info['used_bytes'] = None
+                    partition_info['free_bytes'] = None
+                    partition_info['usage_percent'] = None
 
                 storage_info['partitions'].append(partition_info)
 
@@ -266,12 +503,111 @@ class SystemCollector(BaseCollector):
                 self.logger.warning(f"Erreur traitement partition {partition.device}: {e}")
 
         # Totaux
-        storage_info['total_storage'] = self._format_bytes(total_size)
-        storage_info['used_storage'] = self._format_bytes(total_used)
-        storage_info['free_storage'] = self._format_bytes(total_free)
+        storage_info['total_storage_bytes'] = total_size
+        storage_info['used_storage_bytes'] = total_used
+        storage_info['free_storage_bytes'] = total_free
+
+        if self.human_readable_bytes:
+            self._add_human_readable_sizes(storage_info)
 
         return storage_info
 
+    def _disk_usage(self, mountpoint: str) -> Tuple[int, int, int]:
+        """
+        Mesure l'occupation d'une partition par un appel système direct
+
+        os.statvfs (POSIX) ou GetDiskFreeSpaceExW (Windows), sans le
+        namedtuple ni les validations de psutil.disk_usage; les valeurs
+        sont calculées de la même façon.
+
+        Args:
+            mountpoint: Point de montage de la partition
+
+        Returns:
+            tuple: (total, utilisé, libre) en octets
+
+        Raises:
+            PermissionError: Partition non accessible
+        """
+        if hasattr(os, 'statvfs'):
+            st = os.statvfs(mountpoint)
+            total = st.f_blocks * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+            return total, used, free
+
+        kernel32 = self._get_kernel32()
+        if kernel32 is None:
+            usage = psutil.disk_usage(mountpoint)
+            return usage.total, usage.used, usage.free
+
+        import ctypes
+
+        total = ctypes.c_ulonglong()
+        total_free = ctypes.c_ulonglong()
+        if not kernel32.GetDiskFreeSpaceExW(mountpoint, None, ctypes.byref(total),
+                                            ctypes.byref(total_free)):
+            # ERROR_ACCESS_DENIED est traduit en PermissionError
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        return total.value, total.value - total_free.value, total_free.value
+
+    def _get_kernel32(self):
+        """
+        Charge kernel32 via ctypes (une seule fois par processus)
+
+        Returns:
+            ctypes.WinDLL: Bibliothèque kernel32 ou None si indisponible
+        """
+        if SystemCollector._kernel32 is None:
+            import ctypes
+
+            try:
+                kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+                ularge_p = ctypes.POINTER(ctypes.c_ulonglong)
+                kernel32.GetDiskFreeSpaceExW.argtypes = [
+                    ctypes.c_wchar_p, ularge_p, ularge_p, ularge_p
+                ]
+                kernel32.GetDiskFreeSpaceExW.restype = ctypes.c_int
+                SystemCollector._kernel32 = kernel32
+            except (AttributeError, OSError) as e:
+                self.logger.debug(f"kernel32 indisponible: {e}")
+                SystemCollector._kernel32 = False
+
+        return SystemCollector._kernel32 or None
+
+    def _add_human_readable_sizes(self, storage_info: Dict[str, Any]):
+        """
+        Ajoute la forme lisible des tailles de stockage
+
+        Chaque champ 'xxx_bytes' est complété par un champ 'xxx' formaté
+        (ex: "1.5 GB"), comme dans l'ancien format de l'inventaire.
+
+        Args:
+            storage_info: Informations de stockage à compléter
+        """
+        for partition_info in storage_info['partitions']:
+            for key in ('total', 'used', 'free'):
+                partition_info[key] = self._format_bytes(partition_info[f'{key}_bytes'])
+
+        for key in ('total_storage', 'used_storage', 'free_storage'):
+            storage_info[key] = self._format_bytes(storage_info[f'{key}_bytes'])
+
+    @staticmethod
+    def _is_skipped_partition(partition) -> bool:
+        """
+        Indique si une partition est ignorée par la collecte de stockage
+
+        Args:
+            partition: Partition retournée par psutil.disk_partitions()
+
+        Returns:
+            bool: True pour les images snap, tmpfs et périphériques loop
+        """
+        if partition.fstype in SKIPPED_FSTYPES:
+            return True
+        return partition.device.startswith('/dev/loop') or 'loop' in partition.opts.split(',')
+
     def _collect_uptime_info(self) -> Dict[str, Any]:
         """
         Collecte les informations de temps de fonctionnement
@@ -281,43 +617,42 @@ class SystemCollector(BaseCollector):
         """
         uptime_info = {}
 
-        # Temps de démarrage du système
-        boot_time = self._safe_execute(
-            lambda: psutil.boot_time(),
-            "Erreur récupération temps de démarrage"
-        )
+        if not self._boot_time:
+            return uptime_info
 
-        if boot_time:
-            boot_datetime = datetime.fromtimestamp(boot_time)
-            uptime_duration = datetime.now() - boot_datetime
+        # Uptime lu directement sur l'horloge de démarrage (un appel vDSO),
+        # sinon déduit du temps de démarrage
+        if UPTIME_CLOCK is not None:
+            uptime_seconds = int(time.clock_gettime(UPTIME_CLOCK))
+        else:
+            uptime_seconds = int(time.time() - self._boot_time)
 
-            uptime_info['boot_time'] = boot_datetime.isoformat()
-            uptime_info['uptime_seconds'] = int(uptime_duration.total_seconds())
-            uptime_info['uptime_human'] = self._format_uptime(uptime_duration)
+        uptime_info['boot_time'] = self._boot_time_iso
+        uptime_info['uptime_seconds'] = uptime_seconds
+        if self.human_readable_uptime:
+            uptime_info['uptime_human'] = self._format_uptime(uptime_seconds)
 
         return uptime_info
 
-    def _format_uptime(self, uptime_duration: timedelta) -> str:
+    def _format_uptime(self, uptime_seconds: int) -> str:
         """
         Formate la durée d'uptime en format lisible
 
         Args:
-            uptime_duration: Durée d'uptime
+            uptime_seconds: Durée d'uptime en secondes
 
         Returns:
             str: Uptime formaté (ex: "5 jours, 3 heures, 22 minutes")
         """
-        days = uptime_duration.days
-        hours, remainder = divmod(uptime_duration.seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
-
-        parts = []
-        if days > 0:
-            parts.append(f"{days} jour{'s' if days > 1 else ''}")
-        if hours > 0:
-            parts.append(f"{hours} heure{'s' if hours > 1 else ''}")
-        if minutes > 0:
-            parts.append(f"{minutes} minute{'s' if minutes > 1 else ''}")
+        days, remainder = divmod(uptime_seconds, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes = remainder // 60
+
+        parts = [
+            f"{value} {units[value > 1]}"
+            for value, units in zip((days, hours, minutes), UPTIME_UNITS)
+            if value > 0
+        ]
 
         if not parts:
             return "Moins d'une minute"
@@ -353,42 +688,58 @@ class SystemCollector(BaseCollector):
             int: Nombre de processus
         """
         return self._safe_execute(
-            lambda: len(psutil.pids()),
+            self._count_processes,
             "Erreur récupération nombre de processus",
             0
         )
 
+    def _count_processes(self) -> int:
+        """
+        Compte les processus sans construire la liste des PID
+
+        Sous Linux, les entrées numériques de /proc sont comptées au fil de
+        os.scandir; ailleurs, psutil.pids() est utilisé.
+
+        Returns:
+            int: Nombre de processus
+        """
+        if sys.platform.startswith('linux'):
+            with os.scandir('/proc') as entries:
+                return sum(1 for entry in entries if entry.name.isdigit())
+
+        return len(psutil.pids())
+
     def _collect_users_info(self) -> Dict[str, Any]:
         """
         Collecte les informations utilisateurs
 
+        L'heure d'ouverture de session est transmise en timestamp Unix
+        ('started_ts'), sans conversion en date ISO par utilisateur.
+
         Returns:
             dict: Informations utilisateurs connectés
         """
-        users_info = {
-            'logged_users': [],
-            'user_count': 0
-        }
-
         # Utilisateurs connectés
         users = self._safe_execute(
             lambda: psutil.users(),
             "Erreur récupération utilisateurs",
             []
-        )
+        ) or []
 
-        for user in users:
-            user_info = {
+        logged_users = [
+            {
                 'name': user.name,
                 'terminal': user.terminal,
                 'host': user.host,
-                'started': datetime.fromtimestamp(user.started).isoformat()
+                'started_ts': user.started
             }
-            users_info['logged_users'].append(user_info)
-
-        users_info['user_count'] = len(users_info['logged_users'])
+            for user in users
+        ]
 
-        return users_info
+        return {
+            'logged_users': logged_users,
+            'user_count': len(logged_users)
+        }
 
     def _collect_environment_info(self) -> Dict[str, Any]:
         """
@@ -397,21 +748,15 @@ class SystemCollector(BaseCollector):
         Returns:
             dict: Variables d'environnement importantes
         """
-        env_info = {}
-
-        # Variables importantes à collecter
-        important_vars = [
-            'PATH', 'HOME', 'USER', 'USERNAME', 'USERPROFILE',
-            'COMPUTERNAME', 'HOSTNAME', 'LANG', 'TZ'
-        ]
-
-        for var in important_vars:
-            value = os.environ.get(var)
-            if value:
-                # Tronquer PATH s'il est trop long
-                if var == 'PATH' and len(value) > 200:
-                    value = value[:200] + "..."
-                env_info[var.lower()] = value
+        # Variables importantes présentes (intersection calculée en C)
+        environ = os.environ
+        present = IMPORTANT_ENV_VARS & environ.keys()
+        env_info = {var.lower(): environ[var] for var in present if environ[var]}
+
+        # Tronquer PATH s'il est trop long
+        path = env_info.get('path')
+        if path and len(path) > 200:
+            env_info['path'] = path[:200] + "..."
 
         # Répertoire de travail actuel
         env_info['current_directory'] = os.getcwd()
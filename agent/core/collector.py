@@ -8,14 +8,39 @@ Ce module orchestre la collecte de toutes les informations système :
 - Optimisation des performances
 """
 
+import gc
 import os
+import re
 import sys
 import time
 import platform
+import struct
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple
 import socket
 import uuid
+import hashlib
+
+from ..collectors.base import PLATFORM_UNAME, json_dumps
+
+# Durée de validité de l'adresse IP principale mise en cache (secondes)
+PRIMARY_IP_TTL = 300
+
+# Durée de validité (secondes) des données de chaque collecteur
+# spécialisé: les métriques volatiles sont recollectées à chaque envoi ou
+# presque, l'inventaire logiciel et matériel change rarement
+SECTION_TTLS = {
+    'system': 30,
+    'network': 60,
+    'platform': 300,
+    'hardware': 3600,
+    'software': 3600
+}
+
+# Champs utiles de /etc/os-release (valeur éventuellement entre guillemets)
+OS_RELEASE_RE = re.compile(rb'^(PRETTY_NAME|NAME|VERSION)="?([^"\n]*)', re.M)
 
 
 class InventoryCollector:
@@ -54,6 +79,60 @@ class InventoryCollector:
         self._last_collection = None
         self._last_collection_time = None
 
+        # Cache par collecteur spécialisé: nom -> (données, horodatage monotone)
+        self._section_cache: Dict[str, Tuple[Any, float]] = {}
+
+        # Identité réseau principale (IP avec horodatage monotone, MAC)
+        self._primary_ip_cache = (None, 0.0)
+        self._primary_mac_str = None
+        self._computer_id = None
+        self._os_info = None
+
+        # Modèle d'un asset: l'ordre des clés est celui de l'inventaire,
+        # les valeurs None sont renseignées à chaque collecte
+        self._template_asset = {
+            # Métadonnées de collecte
+            'collection_timestamp': None,
+            'agent_version': '1.0.0',
+            'collection_duration_seconds': None,  # Sera mis à jour à la fin
+
+            # Informations système de base
+            'computer_glpi_id': None,
+            'hostname': None,
+            'architecture': None,
+            'os': None,
+
+            # Informations réseau principales
+            'ip': None,
+            'mac': None,
+
+            # Informations machine hôte (pour VMs)
+            'host_machine': '',
+            'host_machine_hostname': '',
+            'host_machine_os': '',
+            'host_machine_architecture': '',
+            'host_machine_mac': '',
+
+            # Collections spécialisées
+            'applications': None,
+            'hardware': None,
+            'network_interfaces': None,
+            'system_info': None
+        }
+
+        # Amorcer la mesure CPU dès maintenant: la première collecte portera
+        # sur l'intervalle écoulé depuis, et non sur la collecte elle-même
+        try:
+            from ..collectors.system import SystemCollector
+            SystemCollector.prime_cpu_usage()
+        except Exception as e:
+            self.logger.warning(f"Impossible d'amorcer la mesure CPU: {e}")
+
+        # Les objets créés jusqu'ici (modules, configuration) vivent aussi
+        # longtemps que l'agent: les exclure des passes du ramasse-miettes
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+
         self.logger.info("InventoryCollector initialisé")
         self.logger.info(f"Collecte logiciels: {self.collect_software}")
         self.logger.info(f"Collecte matériel: {self.collect_hardware}")
@@ -64,7 +143,9 @@ class InventoryCollector:
         Lance la collecte complète d'inventaire
 
         Args:
-            force_refresh: Force une nouvelle collecte même si cache valide
+            force_refresh: Force une nouvelle collecte de tous les
+                collecteurs, même si leurs données sont en cache (sinon
+                chacun réutilise ses données tant que SECTION_TTLS le permet)
 
         Returns:
             dict: Données d'inventaire complètes au format JSON
@@ -78,68 +159,66 @@ class InventoryCollector:
                 self.logger.info("Utilisation du cache de collecte")
                 return self._last_collection
 
-            # Structure de base de l'inventaire
-            inventory = {
-                'assets': [{
-                    # Métadonnées de collecte
-                    'collection_timestamp': datetime.now().isoformat(),
-                    'agent_version': '1.0.0',
-                    'collection_duration_seconds': None,  # Sera mis à jour à la fin
-
-                    # Informations système de base
-                    'computer_glpi_id': self._generate_computer_id(),
-                    'hostname': self._get_hostname(),
-                    'architecture': self._get_architecture(),
-                    'os': self._get_os_info(),
-
-                    # Informations réseau principales
-                    'ip': self._get_primary_ip(),
-                    'mac': self._get_primary_mac(),
-
-                    # Informations machine hôte (pour VMs)
-                    'host_machine': '',
-                    'host_machine_hostname': '',
-                    'host_machine_os': '',
-                    'host_machine_architecture': '',
-                    'host_machine_mac': '',
-
-                    # Collections spécialisées
-                    'applications': [],
-                    'hardware': {},
-                    'network_interfaces': [],
-                    'system_info': {}
-                }]
+            # Libérer l'inventaire précédent avant d'en construire un
+            # nouveau: les deux ne coexistent plus dans le collecteur (les
+            # appelants qui l'ont reçu en gardent leur propre référence)
+            self._last_collection = None
+            self._last_collection_time = None
+
+            # Structure de base de l'inventaire (copie du modèle)
+            asset = self._template_asset.copy()
+            asset['collection_timestamp'] = datetime.now().isoformat()
+            asset['computer_glpi_id'] = self._generate_computer_id()
+            asset['hostname'] = self._get_hostname()
+            asset['architecture'] = self._get_architecture()
+            asset['os'] = self._get_os_info()
+            asset['ip'] = self._get_primary_ip()
+            asset['mac'] = self._get_primary_mac()
+            asset['applications'] = []
+            asset['hardware'] = {}
+            asset['network_interfaces'] = []
+            asset['system_info'] = {}
+
+            inventory = {'assets': [asset]}
+
+            # Collecteurs spécialisés: nom -> (message, fonction)
+            tasks = {
+                'system': ("Collecte des informations système...", self._collect_system_info)
             }
 
-            asset = inventory['assets'][0]
-
-            # Collecte système de base
-            self.logger.info("Collecte des informations système...")
-            system_info = self._collect_system_info()
-            asset['system_info'].update(system_info)
-
-            # Collecte matériel (si activée)
             if self.collect_hardware:
-                self.logger.info("Collecte des informations matériel...")
-                hardware_info = self._collect_hardware_info()
-                asset['hardware'].update(hardware_info)
+                tasks['hardware'] = ("Collecte des informations matériel...",
+                                     self._collect_hardware_info)
 
-            # Collecte logiciels (si activée)
             if self.collect_software:
-                self.logger.info("Collecte des logiciels installés...")
-                software_list = self._collect_software_info()
+                tasks['software'] = ("Collecte des logiciels installés...",
+                                     self._collect_software_info)
+
+            if self.collect_network:
+                tasks['network'] = ("Collecte des informations réseau...",
+                                    self._collect_network_info)
+
+            tasks['platform'] = ("Collecte des informations spécifiques à la plateforme...",
+                                 partial(self._collect_platform_specific, force_refresh))
+
+            results = self._collect_sections(tasks, force_refresh)
+
+            # Assemblage dans l'ordre historique (les informations de
+            # plateforme complètent les informations système)
+            asset['system_info'].update(results['system'])
+
+            if 'hardware' in results:
+                asset['hardware'].update(results['hardware'])
+
+            if 'software' in results:
+                software_list = results['software']
                 self.logger.info(f"Logiciels trouvés... {len(software_list)} ")
                 asset['applications'].extend(software_list)
 
-            # Collecte réseau (si activée)
-            if self.collect_network:
-                self.logger.info("Collecte des informations réseau...")
-                network_interfaces = self._collect_network_info()
-                asset['network_interfaces'].extend(network_interfaces)
+            if 'network' in results:
+                asset['network_interfaces'].extend(results['network'])
 
-            # Collecte spécifique à la plateforme
-            self.logger.info("Collecte des informations spécifiques à la plateforme...")
-            platform_info = self._collect_platform_specific()
+            platform_info = results['platform']
             if platform_info:
                 asset['system_info'].update(platform_info)
 
@@ -161,6 +240,76 @@ class InventoryCollector:
             self.logger.exception("Erreur lors de la collecte d'inventaire")
             raise
 
+    def _collect_sections(self, tasks: Dict[str, Tuple[str, Callable[[], Any]]],
+                          force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Exécute les collecteurs spécialisés dont les données ont expiré
+
+        Les données de chaque collecteur sont conservées SECTION_TTLS[nom]
+        secondes; seuls les collecteurs expirés sont relancés, ou tous si
+        force_refresh est demandé. Ceux-ci sont
+        indépendants et passent l'essentiel de leur temps en attente
+        (appels système, WMI, sous-processus): ils s'exécutent en parallèle.
+        Un résultat vide (collecte en échec) n'est pas mis en cache.
+
+        Args:
+            tasks: Nom -> (message de log, fonction de collecte)
+            force_refresh: Ignore les données en cache et relance tout
+
+        Returns:
+            dict: Nom -> données collectées ou en cache
+        """
+        now = time.monotonic()
+        results = {}
+        pending = {}
+
+        for name, (message, func) in tasks.items():
+            cached = None if force_refresh else self._section_cache.get(name)
+            if cached is not None and now - cached[1] < SECTION_TTLS[name]:
+                self.logger.debug(f"Données {name} en cache réutilisées")
+                results[name] = cached[0]
+            else:
+                self.logger.info(message)
+                pending[name] = func
+
+        if 'system' in pending:
+            # Mesurer l'utilisation CPU avant de lancer les collecteurs: la
+            # collecte système réutilise cette mesure (CPU_SAMPLE_REUSE)
+            # au lieu de mesurer la charge de la collecte elle-même
+            try:
+                from ..collectors.system import SystemCollector
+                SystemCollector.sample_cpu_usage()
+            except Exception as e:
+                self.logger.warning(f"Erreur mesure utilisation CPU: {e}")
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix='collector',
+                                    initializer=self._init_collector_thread) as executor:
+                futures = {name: executor.submit(func) for name, func in pending.items()}
+
+                for name, future in futures.items():
+                    data = future.result()
+                    results[name] = data
+                    if data:
+                        self._section_cache[name] = (data, time.monotonic())
+
+        return results
+
+    @staticmethod
+    def _init_collector_thread():
+        """
+        Initialise un thread de collecte
+
+        Sous Windows, COM doit être initialisé dans chaque thread qui
+        ouvre une connexion WMI (collecteurs système, matériel, réseau).
+        """
+        if sys.platform == "win32":
+            try:
+                import pythoncom
+                pythoncom.CoInitialize()
+            except ImportError:
+                pass
+
     def _is_cache_valid(self, cache_duration_minutes: int = 5) -> bool:
         """
         Vérifie si le cache de collecte est encore valide
@@ -181,23 +330,29 @@ class InventoryCollector:
         """
         Génère un ID unique pour cet ordinateur
 
+        L'empreinte BLAKE2b est identique d'un redémarrage à l'autre,
+        contrairement à hash() dont la graine varie par processus.
+
         Returns:
             int: ID unique basé sur le hostname et MAC
         """
+        if self._computer_id is not None:
+            return self._computer_id
+
         try:
             # Utiliser hostname + MAC principale pour générer un ID stable
             hostname = socket.gethostname()
             mac = self._get_primary_mac()
             unique_string = f"{hostname}_{mac}"
 
-            # Convertir en hash numérique
-            computer_id = abs(hash(unique_string)) % 999999
-            return computer_id
-
         except Exception:
             # Fallback: utiliser un ID basé sur le hostname seul
-            hostname = socket.gethostname()
-            return abs(hash(hostname)) % 999999
+            unique_string = socket.gethostname()
+
+        # Convertir en hash numérique
+        digest = hashlib.blake2b(unique_string.encode('utf-8'), digest_size=4).digest()
+        self._computer_id = int.from_bytes(digest, 'big') % 999999
+        return self._computer_id
 
     def _get_hostname(self) -> str:
         """Récupère le nom d'hôte de la machine"""
@@ -210,43 +365,48 @@ class InventoryCollector:
     def _get_architecture(self) -> str:
         """Récupère l'architecture du processeur"""
         try:
-            machine = platform.machine()
+            machine = PLATFORM_UNAME.machine
             if machine in ['x86_64', 'AMD64']:
                 return '64-bit'
             elif machine in ['i386', 'i686', 'x86']:
                 return '32-bit'
             else:
-                return f"{machine} ({platform.architecture()[0]})"
+                # Taille des pointeurs de l'interpréteur, comme
+                # platform.architecture() mais sans lancer la commande file
+                return f"{machine} ({struct.calcsize('P') * 8}bit)"
         except Exception as e:
             self.logger.warning(f"Impossible de récupérer l'architecture: {e}")
             return "Unknown"
 
     def _get_os_info(self) -> str:
         """Récupère les informations détaillées du système d'exploitation"""
+        if self._os_info is None:
+            self._os_info = self._read_os_info()
+        return self._os_info
+
+    def _read_os_info(self) -> str:
+        """Lit les informations du système d'exploitation (une seule fois)"""
         try:
             if sys.platform == "win32":
                 # Windows
-                import platform
-                return f"{platform.system()} {platform.release()} {platform.version()}"
+                return f"{PLATFORM_UNAME.system} {PLATFORM_UNAME.release} {PLATFORM_UNAME.version}"
 
             elif sys.platform == "darwin":
                 # macOS
-                import platform
                 mac_version = platform.mac_ver()[0]
                 return f"macOS {mac_version}"
 
             else:
                 # Linux et autres Unix
                 try:
-                    # Essayer de lire /etc/os-release
-                    with open('/etc/os-release', 'r') as f:
-                        lines = f.readlines()
+                    # Essayer de lire /etc/os-release (quelques centaines
+                    # d'octets, parsés sans décodage ligne à ligne)
+                    with open('/etc/os-release', 'rb') as f:
+                        data = f.read(2048)
 
                     os_info = {}
-                    for line in lines:
-                        if '=' in line:
-                            key, value = line.strip().split('=', 1)
-                            os_info[key] = value.strip('"')
+                    for key, value in OS_RELEASE_RE.findall(data):
+                        os_info.setdefault(key.decode(), value.decode('utf-8', 'replace'))
 
                     if 'PRETTY_NAME' in os_info:
                         return os_info['PRETTY_NAME']
@@ -257,14 +417,29 @@ class InventoryCollector:
                     pass
 
                 # Fallback pour Linux
-                return f"{platform.system()} {platform.release()}"
+                return f"{PLATFORM_UNAME.system} {PLATFORM_UNAME.release}"
 
         except Exception as e:
             self.logger.warning(f"Impossible de récupérer les infos OS: {e}")
-            return f"{platform.system()} {platform.release()}"
+            return f"{PLATFORM_UNAME.system} {PLATFORM_UNAME.release}"
 
     def _get_primary_ip(self) -> str:
-        """Récupère l'adresse IP principale de la machine"""
+        """
+        Récupère l'adresse IP principale de la machine
+
+        L'interface principale change rarement: le résultat est conservé
+        PRIMARY_IP_TTL secondes (ou jusqu'à clear_cache).
+        """
+        ip, resolved_at = self._primary_ip_cache
+        if ip is not None and time.monotonic() - resolved_at < PRIMARY_IP_TTL:
+            return ip
+
+        ip = self._resolve_primary_ip()
+        self._primary_ip_cache = (ip, time.monotonic())
+        return ip
+
+    def _resolve_primary_ip(self) -> str:
+        """Détermine l'adresse IP principale de la machine"""
         try:
             # Méthode rapide: connexion UDP vers un serveur externe
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
@@ -285,6 +460,9 @@ class InventoryCollector:
 
     def _get_primary_mac(self) -> str:
         """Récupère l'adresse MAC de l'interface réseau principale"""
+        if self._primary_mac_str is not None:
+            return self._primary_mac_str
+
         try:
             # Utiliser l'UUID du nœud (basé sur MAC)
             mac_int = uuid.getnode()
@@ -292,6 +470,7 @@ class InventoryCollector:
 
             # Formatter en MAC address standard
             mac_formatted = ":".join([mac_hex[i:i+2] for i in range(0, 12, 2)])
+            self._primary_mac_str = mac_formatted
             return mac_formatted
 
         except Exception as e:
@@ -384,10 +563,13 @@ class InventoryCollector:
             self.logger.error(f"Erreur collecte réseau: {e}")
             return []
 
-    def _collect_platform_specific(self) -> Dict[str, Any]:
+    def _collect_platform_specific(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Collecte les informations spécifiques à la plateforme
 
+        Args:
+            force_refresh: Ignore le cache des sections du collecteur
+
         Returns:
             dict: Informations spécifiques à la plateforme
         """
@@ -407,7 +589,7 @@ class InventoryCollector:
             if not self._platform_collector:
                 self._platform_collector = collector_class(self.config, self.logger)
 
-            return self._platform_collector.collect()
+            return self._platform_collector.collect(force_refresh)
 
         except Exception as e:
             self.logger.error(f"Erreur collecte spécifique plateforme: {e}")
@@ -435,8 +617,40 @@ class InventoryCollector:
             'cache_valid': self._is_cache_valid()
         }
 
+    def to_json_bytes(self) -> Optional[bytes]:
+        """
+        Sérialise la dernière collecte en JSON (orjson si disponible)
+
+        Returns:
+            bytes: Inventaire encodé en UTF-8 ou None si aucune collecte
+        """
+        if not self._last_collection:
+            return None
+        return json_dumps(self._last_collection)
+
+    def close(self):
+        """
+        Libère les ressources des collecteurs spécialisés
+
+        Arrête les processus et threads gardés entre deux collectes (ex:
+        PowerShell persistant et thread WMI sous Windows).
+        """
+        for collector in (self._system_collector, self._hardware_collector,
+                          self._software_collector, self._network_collector,
+                          self._platform_collector):
+            if collector is not None:
+                try:
+                    collector.close()
+                except Exception as e:
+                    self.logger.warning(f"Erreur fermeture collecteur: {e}")
+
     def clear_cache(self):
         """Vide le cache de collecte pour forcer une nouvelle collecte"""
         self._last_collection = None
         self._last_collection_time = None
+        self._section_cache.clear()
+        self._primary_ip_cache = (None, 0.0)
+
+        if self._platform_collector is not None:
+            self._platform_collector.clear_cache()
         self.logger.info("Cache de collecte vidé")
\ No newline at end of file
@@ -10,9 +10,96 @@ Ce module gère la configuration de l'agent, incluant :
 
 import os
 import sys
+import threading
 import configparser
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+from .fast_config import FastConfigParser
+
+
+# Schémas acceptés pour l'URL du serveur
+URL_PREFIXES = ('http://', 'https://')
+
+# Options à valeurs énumérées vérifiées par validate():
+# (section, option) -> (valeurs autorisées, message d'erreur)
+CONFIG_CHOICES = {
+    ('agent', 'reporting_frequency'): (
+        frozenset(('daily', 'weekly', 'monthly')),
+        "Fréquence de rapport invalide (doit être: daily, weekly, monthly)"
+    ),
+    ('agent', 'log_level'): (
+        frozenset(('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')),
+        "Niveau de log invalide"
+    ),
+}
+
+
+def default_log_path() -> str:
+    """
+    Détermine le chemin par défaut des logs selon la plateforme
+
+    Returns:
+        str: Chemin vers le fichier de log
+    """
+    if sys.platform == "win32":
+        return os.path.join(
+            os.environ.get("PROGRAMDATA", "C:\\ProgramData"),
+            "WatchmanAgentClient",
+            "logs",
+            "agent.log"
+        )
+    else:
+        return "/var/log/watchman-agent-client/agent.log"
+
+
+def build_defaults() -> Dict[str, Dict[str, str]]:
+    """
+    Construit les valeurs de configuration par défaut
+
+    Returns:
+        dict: Section -> {option: valeur}, dans le format de read_dict()
+    """
+    return {
+        # Configuration serveur
+        'server': {
+            'url': 'http://localhost:8000/api/v1/inventory',
+            'auth_token': '',
+            'timeout': '30',
+            'verify_ssl': 'false'
+        },
+
+        # Configuration agent
+        'agent': {
+            'reporting_frequency': 'daily',  # daily, weekly, monthly
+            'log_level': 'INFO',
+            'collect_software': 'true',
+            'collect_hardware': 'true',
+            'collect_network': 'true',
+            'human_readable_bytes': 'false',
+            'human_readable_uptime': 'true',
+            'macos_deep_app_scan': 'false'
+        },
+
+        # Configuration interface web
+        'web_interface': {
+            'enabled': 'true',
+            'port': '18743',
+            'host': '127.0.0.1'
+        },
+
+        # Configuration logging
+        'logging': {
+            'log_file': default_log_path(),
+            'max_log_size': '10485760',  # 10MB
+            'backup_count': '5',
+            'console': 'false'
+        }
+    }
+
+
+# Configuration par défaut, construite une fois à l'import
+DEFAULTS = build_defaults()
 
 
 class AgentConfig:
@@ -21,8 +108,37 @@ class AgentConfig:
 
     Cette classe centralise la gestion de toute la configuration de l'agent,
     incluant les paramètres serveur, agent, et interface web.
+
+    Une seule instance existe par fichier de configuration: les fichiers
+    ne sont lus et analysés qu'une fois par processus (agent, interface
+    web et composants partagent la même configuration).
     """
 
+    # Instances par chemin absolu du fichier de configuration
+    _instances: Dict[str, 'AgentConfig'] = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, config_file: Optional[str] = None):
+        """
+        Retourne l'instance associée au fichier de configuration
+
+        Args:
+            config_file: Chemin vers le fichier de configuration (optionnel)
+
+        Returns:
+            AgentConfig: Instance partagée
+        """
+        key = os.path.abspath(config_file or cls._get_default_config_path())
+
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instances[key] = instance
+
+        return instance
+
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialise la configuration de l'agent
@@ -30,16 +146,63 @@ class AgentConfig:
         Args:
             config_file: Chemin vers le fichier de configuration (optionnel)
         """
+        if self._initialized:
+            # Instance déjà chargée: ne pas relire les fichiers
+            return
+        self._initialized = True
+
         self.config = configparser.ConfigParser()
         self.config_file = config_file or self._get_default_config_path()
 
+        # Valeurs typées déjà lues: (section, option, type, fallback) -> valeur
+        # (vidé à chaque modification de la configuration)
+        self._cache: Dict[tuple, Any] = {}
+
+        # Version incrémentée à chaque modification, et résumé de la
+        # configuration rendu pour cette version (voir get_config_summary)
+        self._version = 0
+        self._summary: Optional[Tuple[int, Tuple[str, ...]]] = None
+
         # Définir les valeurs par défaut
         self._set_defaults()
 
         # Charger la configuration depuis le fichier
         self._load_config()
 
-    def _get_default_config_path(self) -> str:
+    def copy(self) -> 'AgentConfig':
+        """
+        Retourne une copie indépendante de la configuration
+
+        La copie n'est pas l'instance partagée: ses modifications (ex:
+        paramètres d'un test de connexion) ne touchent pas la
+        configuration de l'agent.
+
+        Returns:
+            AgentConfig: Copie hors du registre des instances partagées
+        """
+        clone = object.__new__(AgentConfig)
+        clone._initialized = True
+        clone.config = configparser.ConfigParser()
+        clone.config.read_dict(self.config)
+        clone.config_file = self.config_file
+        clone._cache = {}
+        clone._version = 0
+        clone._summary = None
+        return clone
+
+    def reload(self):
+        """
+        Relit la configuration depuis les fichiers
+
+        L'instance étant partagée, c'est le seul moyen de prendre en compte
+        une modification faite sur le disque par un autre processus.
+        """
+        self.config = configparser.ConfigParser()
+        self._set_defaults()
+        self._load_config()
+
+    @staticmethod
+    def _get_default_config_path() -> str:
         """
         Détermine le chemin par défaut du fichier de configuration selon la plateforme
 
@@ -68,49 +231,8 @@ class AgentConfig:
         Ces valeurs sont utilisées si aucun fichier de configuration n'est trouvé
         ou si certaines sections/clés sont manquantes.
         """
-        # Configuration serveur
-        self.config.add_section('server')
-        self.config.set('server', 'url', 'http://localhost:8000/api/v1/inventory')
-        self.config.set('server', 'auth_token', '')
-        self.config.set('server', 'timeout', '30')
-        self.config.set('server', 'verify_ssl', 'false')
-
-        # Configuration agent
-        self.config.add_section('agent')
-        self.config.set('agent', 'reporting_frequency', 'daily')  # daily, weekly, monthly
-        self.config.set('agent', 'log_level', 'INFO')
-        self.config.set('agent', 'collect_software', 'true')
-        self.config.set('agent', 'collect_hardware', 'true')
-        self.config.set('agent', 'collect_network', 'true')
-
-        # Configuration interface web
-        self.config.add_section('web_interface')
-        self.config.set('web_interface', 'enabled', 'true')
-        self.config.set('web_interface', 'port', '18743')
-        self.config.set('web_interface', 'host', '127.0.0.1')
-
-        # Configuration logging
-        self.config.add_section('logging')
-        self.config.set('logging', 'log_file', self._get_default_log_path())
-        self.config.set('logging', 'max_log_size', '10485760')  # 10MB
-        self.config.set('logging', 'backup_count', '5')
-
-    def _get_default_log_path(self) -> str:
-        """
-        Détermine le chemin par défaut des logs selon la plateforme
-
-        Returns:
-            str: Chemin vers le fichier de log
-        """
-        if sys.platform == "win32":
-            return os.path.join(
-                os.environ.get("PROGRAMDATA", "C:\\ProgramData"),
-                "WatchmanAgentClient",
-                "logs",
-                "agent.log"
-            )
-        else:
-            return "/var/log/watchman-agent-client/agent.log"
+        # Valeurs préparées une seule fois à l'import du module
+        self.config.read_dict(DEFAULTS)
 
     def _load_config(self):
         """
@@ -119,12 +241,14 @@ class AgentConfig:
         Si le fichier n'existe pas, utilise les valeurs par défaut.
         En cas d'erreur de lecture, log l'erreur et continue avec les défauts.
         """
+        self._invalidate()
+
         try:
             # Charger le fichier de configuration principal
-            if os.path.exists(self.config_file):
-                self.config.read(self.config_file)
+            try:
+                self.config.read_dict(FastConfigParser().read(self.config_file))
                 print(f"Configuration chargée depuis: {self.config_file}")
-            else:
+            except FileNotFoundError:
                 print(f"Fichier de configuration non trouvé: {self.config_file}")
                 print("Utilisation des valeurs par défaut")
 
@@ -141,6 +265,8 @@ class AgentConfig:
 
         Cette configuration a priorité sur la configuration par défaut.
         """
+        self._invalidate()
+
         try:
             # Chemin vers le fichier server.conf créé par l'installateur
             if sys.platform == "win32":
@@ -151,19 +277,14 @@ class AgentConfig:
             else:
                 installer_config_path = "/etc/watchman-agent-client/server.conf"
 
-            if os.path.exists(installer_config_path):
-                installer_config = configparser.ConfigParser()
-                installer_config.read(installer_config_path)
-
-                # Copier les sections du fichier installateur vers la config principale
-                for section_name in installer_config.sections():
-                    if not self.config.has_section(section_name):
-                        self.config.add_section(section_name)
+            # Copier les sections du fichier installateur vers la config principale
+            self.config.read_dict(FastConfigParser().read(installer_config_path))
 
-                    for option, value in installer_config.items(section_name):
-                        self.config.set(section_name, option, value)
+            print(f"Configuration serveur de l'installateur chargée depuis: {installer_config_path}")
 
-                print(f"Configuration serveur de l'installateur chargée depuis: {installer_config_path}")
+        except FileNotFoundError:
+            # Pas de configuration installateur
+            pass
 
         except Exception as e:
             print(f"Erreur lors du chargement de la configuration installateur: {e}")
@@ -181,7 +302,7 @@ class AgentConfig:
         Returns:
             str: Valeur de configuration
         """
-        return self.config.get(section, option, fallback=fallback)
+        return self._cached_lookup(self.config.get, 's', section, option, fallback)
 
     def getboolean(self, section: str, option: str, fallback: bool = False) -> bool:
         """
@@ -195,7 +316,7 @@ class AgentConfig:
         Returns:
             bool: Valeur booléenne
         """
-        return self.config.getboolean(section, option, fallback=fallback)
+        return self._cached_lookup(self.config.getboolean, 'b', section, option, fallback)
 
     def getint(self, section: str, option: str, fallback: int = 0) -> int:
         """
@@ -209,7 +330,32 @@ class AgentConfig:
         Returns:
             int: Valeur entière
         """
-        return self.config.getint(section, option, fallback=fallback)
+        return self._cached_lookup(self.config.getint, 'i', section, option, fallback)
+
+    def _cached_lookup(self, getter, kind: str, section: str, option: str, fallback: Any) -> Any:
+        """
+        Lit une valeur typée via configparser, une seule fois
+
+        configparser refait l'interpolation et la normalisation à chaque
+        lecture: le résultat converti est conservé jusqu'à la prochaine
+        modification (set, chargement).
+
+        Args:
+            getter: Méthode de lecture de ConfigParser (get, getboolean, getint)
+            kind: Type de la valeur ('s', 'b' ou 'i')
+            section: Nom de la section
+            option: Nom de l'option
+            fallback: Valeur par défaut si non trouvée
+
+        Returns:
+            Valeur de configuration convertie
+        """
+        key = (section, option, kind, fallback)
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = getter(section, option, fallback=fallback)
+            return value
 
     def set(self, section: str, option: str, value: str):
         """
@@ -223,6 +369,12 @@ class AgentConfig:
         if not self.config.has_section(section):
             self.config.add_section(section)
         self.config.set(section, option, str(value))
+        self._invalidate()
+
+    def _invalidate(self):
+        """Invalide les valeurs mises en cache après une modification"""
+        self._cache.clear()
+        self._version += 1
 
     def save(self):
         """
@@ -233,11 +385,11 @@ class AgentConfig:
         try:
             # Créer le dossier parent si nécessaire
             config_dir = os.path.dirname(self.config_file)
-            if config_dir and not os.path.exists(config_dir):
+            if config_dir:
                 os.makedirs(config_dir, exist_ok=True)
 
             # Sauvegarder la configuration
-            with open(self.config_file, 'w') as f:
+            with open(self.config_file, 'w', encoding='utf-8') as f:
                 self.config.write(f)
 
             print(f"Configuration sauvegardée dans: {self.config_file}")
@@ -271,7 +423,10 @@ class AgentConfig:
             'log_level': self.get('agent', 'log_level', 'INFO'),
             'collect_software': self.getboolean('agent', 'collect_software', True),
             'collect_hardware': self.getboolean('agent', 'collect_hardware', True),
-            'collect_network': self.getboolean('agent', 'collect_network', True)
+            'collect_network': self.getboolean('agent', 'collect_network', True),
+            'human_readable_bytes': self.getboolean('agent', 'human_readable_bytes', False),
+            'human_readable_uptime': self.getboolean('agent', 'human_readable_uptime', True),
+            'macos_deep_app_scan': self.getboolean('agent', 'macos_deep_app_scan', False)
         }
 
     def get_web_config(self) -> Dict[str, Any]:
@@ -287,6 +442,38 @@ class AgentConfig:
             'host': self.get('web_interface', 'host', '127.0.0.1')
         }
 
+    def get_config_summary(self) -> Tuple[str, ...]:
+        """
+        Retourne le résumé de la configuration (sans les données sensibles)
+
+        Les lignes sont rendues une fois par version de la configuration.
+
+        Returns:
+            tuple: Lignes "Section.option: valeur"
+        """
+        if self._summary is not None and self._summary[0] == self._version:
+            return self._summary[1]
+
+        lines = []
+
+        # Configuration agent (sans token)
+        for key, value in self.get_agent_config().items():
+            lines.append(f"Agent.{key}: {value}")
+
+        # Configuration web
+        for key, value in self.get_web_config().items():
+            lines.append(f"Web.{key}: {value}")
+
+        # Configuration serveur (sans token pour sécurité)
+        for key, value in self.get_server_config().items():
+            if key == 'auth_token':
+                # Ne pas logger le token complet pour sécurité
+                value = value[:8] + "..." if len(value) > 8 else "Non configuré"
+            lines.append(f"Server.{key}: {value}")
+
+        self._summary = (self._version, tuple(lines))
+        return self._summary[1]
+
     def validate(self) -> bool:
         """
         Valide la configuration courante
@@ -298,18 +485,13 @@ class AgentConfig:
 
         # Valider l'URL du serveur
         server_url = self.get('server', 'url')
-        if not server_url or not server_url.startswith(('http://', 'https://')):
+        if not server_url or not server_url.startswith(URL_PREFIXES):
             errors.append("URL serveur invalide")
 
-        # Valider la fréquence de rapport
-        frequency = self.get('agent', 'reporting_frequency')
-        if frequency not in ['daily', 'weekly', 'monthly']:
-            errors.append("Fréquence de rapport invalide (doit être: daily, weekly, monthly)")
-
-        # Valider le niveau de log
-        log_level = self.get('agent', 'log_level')
-        if log_level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
-            errors.append("Niveau de log invalide")
+        # Valider les options à valeurs énumérées (fréquence, niveau de log)
+        for (section, option), (choices, error) in CONFIG_CHOICES.items():
+            if self.get(section, option) not in choices:
+                errors.append(error)
 
         # Valider le port web
         web_port = self.getint('web_interface', 'port')
@@ -324,6 +506,19 @@ class AgentConfig:
         return True
 
 
+def get_config(config_file: Optional[str] = None) -> AgentConfig:
+    """
+    Retourne la configuration partagée du processus
+
+    Args:
+        config_file: Chemin vers le fichier de configuration (optionnel)
+
+    Returns:
+        AgentConfig: Instance chargée une seule fois par fichier
+    """
+    return AgentConfig(config_file)
+
+
 # Fonction utilitaire pour créer une configuration par défaut
 def create_default_config(config_path: str) -> AgentConfig:
     """
@@ -0,0 +1,70 @@
+"""
+Lecteur rapide de fichiers de configuration pour l'agent d'inventaire
+
+Les fichiers de l'agent (config.ini, default.conf, server.conf) n'utilisent
+ni interpolation ni valeurs multilignes: deux expressions régulières
+suffisent à les lire, nettement plus vite que configparser. Le résultat
+est injecté dans le ConfigParser d'AgentConfig, qui reste le stockage.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict
+
+# En-tête de section: [nom]
+SECTION_RE = re.compile(r'^\[([^\]\n]+)\]', re.M)
+
+# Option: clé = valeur (ou clé: valeur); les lignes commençant par # ou ;
+# sont des commentaires
+OPTION_RE = re.compile(r'^[ \t]*([^=:;#\s\[][^=:\n]*?)[ \t]*[=:][ \t]*(.*?)[ \t]*$', re.M)
+
+
+class FastConfigParser:
+    """
+    Lecteur INI minimal basé sur deux expressions régulières
+
+    Comme configparser, les valeurs sont conservées telles quelles (un
+    commentaire en fin de ligne fait partie de la valeur). Les options
+    situées avant la première section sont ignorées.
+    """
+
+    def __init__(self):
+        """Initialise un lecteur vide"""
+        self.sections: Dict[str, Dict[str, str]] = {}
+
+    def read(self, file_path: str) -> Dict[str, Dict[str, str]]:
+        """
+        Lit un fichier de configuration (lecture unique, UTF-8)
+
+        Args:
+            file_path: Chemin vers le fichier
+
+        Returns:
+            dict: Section -> {option: valeur}
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+        """
+        return self.read_string(Path(file_path).read_text(encoding='utf-8'))
+
+    def read_string(self, text: str) -> Dict[str, Dict[str, str]]:
+        """
+        Lit une configuration depuis une chaîne
+
+        Args:
+            text: Contenu INI
+
+        Returns:
+            dict: Section -> {option: valeur}
+        """
+        headers = list(SECTION_RE.finditer(text))
+
+        for index, header in enumerate(headers):
+            # Une section s'étend jusqu'à l'en-tête suivant
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+            options = self.sections.setdefault(header.group(1).strip(), {})
+
+            for match in OPTION_RE.finditer(text, header.end(), end):
+                options[match.group(1).lower()] = match.group(2)
+
+        return self.sections
@@ -11,11 +11,24 @@ Ce module fournit un système de logging centralisé avec :
 import os
 import sys
 import logging
-import logging.handlers
 from typing import Optional
 from pathlib import Path
 
 
+# Niveaux de log reconnus dans la configuration (agent.log_level)
+LOG_LEVELS = {name: getattr(logging, name)
+              for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
+# Format des messages de log (fichier)
+FILE_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Format simplifié pour la console
+CONSOLE_FORMATTER = logging.Formatter(fmt='%(levelname)s - %(message)s')
+
+
 class AgentLogger:
     """
     Gestionnaire de logging pour l'agent d'inventaire
@@ -54,53 +67,49 @@ class AgentLogger:
             log_file = self.config.get('logging', 'log_file')
             max_size = self.config.getint('logging', 'max_log_size', 10485760)  # 10MB
             backup_count = self.config.getint('logging', 'backup_count', 5)
+            console = self.config.getboolean('logging', 'console', False)
         else:
             log_level_str = 'INFO'
             log_file = self._get_default_log_file()
             max_size = 10485760  # 10MB
             backup_count = 5
+            console = False
 
         # Convertir le niveau de log string en constante logging
-        log_level = getattr(logging, log_level_str.upper(), logging.INFO)
+        log_level = LOG_LEVELS.get(log_level_str.upper(), logging.INFO)
         self.logger.setLevel(log_level)
 
-        # Format des messages de log
-        formatter = logging.Formatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-
         # Handler pour fichier avec rotation
         try:
             # Créer le dossier de log si nécessaire
             log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
+            if log_dir:
                 os.makedirs(log_dir, exist_ok=True)
 
-            # Handler avec rotation automatique
-            file_handler = logging.handlers.RotatingFileHandler(
+            # Handler avec rotation automatique (logging.handlers n'est
+            # importé qu'ici)
+            from logging.handlers import RotatingFileHandler
+
+            file_handler = RotatingFileHandler(
                 filename=log_file,
                 maxBytes=max_size,
                 backupCount=backup_count,
                 encoding='utf-8'
             )
             file_handler.setLevel(log_level)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(FILE_FORMATTER)
             self.logger.addHandler(file_handler)
 
         except Exception as e:
             print(f"Erreur lors de la configuration du logging fichier: {e}")
 
-        # Handler pour la console (utile en développement)
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-
-        # Format simplifié pour la console
-        console_formatter = logging.Formatter(
-            fmt='%(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        # Handler pour la console (utile en développement): inutile en
+        # service, où stdout n'est pas lu, sauf si logging.console l'active
+        if console or self._stdout_is_tty():
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(CONSOLE_FORMATTER)
+            self.logger.addHandler(console_handler)
 
         # Message de démarrage
         self.logger.info("Système de logging initialisé")
@@ -108,6 +117,19 @@ class AgentLogger:
             self.logger.info(f"Niveau de log: {log_level_str}")
             self.logger.info(f"Fichier de log: {log_file}")
 
+    @staticmethod
+    def _stdout_is_tty() -> bool:
+        """
+        Indique si la sortie standard est un terminal
+
+        Returns:
+            bool: False si stdout est absent (pythonw, service) ou redirigé
+        """
+        try:
+            return sys.stdout is not None and sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            return False
+
     def _get_default_log_file(self) -> str:
         """
         Détermine le fichier de log par défaut selon la plateforme
@@ -187,25 +209,9 @@ class AgentLogger:
         """
         self.info("=== Configuration de l'agent ===")
 
-        # Configuration agent (sans token)
-        agent_config = config.get_agent_config()
-        for key, value in agent_config.items():
-            self.info(f"Agent.{key}: {value}")
-
-        # Configuration web
-        web_config = config.get_web_config()
-        for key, value in web_config.items():
-            self.info(f"Web.{key}: {value}")
-
-        # Configuration serveur (sans token pour sécurité)
-        server_config = config.get_server_config()
-        for key, value in server_config.items():
-            if key == 'auth_token':
-                # Ne pas logger le token complet pour sécurité
-                token_preview = value[:8] + "..." if len(value) > 8 else "Non configuré"
-                self.info(f"Server.{key}: {token_preview}")
-            else:
-                self.info(f"Server.{key}: {value}")
+        # Lignes rendues une fois par version de la configuration
+        for line in config.get_config_summary():
+            self.info(line)
 
         self.info("=== Fin configuration ===")
 
@@ -12,7 +12,6 @@ import time
 import threading
 from datetime import datetime, timedelta
 from typing import Callable, Optional
-import schedule
 from enum import Enum
 
 
@@ -24,6 +23,44 @@ class FrequencyType(Enum):
     HOURLY = "hourly"  # Pour les tests
 
 
+# Bornes (secondes) de l'attente entre deux vérifications: la boucle dort
+# jusqu'à la prochaine exécution, en se réveillant au moins toutes les
+# heures (changement de fréquence, dérive de l'horloge)
+LOOP_MIN_WAIT = 1
+LOOP_MAX_WAIT = 3600
+
+
+# Intervalle entre deux exécutions (la fréquence mensuelle suit le
+# calendrier, voir InventoryScheduler._add_months)
+RUN_STEPS = {
+    FrequencyType.HOURLY: timedelta(hours=1),
+    FrequencyType.DAILY: timedelta(days=1),
+    FrequencyType.WEEKLY: timedelta(weeks=1)
+}
+
+
+# Planification par fréquence: (création de la tâche à partir du module
+# schedule, description)
+SCHEDULES = {
+    # Pour les tests - chaque heure
+    FrequencyType.HOURLY: (lambda schedule: schedule.every().hour, "toutes les heures"),
+
+    # Chaque jour à 02:00 du matin (évite les heures de pointe)
+    FrequencyType.DAILY: (lambda schedule: schedule.every().day.at("02:00"),
+                          "quotidienne à 02:00"),
+
+    # Chaque dimanche à 02:00
+    FrequencyType.WEEKLY: (lambda schedule: schedule.every().sunday.at("02:00"),
+                           "hebdomadaire le dimanche à 02:00"),
+
+    # Le premier de chaque mois à 02:00
+    # Note: schedule ne supporte pas directement "monthly", la tâche
+    # quotidienne vérifie le jour du mois (_check_monthly_schedule)
+    FrequencyType.MONTHLY: (lambda schedule: schedule.every().day.at("02:00"),
+                            "mensuelle le 1er du mois à 02:00")
+}
+
+
 class InventoryScheduler:
     """
     Gestionnaire de planification pour l'agent d'inventaire
@@ -32,6 +69,10 @@ class InventoryScheduler:
     automatique des collectes d'inventaire selon la fréquence configurée.
     """
 
+    # Module 'schedule' importé à la première instanciation: les commandes
+    # qui ne démarrent pas le scheduler n'en paient pas le coût
+    _schedule = None
+
     def __init__(self, config, logger, inventory_callback: Callable[[], None]):
         """
         Initialise le scheduler
@@ -44,58 +85,69 @@ class InventoryScheduler:
         self.config = config
         self.logger = logger.get_logger()
         self.inventory_callback = inventory_callback
+        self._schedule = self._get_schedule()
 
         # État du scheduler
         self.is_running = False
         self.scheduler_thread = None
         self.stop_event = threading.Event()
 
-        # Planification
-        self.frequency = None
+        # Planification (fréquence résolue une seule fois)
+        self._frequency_str = self.config.get('agent', 'reporting_frequency', 'daily')
+        self.frequency = self._resolve_frequency(self._frequency_str)
         self.next_run = None
+        self._job = None
 
         self._setup_schedule()
 
         self.logger.info("InventoryScheduler initialisé")
 
-    def _setup_schedule(self):
+    @classmethod
+    def _get_schedule(cls):
         """
-        Configure la planification basée sur la configuration
+        Importe le module schedule (une seule fois par processus)
+
+        Returns:
+            module: Module schedule
+        """
+        if cls._schedule is None:
+            import schedule
+            cls._schedule = schedule
+
+        return cls._schedule
+
+    def _resolve_frequency(self, frequency_str: str) -> FrequencyType:
         """
-        # Récupérer la fréquence depuis la configuration
-        frequency_str = self.config.get('agent', 'reporting_frequency', 'daily')
+        Convertit la fréquence configurée en FrequencyType
+
+        Args:
+            frequency_str: Fréquence (daily, weekly, monthly, hourly)
 
+        Returns:
+            FrequencyType: Fréquence reconnue ou DAILY par défaut
+        """
         try:
-            self.frequency = FrequencyType(frequency_str)
+            return FrequencyType(frequency_str)
         except ValueError:
             self.logger.warning(f"Fréquence inconnue '{frequency_str}', utilisation de 'daily'")
-            self.frequency = FrequencyType.DAILY
+            return FrequencyType.DAILY
 
+    def _setup_schedule(self):
+        """
+        Configure la planification basée sur la fréquence résolue
+        """
         # Effacer les tâches existantes
-        schedule.clear()
+        self._schedule.clear()
 
         # Configurer la nouvelle planification
-        if self.frequency == FrequencyType.HOURLY:
-            # Pour les tests - chaque heure
-            schedule.every().hour.do(self._scheduled_inventory)
-            self.logger.info("Planification configurée: toutes les heures")
-
-        elif self.frequency == FrequencyType.DAILY:
-            # Chaque jour à 02:00 du matin (évite les heures de pointe)
-            schedule.every().day.at("02:00").do(self._scheduled_inventory)
-            self.logger.info("Planification configurée: quotidienne à 02:00")
-
-        elif self.frequency == FrequencyType.WEEKLY:
-            # Chaque dimanche à 02:00
-            schedule.every().sunday.at("02:00").do(self._scheduled_inventory)
-            self.logger.info("Planification configurée: hebdomadaire le dimanche à 02:00")
-
-        elif self.frequency == FrequencyType.MONTHLY:
-            # Le premier de chaque mois à 02:00
-            # Note: schedule ne supporte pas directement "monthly",
-            # on utilise une vérification personnalisée
-            schedule.every().day.at("02:00").do(self._check_monthly_schedule)
-            self.logger.info("Planification configurée: mensuelle le 1er du mois à 02:00")
+        create_job, description = SCHEDULES[self.frequency]
+        if self.frequency is FrequencyType.MONTHLY:
+            callback = self._check_monthly_schedule
+        else:
+            callback = self._scheduled_inventory
+
+        self._job = create_job(self._schedule).do(callback)
+        self.logger.info(f"Planification configurée: {description}")
 
         # Calculer la prochaine exécution
         self._update_next_run()
@@ -141,11 +193,9 @@ class InventoryScheduler:
         """
         Met à jour le timestamp de la prochaine exécution
         """
-        jobs = schedule.get_jobs()
-        if jobs:
-            # Prendre la prochaine exécution de la première tâche
-            next_job = min(jobs, key=lambda job: job.next_run)
-            self.next_run = next_job.next_run
+        # Une seule tâche est planifiée: lecture directe de sa référence
+        if self._job is not None:
+            self.next_run = self._job.next_run
             self.logger.debug(f"Prochaine collecte planifiée: {self.next_run}")
 
     def start(self):
@@ -201,19 +251,20 @@ class InventoryScheduler:
         """
         Boucle principale du scheduler
 
-        Cette méthode tourne en arrière-plan et vérifie périodiquement
-        s'il faut exécuter des tâches planifiées.
+        Cette méthode tourne en arrière-plan et dort jusqu'à la prochaine
+        exécution planifiée (dans les bornes LOOP_MIN_WAIT/LOOP_MAX_WAIT);
+        stop() la réveille immédiatement.
         """
         self.logger.debug("Boucle du scheduler démarrée")
 
         while not self.stop_event.is_set():
             try:
                 # Vérifier et exécuter les tâches planifiées
-                schedule.run_pending()
+                self._schedule.run_pending()
 
-                # Attendre 60 secondes avant la prochaine vérification
+                # Attendre la prochaine exécution
                 # (ou jusqu'à ce qu'on demande l'arrêt)
-                self.stop_event.wait(timeout=60)
+                self.stop_event.wait(timeout=self._seconds_until_next_run())
 
             except Exception as e:
                 self.logger.exception("Erreur dans la boucle du scheduler")
@@ -222,6 +273,20 @@ class InventoryScheduler:
 
         self.logger.debug("Boucle du scheduler terminée")
 
+    def _seconds_until_next_run(self) -> float:
+        """
+        Calcule l'attente avant la prochaine exécution planifiée
+
+        Returns:
+            float: Secondes à attendre, bornées à [LOOP_MIN_WAIT, LOOP_MAX_WAIT]
+        """
+        job = self._job
+        if job is None or job.next_run is None:
+            return LOOP_MAX_WAIT
+
+        delay = (job.next_run - datetime.now()).total_seconds()
+        return min(max(delay, LOOP_MIN_WAIT), LOOP_MAX_WAIT)
+
     def force_run(self):
         """
         Force l'exécution immédiate d'une collecte d'inventaire
@@ -250,7 +315,7 @@ class InventoryScheduler:
             'frequency': self.frequency.value if self.frequency else None,
             'next_run': self.next_run.isoformat() if self.next_run else None,
             'next_run_in': str(self.next_run - datetime.now()) if self.next_run else None,
-            'scheduled_jobs_count': len(schedule.get_jobs())
+            'scheduled_jobs_count': 1 if self._job is not None else 0
         }
 
     def update_frequency(self, new_frequency: str):
@@ -264,6 +329,8 @@ class InventoryScheduler:
 
         # Mettre à jour la configuration
         self.config.set('agent', 'reporting_frequency', new_frequency)
+        self._frequency_str = new_frequency
+        self.frequency = self._resolve_frequency(new_frequency)
 
         # Reconfigurer la planification
         self._setup_schedule()
@@ -283,29 +350,32 @@ class InventoryScheduler:
         Returns:
             list: Liste des prochaines dates d'exécution
         """
-        jobs = schedule.get_jobs()
-        if not jobs:
+        if self._job is None or self._job.next_run is None:
             return []
 
-        next_runs = []
-        current_time = datetime.now()
-
-        # Simuler les prochaines exécutions
-        for job in jobs:
-            next_run = job.next_run
-            for i in range(count):
-                if next_run > current_time:
-                    next_runs.append(next_run)
-
-                # Calculer la prochaine occurrence (approximation)
-                if self.frequency == FrequencyType.HOURLY:
-                    next_run += timedelta(hours=1)
-                elif self.frequency == FrequencyType.DAILY:
-                    next_run += timedelta(days=1)
-                elif self.frequency == FrequencyType.WEEKLY:
-                    next_run += timedelta(weeks=1)
-                elif self.frequency == FrequencyType.MONTHLY:
-                    # Approximation pour mensuel
-                    next_run += timedelta(days=30)
-
-        return sorted(next_runs)[:count]
\ No newline at end of file
+        # La prochaine exécution de la tâche est déjà dans le futur
+        base = self._job.next_run
+
+        if self.frequency is FrequencyType.MONTHLY:
+            # La tâche quotidienne ne collecte que le 1er du mois
+            if base.day != 1:
+                base = self._add_months(base, 1)
+            return [self._add_months(base, i) for i in range(count)]
+
+        step = RUN_STEPS[self.frequency]
+        return [base + i * step for i in range(count)]
+
+    @staticmethod
+    def _add_months(run: datetime, months: int) -> datetime:
+        """
+        Décale une date au 1er du mois, `months` mois plus tard
+
+        Args:
+            run: Date de départ (l'heure est conservée)
+            months: Nombre de mois à ajouter
+
+        Returns:
+            datetime: 1er jour du mois cible
+        """
+        year, month = divmod(run.month - 1 + months, 12)
+        return run.replace(year=run.year + year, month=month + 1, day=1)
@@ -15,6 +15,8 @@ from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 import urllib3
 
+from ..collectors.base import json_dumps
+
 # Désactiver les warnings SSL si nécessaire
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -86,12 +88,14 @@ class InventorySender:
                 'data': inventory_data
             }
 
-            self.logger.debug(f"Taille des données: {len(json.dumps(payload))} bytes")
+            # Sérialisation unique, réutilisée pour la taille et l'envoi
+            body = json_dumps(payload)
+            self.logger.debug(f"Taille des données: {len(body)} bytes")
 
             # Effectuer la requête HTTP POST
             response = requests.post(
                 url=self.server_url,
-                json=payload,
+                data=body,
                 headers=headers,
                 timeout=self.timeout,
                 verify=self.verify_ssl
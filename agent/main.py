@@ -22,7 +22,7 @@ from agent.services.service_manager import ServiceManager
 # Ajouter le chemin racine pour les imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agent.core.config import AgentConfig, create_default_config
+from agent.core.config import get_config, create_default_config
 from agent.core.logger import AgentLogger
 from agent.core.collector import InventoryCollector
 from agent.core.sender import InventorySender
@@ -46,7 +46,7 @@ class WatchmanAgentClient:
             config_path: Chemin vers le fichier de configuration
         """
         # Configuration
-        self.config = AgentConfig(config_path)
+        self.config = get_config(config_path)
 
         # Logger
         self.logger = AgentLogger(self.config)
@@ -325,8 +325,10 @@ class WatchmanAgentClient:
             self.stop_scheduler()
 
         if self.web_app:
-            self.app_logger.info("Arrêt de l'interface web")
-            # Flask n'a pas de méthode stop() native
+            self.web_app.stop()
+
+        # Processus et threads des collecteurs (PowerShell, WMI)
+        self.collector.close()
 
         self.app_logger.info("✅ Watchman Agent Client arrêté proprement")
 
@@ -552,6 +554,8 @@ def main():
     except Exception as e:
         print(f"❌ Erreur: {e}")
         return 1
+    finally:
+        agent.collector.close()
 
 
 if __name__ == '__main__':
@@ -16,7 +16,7 @@ import logging
 # Ajouter le chemin parent pour les imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from agent.core.config import AgentConfig
+from agent.core.config import get_config, URL_PREFIXES
 from agent.core.logger import AgentLogger
 from agent.core.collector import InventoryCollector
 from agent.core.sender import InventorySender
@@ -39,7 +39,7 @@ class InventoryWebApp:
             config_path: Chemin vers le fichier de configuration
         """
         # Configuration
-        self.config = AgentConfig(config_path)
+        self.config = get_config(config_path)
 
         # Logger
         self.logger = AgentLogger(self.config)
@@ -303,12 +303,14 @@ class InventoryWebApp:
                     timeout = data.get('timeout', 30)
 
                     if url:
-                        # Créer temporairement un sender avec ces paramètres
-                        temp_config = self.config
-                        temp_config.config.set('server', 'url', url)
+                        # Créer temporairement un sender avec ces paramètres,
+                        # sur une copie: la configuration partagée avec
+                        # l'agent n'est pas modifiée par un simple test
+                        temp_config = self.config.copy()
+                        temp_config.set('server', 'url', url)
                         if auth_token:
-                            temp_config.config.set('server', 'auth_token', auth_token)
-                        temp_config.config.set('server', 'timeout', str(timeout))
+                            temp_config.set('server', 'auth_token', auth_token)
+                        temp_config.set('server', 'timeout', str(timeout))
 
                         temp_sender = InventorySender(temp_config, self.logger)
                         success, message = temp_sender.test_connection()
@@ -372,7 +374,7 @@ class InventoryWebApp:
                         'message': 'URL du serveur requise'
                     }), 400
 
-                if not url.startswith(('http://', 'https://')):
+                if not url.startswith(URL_PREFIXES):
                     return jsonify({
                         'success': False,
                         'message': 'URL invalide - doit commencer par http:// ou https://'
@@ -389,9 +391,9 @@ class InventoryWebApp:
                     }), 400
 
                 # Mettre à jour la configuration
-                self.config.config.set('server', 'url', url)
-                self.config.config.set('server', 'auth_token', auth_token)
-                self.config.config.set('server', 'timeout', str(timeout))
+                self.config.set('server', 'url', url)
+                self.config.set('server', 'auth_token', auth_token)
+                self.config.set('server', 'timeout', str(timeout))
 
                 # Sauvegarder la configuration
                 self.config.save()
@@ -555,6 +557,9 @@ class InventoryWebApp:
         # Flask n'a pas de méthode stop() native
         # L'arrêt se fait généralement par interruption du processus
 
+        # Processus et threads des collecteurs (PowerShell, WMI)
+        self.collector.close()
+
 
 def create_app(config_path=None):
     """